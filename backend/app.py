@@ -3,6 +3,10 @@ from flask_cors import CORS
 from flask_jwt_extended import JWTManager
 from flask_pymongo import PyMongo
 from config import Config
+from middleware.metrics_middleware import init_metrics, query_listener
+from middleware.query_inspector import init_query_inspector, query_inspector
+from middleware.profiler_middleware import init_profiler
+from utils.json_provider import FastJSONProvider
 
 # Initialize extensions
 mongo = PyMongo()
@@ -12,15 +16,25 @@ def create_app():
     """Application factory pattern."""
     app = Flask(__name__)
     app.config.from_object(Config)
+    app.json = FastJSONProvider(app)
     
     # Initialize extensions
-    mongo.init_app(app)
+    mongo.init_app(app, event_listeners=[query_listener, query_inspector], **Config.mongo_client_options())
     jwt.init_app(app)
     CORS(app, origins=[Config.FRONTEND_URL], supports_credentials=True)
     
     # Initialize configuration
     Config.init_app(app)
     
+    # Per-request timing, Server-Timing headers and /api/metrics
+    init_metrics(app)
+    
+    # N+1 and slow-query detection (development and tests)
+    init_query_inspector(app)
+    
+    # Opt-in sampling profiler
+    init_profiler(app)
+    
     # Register blueprints
     from routes.auth_routes import auth_bp
     from routes.dashboard_routes import dashboard_bp
@@ -0,0 +1,83 @@
+"""
+ASGI Entry Point
+Serves the I/O-heavy read endpoints from an async Quart app backed by Motor
+and everything else from the regular Flask app, behind one ASGI server:
+
+    uvicorn --factory asgi:create_asgi_app --port 5000
+
+Requires the optional async dependencies (pip install -r requirements-asgi.txt).
+"""
+
+from asgiref.wsgi import WsgiToAsgi
+from quart import Quart, request
+from app import create_app
+from config import Config
+from utils.aio import motor_db, cpu_executor
+from utils.json_provider import FastJSONProvider
+
+# (method, path) pairs served by the async app; Flask keeps the rest,
+# including CORS preflight requests
+ASYNC_ROUTES = {
+    ('GET', '/api/dashboard/stats'),
+    ('GET', '/api/profile/'),
+    ('GET', '/api/profile/stats'),
+    ('POST', '/api/career/match-job')
+}
+
+
+class RouteDispatcher:
+    """ASGI app sending ASYNC_ROUTES to the async app and all else to the WSGI app."""
+    
+    def __init__(self, async_app, wsgi_app, routes):
+        self.async_app = async_app
+        self.wsgi_app = WsgiToAsgi(wsgi_app)
+        self.routes = frozenset(routes)
+    
+    async def __call__(self, scope, receive, send):
+        # Lifespan events open and close the Motor client and worker pool
+        if scope['type'] == 'lifespan':
+            await self.async_app(scope, receive, send)
+        elif scope['type'] == 'http':
+            if (scope['method'], scope['path']) in self.routes:
+                await self.async_app(scope, receive, send)
+            else:
+                await self.wsgi_app(scope, receive, send)
+        elif scope['type'] == 'websocket':
+            # No websocket routes; closing before accept makes the server reply 403
+            await send({'type': 'websocket.close', 'code': 1008})
+        else:
+            raise ValueError(f"Unsupported ASGI scope type: {scope['type']}")
+
+
+def create_async_app():
+    """Quart app with the async blueprints."""
+    app = Quart(__name__)
+    app.config.from_object(Config)
+    app.json = FastJSONProvider(app)
+    
+    motor_db.init_app(app)
+    cpu_executor.init_app(app)
+    
+    @app.after_request
+    async def add_cors_headers(response):
+        # Mirrors the Flask-CORS settings in create_app()
+        if request.headers.get('Origin') == Config.FRONTEND_URL:
+            response.headers['Access-Control-Allow-Origin'] = Config.FRONTEND_URL
+            response.headers['Access-Control-Allow-Credentials'] = 'true'
+            response.vary.add('Origin')
+        return response
+    
+    from async_routes.dashboard_routes import dashboard_bp
+    from async_routes.profile_routes import profile_bp
+    from async_routes.career_routes import career_bp
+    
+    app.register_blueprint(dashboard_bp, url_prefix='/api/dashboard')
+    app.register_blueprint(profile_bp, url_prefix='/api/profile')
+    app.register_blueprint(career_bp, url_prefix='/api/career')
+    
+    return app
+
+
+def create_asgi_app():
+    """Application factory for ASGI servers."""
+    return RouteDispatcher(create_async_app(), create_app(), ASYNC_ROUTES)
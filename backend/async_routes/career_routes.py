@@ -0,0 +1,39 @@
+from quart import Blueprint, request, jsonify
+from middleware.async_auth import token_required, get_current_user_id
+from routes.career_routes import match_resume, RESUME_TEXT_PROJECTION
+from utils.aio import motor_db, cpu_executor
+from bson import ObjectId
+
+career_bp = Blueprint('career', __name__)
+
+@career_bp.route('/match-job', methods=['POST'])
+@token_required
+async def match_job():
+    """Match resume with job description; scoring (and any PDF extraction) runs in a worker process."""
+    try:
+        data = await request.get_json()
+        
+        resume_id = data.get('resume_id')
+        job_description = data.get('job_description', '')
+        
+        if not resume_id or not job_description:
+            return jsonify({'error': 'Resume ID and job description required'}), 400
+        
+        user_id = get_current_user_id()
+        resume = await motor_db.db.resumes.find_one({
+            '_id': ObjectId(resume_id),
+            'user_id': user_id
+        }, RESUME_TEXT_PROJECTION)
+        
+        if not resume:
+            return jsonify({'error': 'Resume not found'}), 404
+        
+        result = await cpu_executor.run(match_resume, resume, job_description)
+        
+        if result is None:
+            return jsonify({'error': 'Could not extract resume text'}), 400
+        
+        return jsonify(result), 200
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
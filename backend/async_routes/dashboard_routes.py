@@ -0,0 +1,22 @@
+from quart import Blueprint, jsonify
+from middleware.async_auth import token_required, get_current_user_id
+from utils.aio import motor_db, run_reads
+from utils.overview import dashboard_reads, build_dashboard
+from datetime import datetime
+
+dashboard_bp = Blueprint('dashboard', __name__)
+
+@dashboard_bp.route('/stats', methods=['GET'])
+@token_required
+async def get_dashboard_stats():
+    """Get dashboard statistics for current user (all reads run concurrently)."""
+    try:
+        user_id = get_current_user_id()
+        now = datetime.utcnow()
+        
+        results = await run_reads(motor_db.db, dashboard_reads(user_id, now))
+        
+        return jsonify(build_dashboard(results, now)), 200
+    
+    except Exception as e:
+        return jsonify({'error': 'Failed to fetch dashboard stats', 'message': str(e)}), 500
@@ -0,0 +1,36 @@
+from quart import Blueprint, jsonify
+from middleware.async_auth import token_required, get_current_user_id
+from utils.aio import motor_db, run_reads
+from utils.overview import profile_reads, build_profile, profile_stats_reads, build_profile_stats
+
+profile_bp = Blueprint('profile', __name__)
+
+@profile_bp.route('/', methods=['GET'])
+@token_required
+async def get_profile():
+    """Get user profile."""
+    try:
+        user_id = get_current_user_id()
+        
+        profile = build_profile(await run_reads(motor_db.db, profile_reads(user_id)))
+        if not profile:
+            return jsonify({'error': 'User not found'}), 404
+        
+        return jsonify(profile), 200
+    
+    except Exception as e:
+        return jsonify({'error': 'Failed to fetch profile', 'message': str(e)}), 500
+
+@profile_bp.route('/stats', methods=['GET'])
+@token_required
+async def get_profile_stats():
+    """Get profile statistics."""
+    try:
+        user_id = get_current_user_id()
+        
+        results = await run_reads(motor_db.db, profile_stats_reads(user_id))
+        
+        return jsonify(build_profile_stats(results)), 200
+    
+    except Exception as e:
+        return jsonify({'error': 'Failed to fetch profile stats', 'message': str(e)}), 500
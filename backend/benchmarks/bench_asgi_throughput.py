@@ -0,0 +1,172 @@
+"""
+Compare throughput of the WSGI and ASGI deployments on the async endpoints.
+
+Starts the Flask app under gunicorn (threaded workers) and the ASGI entry point
+under uvicorn, seeds one account per client through the API, then hits the
+dashboard and profile read endpoints from concurrent keep-alive clients against
+each server in turn and reports req/s and latency percentiles.
+
+Needs a running MongoDB (MONGODB_URI; a scratch database is recommended as
+accounts and applications are created in it) plus the optional servers:
+    pip install -r requirements-asgi.txt gunicorn
+
+Usage (from backend/):
+    python benchmarks/bench_asgi_throughput.py --clients 32 --duration 20
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import uuid
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import corpus
+
+ENDPOINTS = ['/api/dashboard/stats', '/api/profile/', '/api/profile/stats']
+STATUSES = ['applied', 'in-review', 'interview', 'offer', 'rejected']
+
+
+def server_commands(args):
+    """(name, port, command) of each server under test."""
+    return [
+        ('wsgi', args.port, [
+            'gunicorn', '--workers', str(args.workers), '--threads', str(args.threads),
+            '--bind', f'127.0.0.1:{args.port}', 'app:create_app()'
+        ]),
+        ('asgi', args.port + 1, [
+            'uvicorn', '--factory', 'asgi:create_asgi_app', '--workers', str(args.workers),
+            '--host', '127.0.0.1', '--port', str(args.port + 1), '--log-level', 'warning'
+        ])
+    ]
+
+
+def call(conn, method, path, token=None, body=None):
+    headers = {'Content-Type': 'application/json'}
+    if token:
+        headers['Authorization'] = f'Bearer {token}'
+    conn.request(method, path, body=json.dumps(body) if body is not None else None, headers=headers)
+    response = conn.getresponse()
+    payload = response.read()
+    return response.status, payload
+
+
+def wait_until_ready(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+            status, _ = call(conn, 'GET', '/api/health')
+            conn.close()
+            if status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f'server on port {port} did not start')
+
+
+def seed(port, args):
+    """Register one account per client with some applications; returns tokens."""
+    rng = random.Random(args.seed)
+    run_id = uuid.uuid4().hex[:8]
+    conn = http.client.HTTPConnection('127.0.0.1', port)
+    tokens = []
+    for n in range(args.clients):
+        email = f'bench-{run_id}-{n}@example.com'
+        password = 'bench-password-123'
+        call(conn, 'POST', '/api/auth/register', body={'name': f'Bench {n}', 'email': email, 'password': password})
+        status, payload = call(conn, 'POST', '/api/auth/login', body={'email': email, 'password': password})
+        if status != 200:
+            raise RuntimeError(f'login failed: {payload[:200]}')
+        token = json.loads(payload)['token']
+        for _ in range(args.jobs_per_user):
+            call(conn, 'POST', '/api/jobs/create', token, {
+                'company': rng.choice(corpus.COMPANIES),
+                'position': rng.choice(corpus.TITLES),
+                'status': rng.choice(STATUSES),
+                'description': corpus.make_job(rng)
+            })
+        tokens.append(token)
+    conn.close()
+    return tokens
+
+
+def drive(port, tokens, args):
+    """Concurrent clients, one account and connection each, for args.duration seconds."""
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.duration
+    
+    def client_loop(token):
+        conn = http.client.HTTPConnection('127.0.0.1', port)
+        local, failed, i = [], 0, 0
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            status, _ = call(conn, 'GET', ENDPOINTS[i % len(ENDPOINTS)], token)
+            local.append(time.perf_counter() - start)
+            failed += status >= 400
+            i += 1
+        conn.close()
+        with lock:
+            latencies.extend(local)
+            errors[0] += failed
+    
+    threads = [threading.Thread(target=client_loop, args=(token,)) for token in tokens]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sorted(latencies), errors[0], time.perf_counter() - started
+
+
+def _percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--clients', type=int, default=32, help='Concurrent clients')
+    parser.add_argument('--duration', type=float, default=15, help='Seconds per server')
+    parser.add_argument('--jobs-per-user', type=int, default=30)
+    parser.add_argument('--workers', type=int, default=1, help='Server worker processes')
+    parser.add_argument('--threads', type=int, default=8, help='Threads per gunicorn worker')
+    parser.add_argument('--port', type=int, default=5100, help='WSGI port (ASGI uses port + 1)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    tokens = None
+    results = {}
+    for name, port, command in server_commands(args):
+        server = subprocess.Popen(command, cwd=BACKEND_DIR)
+        try:
+            wait_until_ready(port)
+            if tokens is None:
+                tokens = seed(port, args)
+            latencies, errors, elapsed = drive(port, tokens, args)
+        finally:
+            server.terminate()
+            server.wait()
+        results[name] = len(latencies) / elapsed
+        print(f"{name}: {len(latencies)} requests, {errors} errors, {results[name]:8.1f} req/s   "
+              f"mean {statistics.mean(latencies) * 1000:7.2f} ms   "
+              f"p50 {_percentile(latencies, 0.50) * 1000:7.2f} ms   "
+              f"p95 {_percentile(latencies, 0.95) * 1000:7.2f} ms   "
+              f"p99 {_percentile(latencies, 0.99) * 1000:7.2f} ms")
+    
+    print(f"asgi/wsgi throughput: {results['asgi'] / results['wsgi']:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
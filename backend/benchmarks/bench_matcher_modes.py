@@ -0,0 +1,62 @@
+"""
+Compare JobMatcher 'tfidf' and 'hashing' modes on a synthetic corpus.
+
+Reports per-pair latency for each mode and how closely hashing scores
+track the TF-IDF ranking (Spearman correlation and top-k overlap).
+
+Usage (from backend/):
+    python benchmarks/bench_matcher_modes.py --size small
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import corpus
+from scipy.stats import spearmanr
+from utils.job_matcher import JobMatcher
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--size', default='small', choices=list(corpus.SIZES))
+    parser.add_argument('--top-k', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    data = corpus.generate(args.size, args.seed)
+    resumes, jobs = data['resumes'], data['jobs']
+
+    scores = {}
+    timings = {}
+    for mode in JobMatcher.MODES:
+        start = time.perf_counter()
+        scores[mode] = [
+            [JobMatcher.calculate_match_score(resume, job, mode=mode)['score'] for job in jobs]
+            for resume in resumes
+        ]
+        timings[mode] = (time.perf_counter() - start) / (len(resumes) * len(jobs))
+
+    correlations, overlaps = [], []
+    for tfidf_row, hashing_row in zip(scores['tfidf'], scores['hashing']):
+        correlations.append(spearmanr(tfidf_row, hashing_row).correlation)
+        top_tfidf = set(sorted(range(len(jobs)), key=lambda i: -tfidf_row[i])[:args.top_k])
+        top_hashing = set(sorted(range(len(jobs)), key=lambda i: -hashing_row[i])[:args.top_k])
+        overlaps.append(len(top_tfidf & top_hashing) / args.top_k)
+
+    print(json.dumps({
+        'pairs': len(resumes) * len(jobs),
+        'ms_per_pair': {mode: round(t * 1000, 3) for mode, t in timings.items()},
+        'speedup': round(timings['tfidf'] / timings['hashing'], 2),
+        'spearman_mean': round(sum(correlations) / len(correlations), 3),
+        f'top{args.top_k}_overlap_mean': round(sum(overlaps) / len(overlaps), 3)
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
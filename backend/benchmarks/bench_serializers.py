@@ -0,0 +1,163 @@
+"""
+Compare the shared document serializers with per-route dict construction.
+
+Builds raw job and skill documents (as returned by PyMongo), serializes them
+with the hand-written loop the routes used before, with a plain loop over the
+serializer's field list and with the compiled serializers, checks all produce
+the same output and reports time per document. The field loop shows what the
+compiled dict literal saves over interpreting the same field list per document.
+The "+decode" figures include BSON decoding of what each version fetches: the
+routes previously read whole documents, the serializers only their projection.
+
+Usage (from backend/):
+    python benchmarks/bench_serializers.py --count 5000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import bson
+import corpus
+from bson import ObjectId
+from utils.serializers import job_serializer, skill_serializer, REQUIRED
+
+
+def make_documents(count, seed):
+    """Raw job and skill documents with optional fields sometimes missing."""
+    rng = random.Random(seed)
+    user_id = ObjectId()
+    jobs, skills = [], []
+    for i in range(count):
+        job = {
+            '_id': ObjectId(),
+            'user_id': user_id,
+            'company': rng.choice(corpus.COMPANIES),
+            'position': rng.choice(corpus.TITLES),
+            'status': rng.choice(['applied', 'in-review', 'interview', 'offer', 'rejected']),
+            'applied_date': datetime(2024, 1, 1) + timedelta(hours=i),
+            'description': corpus.make_job(rng),
+            'notes': '',
+            'created_at': datetime(2024, 1, 1),
+            'updated_at': datetime(2024, 1, 1)
+        }
+        if rng.random() < 0.5:
+            job.update(salary='100k', location='Remote', job_type='Contract')
+        jobs.append(job)
+        skills.append({
+            '_id': ObjectId(),
+            'user_id': user_id,
+            'name': rng.choice(corpus.SKILLS),
+            'level': rng.randint(0, 100),
+            'category': 'Technical',
+            'demand': 'High',
+            'trend': '+5%',
+            'created_at': datetime(2024, 1, 1),
+            'updated_at': datetime(2024, 1, 1)
+        })
+    return jobs, skills
+
+
+def legacy_jobs(jobs):
+    job_list = []
+    for job in jobs:
+        job_list.append({
+            'id': job['_id'],
+            'company': job['company'],
+            'position': job['position'],
+            'status': job['status'],
+            'applied_date': job.get('applied_date'),
+            'salary': job.get('salary', ''),
+            'location': job.get('location', ''),
+            'job_type': job.get('job_type', 'Full-time'),
+            'description': job.get('description', ''),
+            'notes': job.get('notes', '')
+        })
+    return job_list
+
+
+def legacy_skills(skills):
+    skill_list = []
+    for skill in skills:
+        skill_list.append({
+            'id': skill['_id'],
+            'name': skill['name'],
+            'level': skill['level'],
+            'category': skill.get('category', 'Technical'),
+            'demand': skill.get('demand', 'Medium'),
+            'trend': skill.get('trend', '+0%')
+        })
+    return skill_list
+
+
+def field_loop(serializer):
+    """Uncompiled equivalent of serializer.many: one dict comprehension over its fields."""
+    fields = serializer.fields
+    
+    def many(documents):
+        return [
+            {name: document[source] if default is REQUIRED else document.get(source, default)
+             for name, source, default in fields}
+            for document in documents
+        ]
+    return many
+
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), statistics.median(timings)
+
+
+def report(name, args, legacy, loop, compiled):
+    legacy_min, legacy_median = best_of(legacy, args.repeat)
+    loop_median = best_of(loop, args.repeat)[1]
+    compiled_min, compiled_median = best_of(compiled, args.repeat)
+    print(f"{name:14s} per-route loop {legacy_median / args.count * 1e6:8.3f} us/doc   "
+          f"field loop {loop_median / args.count * 1e6:8.3f} us/doc   "
+          f"serializer {compiled_median / args.count * 1e6:8.3f} us/doc   "
+          f"speedup {legacy_median / compiled_median:5.2f}x (best {legacy_min / compiled_min:5.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    jobs, skills = make_documents(args.count, args.seed)
+    cases = [
+        ('jobs', jobs, legacy_jobs, job_serializer),
+        ('skills', skills, legacy_skills, skill_serializer)
+    ]
+    
+    for name, documents, legacy, serializer in cases:
+        loop = field_loop(serializer)
+        assert legacy(documents) == loop(documents) == serializer.many(documents), f'{name}: outputs differ'
+        full = [bson.encode(document) for document in documents]
+        projected = [bson.encode({key: document[key] for key in serializer.projection if key in document})
+                     for document in documents]
+        
+        report(name, args,
+               lambda: legacy(documents),
+               lambda: loop(documents),
+               lambda: serializer.many(documents))
+        report(f'{name}+decode', args,
+               lambda: legacy(bson.decode(raw) for raw in full),
+               lambda: loop(bson.decode(raw) for raw in projected),
+               lambda: serializer.many(bson.decode(raw) for raw in projected))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Deterministic synthetic corpora for benchmarks.
+
+Resumes and job descriptions are assembled from the same skill, verb and
+filler vocabularies the analyzers use, so matching and analysis exercise
+realistic code paths. The same seed always yields the same corpus.
+"""
+
+import random
+
+SKILLS = [
+    'python', 'java', 'javascript', 'typescript', 'react', 'angular', 'vue', 'node.js',
+    'express', 'flask', 'django', 'sql', 'mongodb', 'postgresql', 'mysql', 'redis',
+    'aws', 'azure', 'docker', 'kubernetes', 'git', 'ci/cd', 'html', 'css', 'tailwind',
+    'rest api', 'graphql', 'microservices', 'pandas', 'numpy', 'machine learning',
+    'statistics', 'linux', 'terraform', 'jenkins', 'testing', 'agile', 'scrum'
+]
+VERBS = [
+    'achieved', 'improved', 'developed', 'designed', 'implemented', 'created', 'managed',
+    'led', 'increased', 'reduced', 'optimized', 'built', 'launched', 'delivered'
+]
+FILLER = [
+    'team', 'project', 'customer', 'platform', 'service', 'product', 'pipeline', 'feature',
+    'release', 'workflow', 'integration', 'dashboard', 'reporting', 'migration', 'system'
+]
+COMPANIES = ['Acme', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Stark', 'Wayne', 'Wonka']
+TITLES = ['Backend Developer', 'Frontend Developer', 'Data Scientist', 'DevOps Engineer',
+          'Fullstack Developer', 'Mobile Developer']
+
+# (resumes, jobs) per corpus size
+SIZES = {
+    'small': (10, 50),
+    'medium': (50, 500),
+    'large': (200, 5000)
+}
+
+
+def _sentence(rng, skills):
+    return (f"{rng.choice(VERBS).capitalize()} {rng.choice(FILLER)} {rng.choice(FILLER)} "
+            f"using {rng.choice(skills)} and {rng.choice(skills)}, "
+            f"improving {rng.choice(FILLER)} by {rng.randint(5, 60)}%.")
+
+
+def make_resume(rng):
+    """One resume with experience, education, skills and projects sections."""
+    skills = rng.sample(SKILLS, rng.randint(4, 14))
+    lines = [f"{rng.choice(TITLES)}", '', 'Experience']
+    for _ in range(rng.randint(2, 4)):
+        lines.append(f"{rng.choice(TITLES)} at {rng.choice(COMPANIES)}")
+        lines.extend(_sentence(rng, skills) for _ in range(rng.randint(3, 6)))
+    lines += ['', 'Education', 'BSc Computer Science', '', 'Skills', ', '.join(skills)]
+    if rng.random() < 0.6:
+        lines += ['', 'Projects', f"github project: {_sentence(rng, skills)}"]
+    if rng.random() < 0.3:
+        lines += ['', 'Certifications', f"Certified {rng.choice(skills)} practitioner"]
+    return '\n'.join(lines)
+
+
+def make_job(rng):
+    """One job description with responsibilities and requirements."""
+    skills = rng.sample(SKILLS, rng.randint(3, 8))
+    lines = [f"{rng.choice(TITLES)} at {rng.choice(COMPANIES)}", 'Responsibilities']
+    lines.extend(_sentence(rng, skills) for _ in range(rng.randint(2, 5)))
+    lines += ['Requirements', ', '.join(skills)]
+    return '\n'.join(lines)
+
+
+def make_skill_lists(rng, n):
+    """User skill lists for skill-gap analysis."""
+    return [rng.sample(SKILLS, rng.randint(2, 15)) for _ in range(n)]
+
+
+def generate(size='small', seed=42):
+    """Return {'resumes': [...], 'jobs': [...], 'skills': [[...]]} for a corpus size."""
+    n_resumes, n_jobs = SIZES[size]
+    rng = random.Random(f"{seed}:{size}")
+    return {
+        'resumes': [make_resume(rng) for _ in range(n_resumes)],
+        'jobs': [make_job(rng) for _ in range(n_jobs)],
+        'skills': make_skill_lists(rng, n_resumes)
+    }
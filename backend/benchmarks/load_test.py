@@ -0,0 +1,311 @@
+"""
+End-to-end HTTP load test against an in-memory MongoDB stand-in.
+
+Boots create_app() with mongomock in place of MongoDB, seeds users, job
+applications, skills, profiles and resumes at the requested scale, then
+drives weighted mixed traffic across every blueprint from concurrent
+clients and reports p50/p95/p99 latency and throughput per endpoint.
+
+Requires mongomock (pip install mongomock).
+
+Usage (from backend/):
+    python benchmarks/load_test.py --users 50 --jobs-per-user 200 --clients 8 --duration 30
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Keep uploads and the vector store out of the working tree; must be set
+# before config is imported
+_workdir = tempfile.mkdtemp(prefix='smart-career-load-')
+os.environ['UPLOAD_FOLDER'] = os.path.join(_workdir, 'uploads')
+os.environ['JOB_VECTOR_STORE_PATH'] = os.path.join(_workdir, 'job_vectors')
+os.environ.setdefault('JWT_SECRET_KEY', 'load-test-secret-key-not-for-production-use')
+
+try:
+    import mongomock
+except ImportError:
+    sys.exit('mongomock is required for the load test: pip install mongomock')
+
+import bcrypt
+from datetime import datetime, timedelta
+from flask_jwt_extended import create_access_token
+
+import corpus
+from pdf_fixture import make_pdf
+from app import create_app, mongo
+from config import Config
+from models.job_application import JobApplication
+from models.resume import Resume
+from models.skill import Skill
+from models.user import User
+from utils.job_matcher import JobMatcher
+from utils.job_vector_store import index_jobs
+from utils.activity_feed import job_event, resume_event, skill_event
+from utils.resume_analyzer import ResumeAnalyzer
+
+PASSWORD = 'load-test-password'
+STATUSES = ['applied', 'in-review', 'interview', 'offer', 'rejected']
+ROLES = ['frontend developer', 'backend developer', 'data scientist', 'devops engineer']
+
+
+def boot_app():
+    """Create the app with mongomock standing in for MongoDB."""
+    app = create_app()
+    app.config['TESTING'] = True
+    mongo.cx = mongomock.MongoClient()
+    mongo.db = mongo.cx['smart_career']
+    return app
+
+
+def seed(app, args):
+    """Insert users and their data; returns per-user request contexts."""
+    rng = random.Random(args.seed)
+    password_hash = bcrypt.hashpw(PASSWORD.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    now = datetime.utcnow()
+    contexts = []
+    
+    with app.app_context():
+        for u in range(args.users):
+            user = User(name=f'Load User {u}', email=f'load{u}@example.com', hashed_password=password_hash)
+            user_id = mongo.db.users.insert_one(user.to_dict()).inserted_id
+            mongo.db.profiles.insert_one({
+                'user_id': user_id,
+                'title': rng.choice(corpus.TITLES),
+                'location': 'Remote',
+                'updated_at': now
+            })
+            
+            jobs = []
+            for _ in range(args.jobs_per_user):
+                description = corpus.make_job(rng)
+                job = JobApplication(
+                    user_id=user_id,
+                    company=rng.choice(corpus.COMPANIES),
+                    position=rng.choice(corpus.TITLES),
+                    status=rng.choice(STATUSES),
+                    applied_date=now - timedelta(days=rng.randint(0, 180)),
+                    description=description,
+                    description_vector=JobMatcher.vectorize_job(description)['description_vector']
+                )
+                jobs.append(job.to_dict())
+            job_ids = mongo.db.job_applications.insert_many(jobs).inserted_ids if jobs else []
+            
+            skill_names = rng.sample(corpus.SKILLS, min(args.skills_per_user, len(corpus.SKILLS)))
+            skills = [Skill(user_id=user_id, name=name, level=rng.randint(20, 95)).to_dict() for name in skill_names]
+            skill_ids = mongo.db.skills.insert_many(skills).inserted_ids if skills else []
+            
+            resume_ids, resumes = [], []
+            for r in range(args.resumes_per_user):
+                text = corpus.make_resume(rng)
+                file_path = os.path.join(Config.UPLOAD_FOLDER, f'{user_id}_{r}_resume.pdf')
+                with open(file_path, 'wb') as f:
+                    f.write(make_pdf(text))
+                analysis = ResumeAnalyzer.analyze_text(text)
+                resume = Resume(
+                    user_id=user_id,
+                    filename=f'resume_{r}.pdf',
+                    file_path=file_path,
+                    file_size=os.path.getsize(file_path),
+                    analysis=analysis,
+                    score=analysis.get('score', 0),
+                    ats_score=analysis.get('atsScore', 0),
+                    extracted_text=text,
+                    analyzer_version=ResumeAnalyzer.version()
+                )
+                resume_ids.append(mongo.db.resumes.insert_one(resume.to_dict()).inserted_id)
+                resumes.append(resume.to_dict())
+            
+            # Feed entries the write routes would have recorded
+            events = [job_event(job) for job in jobs] + [skill_event(skill) for skill in skills]
+            events += [resume_event(resume) for resume in resumes]
+            if events:
+                mongo.db.activity.insert_many(events)
+            
+            contexts.append({
+                'email': user.email,
+                'headers': {'Authorization': f'Bearer {create_access_token(identity=str(user_id))}'},
+                'job_ids': [str(i) for i in job_ids],
+                'skill_ids': [str(i) for i in skill_ids],
+                'resume_ids': [str(i) for i in resume_ids],
+                'job_texts': [job['description'] for job in jobs[:20]]
+            })
+        
+        index_jobs(mongo.db.job_applications.find({}))
+    return contexts
+
+
+def _pick(rng, items):
+    return rng.choice(items) if items else '000000000000000000000000'
+
+
+# (name, weight, request) where request(client, ctx, rng) returns a response
+TRAFFIC = [
+    ('GET /api/health', 2, lambda c, ctx, rng: c.get('/api/health')),
+    ('POST /api/auth/login', 1, lambda c, ctx, rng: c.post(
+        '/api/auth/login', json={'email': ctx['email'], 'password': PASSWORD})),
+    ('GET /api/auth/verify', 4, lambda c, ctx, rng: c.get('/api/auth/verify', headers=ctx['headers'])),
+    ('GET /api/dashboard/stats', 10, lambda c, ctx, rng: c.get('/api/dashboard/stats', headers=ctx['headers'])),
+    ('GET /api/jobs/list', 12, lambda c, ctx, rng: c.get('/api/jobs/list', headers=ctx['headers'])),
+    ('GET /api/jobs/list?status', 4, lambda c, ctx, rng: c.get(
+        f'/api/jobs/list?status={rng.choice(STATUSES)}', headers=ctx['headers'])),
+    ('GET /api/jobs/<id>', 8, lambda c, ctx, rng: c.get(
+        f"/api/jobs/{_pick(rng, ctx['job_ids'])}", headers=ctx['headers'])),
+    ('POST /api/jobs/create', 3, lambda c, ctx, rng: c.post('/api/jobs/create', headers=ctx['headers'], json={
+        'company': rng.choice(corpus.COMPANIES),
+        'position': rng.choice(corpus.TITLES),
+        'description': corpus.make_job(rng)
+    })),
+    ('PUT /api/jobs/<id>', 3, lambda c, ctx, rng: c.put(
+        f"/api/jobs/{_pick(rng, ctx['job_ids'])}", headers=ctx['headers'], json={'status': rng.choice(STATUSES)})),
+    ('GET /api/skills/list', 8, lambda c, ctx, rng: c.get('/api/skills/list', headers=ctx['headers'])),
+    ('GET /api/skills/stats', 5, lambda c, ctx, rng: c.get('/api/skills/stats', headers=ctx['headers'])),
+    ('GET /api/skills/<id>', 3, lambda c, ctx, rng: c.get(
+        f"/api/skills/{_pick(rng, ctx['skill_ids'])}", headers=ctx['headers'])),
+    ('PUT /api/skills/<id>', 2, lambda c, ctx, rng: c.put(
+        f"/api/skills/{_pick(rng, ctx['skill_ids'])}", headers=ctx['headers'], json={'level': rng.randint(10, 100)})),
+    ('GET /api/profile/', 6, lambda c, ctx, rng: c.get('/api/profile/', headers=ctx['headers'])),
+    ('PUT /api/profile/', 1, lambda c, ctx, rng: c.put(
+        '/api/profile/', headers=ctx['headers'], json={'bio': f'Bio {rng.random()}'})),
+    ('GET /api/profile/activity', 6, lambda c, ctx, rng: c.get('/api/profile/activity', headers=ctx['headers'])),
+    ('GET /api/profile/stats', 6, lambda c, ctx, rng: c.get('/api/profile/stats', headers=ctx['headers'])),
+    ('GET /api/resume/list', 4, lambda c, ctx, rng: c.get('/api/resume/list', headers=ctx['headers'])),
+    ('GET /api/resume/<id>', 3, lambda c, ctx, rng: c.get(
+        f"/api/resume/{_pick(rng, ctx['resume_ids'])}", headers=ctx['headers'])),
+    ('GET /api/career/available-roles', 2, lambda c, ctx, rng: c.get(
+        '/api/career/available-roles', headers=ctx['headers'])),
+    ('GET /api/career/roadmap', 4, lambda c, ctx, rng: c.get('/api/career/roadmap', headers=ctx['headers'])),
+    ('POST /api/career/skill-gap', 4, lambda c, ctx, rng: c.post(
+        '/api/career/skill-gap', headers=ctx['headers'], json={'target_role': rng.choice(ROLES)})),
+    ('POST /api/career/match-job', 2, lambda c, ctx, rng: c.post('/api/career/match-job', headers=ctx['headers'], json={
+        'resume_id': _pick(rng, ctx['resume_ids']),
+        'job_description': rng.choice(ctx['job_texts']) if ctx['job_texts'] else corpus.make_job(rng)
+    })),
+    ('POST /api/career/recommend-jobs', 2, lambda c, ctx, rng: c.post(
+        '/api/career/recommend-jobs', headers=ctx['headers'], json={'resume_id': _pick(rng, ctx['resume_ids'])})),
+]
+
+
+def drive(app, contexts, args):
+    """Run concurrent clients until the deadline or request budget is reached."""
+    names = [name for name, _, _ in TRAFFIC]
+    weights = [weight for _, weight, _ in TRAFFIC]
+    requests = {name: request for name, _, request in TRAFFIC}
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    lock = threading.Lock()
+    remaining = [args.requests]
+    deadline = time.perf_counter() + args.duration
+    
+    def client_loop(client_number):
+        rng = random.Random(f'{args.seed}:client:{client_number}')
+        client = app.test_client()
+        local_latencies = defaultdict(list)
+        local_errors = defaultdict(int)
+        while time.perf_counter() < deadline:
+            if args.requests:
+                with lock:
+                    if remaining[0] <= 0:
+                        break
+                    remaining[0] -= 1
+            ctx = rng.choice(contexts)
+            name = rng.choices(names, weights)[0]
+            start = time.perf_counter()
+            response = requests[name](client, ctx, rng)
+            local_latencies[name].append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                local_errors[name] += 1
+        with lock:
+            for name, values in local_latencies.items():
+                latencies[name].extend(values)
+            for name, count in local_errors.items():
+                errors[name] += count
+    
+    threads = [threading.Thread(target=client_loop, args=(n,)) for n in range(args.clients)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors, time.perf_counter() - started
+
+
+def _percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def report(latencies, errors, elapsed):
+    """Per-endpoint latency percentiles and throughput."""
+    endpoints = {}
+    for name, values in sorted(latencies.items()):
+        values = sorted(values)
+        endpoints[name] = {
+            'requests': len(values),
+            'errors': errors.get(name, 0),
+            'throughput_rps': round(len(values) / elapsed, 2),
+            'mean_ms': round(statistics.mean(values) * 1000, 2),
+            'p50_ms': round(_percentile(values, 0.50) * 1000, 2),
+            'p95_ms': round(_percentile(values, 0.95) * 1000, 2),
+            'p99_ms': round(_percentile(values, 0.99) * 1000, 2)
+        }
+    total = sum(len(values) for values in latencies.values())
+    return {
+        'elapsed_s': round(elapsed, 2),
+        'total_requests': total,
+        'total_errors': sum(errors.values()),
+        'throughput_rps': round(total / elapsed, 2) if elapsed else 0,
+        'endpoints': endpoints
+    }
+
+
+def print_table(summary):
+    print(f"{'endpoint':38s} {'reqs':>7s} {'errs':>5s} {'rps':>8s} {'p50ms':>8s} {'p95ms':>8s} {'p99ms':>8s}")
+    for name, stats in summary['endpoints'].items():
+        print(f"{name:38s} {stats['requests']:>7d} {stats['errors']:>5d} {stats['throughput_rps']:>8.1f} "
+              f"{stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f} {stats['p99_ms']:>8.2f}")
+    print(f"\n{summary['total_requests']} requests, {summary['total_errors']} errors in "
+          f"{summary['elapsed_s']}s ({summary['throughput_rps']} req/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the API against an in-memory MongoDB.')
+    parser.add_argument('--users', type=int, default=20)
+    parser.add_argument('--jobs-per-user', type=int, default=50)
+    parser.add_argument('--skills-per-user', type=int, default=8)
+    parser.add_argument('--resumes-per-user', type=int, default=2)
+    parser.add_argument('--clients', type=int, default=4, help='Concurrent clients')
+    parser.add_argument('--duration', type=float, default=10, help='Seconds to run')
+    parser.add_argument('--requests', type=int, default=0, help='Stop after this many requests (0: no limit)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', help='Write the summary as JSON to this path')
+    args = parser.parse_args()
+    
+    app = boot_app()
+    started = time.perf_counter()
+    contexts = seed(app, args)
+    print(f"Seeded {args.users} users in {time.perf_counter() - started:.1f}s (data in {_workdir})", file=sys.stderr)
+    
+    latencies, errors, elapsed = drive(app, contexts, args)
+    summary = report(latencies, errors, elapsed)
+    print_table(summary)
+    
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""
+Minimal single-page PDF writer for benchmark fixtures.
+
+Produces text-only PDFs (Helvetica, one line per text line) that PyPDF2
+can extract, so resume endpoints can be exercised without real uploads.
+"""
+
+
+def _escape(line):
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def make_pdf(text):
+    """Return PDF bytes containing text."""
+    operations = ' '.join(f'({_escape(line)}) Tj T*' for line in text.split('\n'))
+    content = f'BT /F1 10 Tf 50 800 Td 12 TL {operations} ET'
+    objects = [
+        '<< /Type /Catalog /Pages 2 0 R >>',
+        '<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        '<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] /Contents 4 0 R '
+        '/Resources << /Font << /F1 5 0 R >> >> >>',
+        f'<< /Length {len(content)} >>\nstream\n{content}\nendstream',
+        '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>'
+    ]
+    
+    output = b'%PDF-1.4\n'
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(output))
+        output += f'{number} 0 obj\n{body}\nendobj\n'.encode('latin-1', 'replace')
+    
+    xref = len(output)
+    output += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode()
+    for offset in offsets:
+        output += f'{offset:010d} 00000 n \n'.encode()
+    output += f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode()
+    return output
@@ -0,0 +1,148 @@
+"""
+Benchmark suite for the NLP utilities.
+
+Times JobMatcher.calculate_match_score (both modes), JobMatcher.recommend_jobs,
+ResumeAnalyzer.analyze_text and SkillGapAnalyzer.analyze_gap on deterministic
+synthetic corpora, writes the results as JSON and optionally compares them
+against a stored baseline, exiting non-zero on regressions.
+
+Usage (from backend/):
+    python benchmarks/run_benchmarks.py --sizes small medium --output bench.json
+    python benchmarks/run_benchmarks.py --save-baseline benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json --tolerance 0.25
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import corpus
+from utils.job_matcher import JobMatcher
+from utils.resume_analyzer import ResumeAnalyzer
+from utils.skill_gap_analyzer import SkillGapAnalyzer
+
+# Operations per timed run are capped so large corpora stay tractable
+MAX_PAIRS = 200
+MAX_RECOMMEND_RESUMES = 5
+
+
+def _cases(data):
+    """Yield (name, fn, operations) for one corpus."""
+    resumes, jobs = data['resumes'], data['jobs']
+    pairs = [(resumes[i % len(resumes)], jobs[i % len(jobs)]) for i in range(min(MAX_PAIRS, len(resumes) * len(jobs)))]
+    listings = [{'id': str(i), 'title': 'job', 'description': job} for i, job in enumerate(jobs)]
+    stored = [dict(listing, vector=JobMatcher.vectorize_job(listing['description'])['description_vector'])
+              for listing in listings]
+    recommend_resumes = resumes[:MAX_RECOMMEND_RESUMES]
+    roles = list(SkillGapAnalyzer.ROLE_REQUIREMENTS)
+    
+    for mode in JobMatcher.MODES:
+        yield (f'calculate_match_score[{mode}]',
+               lambda mode=mode: [JobMatcher.calculate_match_score(r, j, mode=mode) for r, j in pairs],
+               len(pairs))
+        yield (f'recommend_jobs[{mode}]',
+               lambda mode=mode: [JobMatcher.recommend_jobs(r, listings, mode=mode) for r in recommend_resumes],
+               len(recommend_resumes))
+    yield ('recommend_jobs[hashing,stored_vectors]',
+           lambda: [JobMatcher.recommend_jobs(r, stored, mode='hashing') for r in recommend_resumes],
+           len(recommend_resumes))
+    yield ('analyze_resume', lambda: [ResumeAnalyzer.analyze_text(r) for r in resumes], len(resumes))
+    yield ('analyze_gap',
+           lambda: [SkillGapAnalyzer.analyze_gap(skills, roles[i % len(roles)]) for i, skills in enumerate(data['skills'])],
+           len(data['skills']))
+
+
+def run(sizes, repeat, seed):
+    """Run every case for each corpus size; returns the results document."""
+    results = {}
+    for size in sizes:
+        data = corpus.generate(size, seed)
+        for name, fn, operations in _cases(data):
+            fn()  # Warm-up
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                fn()
+                timings.append(time.perf_counter() - start)
+            key = f'{size}/{name}'
+            results[key] = {
+                'operations': operations,
+                'median_ms_per_op': round(statistics.median(timings) / operations * 1000, 4),
+                'min_ms_per_op': round(min(timings) / operations * 1000, 4)
+            }
+            print(f"{key:60s} {results[key]['median_ms_per_op']:>10.4f} ms/op", file=sys.stderr)
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'seed': seed,
+            'repeat': repeat,
+            'matcher_hash_features': JobMatcher._hasher().n_features
+        },
+        'results': results
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Return list of regression messages for cases slower than baseline by more than tolerance."""
+    regressions = []
+    for key, current in results['results'].items():
+        previous = baseline.get('results', {}).get(key)
+        if not previous:
+            continue
+        limit = previous['median_ms_per_op'] * (1 + tolerance)
+        if current['median_ms_per_op'] > limit:
+            regressions.append(
+                f"{key}: {current['median_ms_per_op']:.4f} ms/op > "
+                f"{previous['median_ms_per_op']:.4f} ms/op baseline (+{tolerance:.0%} allowed)"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the NLP utilities.')
+    parser.add_argument('--sizes', nargs='+', default=['small'], choices=list(corpus.SIZES))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='Write results JSON to this path (default: stdout)')
+    parser.add_argument('--baseline', help='Compare against this results JSON')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Allowed slowdown over baseline as a fraction (default: 0.2)')
+    parser.add_argument('--save-baseline', help='Write results JSON as the new baseline')
+    args = parser.parse_args()
+    
+    results = run(args.sizes, args.repeat, args.seed)
+    payload = json.dumps(results, indent=2, sort_keys=True)
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(payload + '\n')
+    else:
+        print(payload)
+    
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            f.write(payload + '\n')
+    
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print('Performance regressions:', file=sys.stderr)
+            for message in regressions:
+                print(f'  {message}', file=sys.stderr)
+            sys.exit(1)
+        print('No regressions against baseline', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
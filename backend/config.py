@@ -13,6 +13,15 @@ class Config:
     
     # MongoDB Configuration
     MONGO_URI = os.getenv('MONGODB_URI', 'mongodb://localhost:27017/smart_career')
+    MONGO_MAX_POOL_SIZE = int(os.getenv('MONGO_MAX_POOL_SIZE', 100))
+    MONGO_MIN_POOL_SIZE = int(os.getenv('MONGO_MIN_POOL_SIZE', 0))
+    MONGO_MAX_IDLE_TIME_MS = int(os.getenv('MONGO_MAX_IDLE_TIME_MS', 0))  # 0: no limit
+    MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv('MONGO_SERVER_SELECTION_TIMEOUT_MS', 5000))
+    MONGO_CONNECT_TIMEOUT_MS = int(os.getenv('MONGO_CONNECT_TIMEOUT_MS', 5000))
+    MONGO_SOCKET_TIMEOUT_MS = int(os.getenv('MONGO_SOCKET_TIMEOUT_MS', 30000))  # 0: no limit
+    MONGO_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv('MONGO_WAIT_QUEUE_TIMEOUT_MS', 5000))  # 0: no limit
+    MONGO_ANALYTICS_READ_PREFERENCE = os.getenv('MONGO_ANALYTICS_READ_PREFERENCE', 'primary')
+    QUERY_FANOUT_WORKERS = int(os.getenv('QUERY_FANOUT_WORKERS', 8))  # below 2: run sequentially
     
     # JWT Configuration
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY')
@@ -26,6 +35,84 @@ class Config:
     UPLOAD_FOLDER = os.getenv('UPLOAD_FOLDER', 'uploads/resumes')
     ALLOWED_EXTENSIONS = set(os.getenv('ALLOWED_EXTENSIONS', 'pdf,doc,docx').split(','))
     
+    # Resume Revision Configuration
+    RESUME_REVISION_CANDIDATES = int(os.getenv('RESUME_REVISION_CANDIDATES', 5))  # recent resumes compared on upload
+    RESUME_REVISION_SIMILARITY = float(os.getenv('RESUME_REVISION_SIMILARITY', 0.5))  # line overlap for a revision
+    RESUME_REVISION_FILENAME_SIMILARITY = float(os.getenv('RESUME_REVISION_FILENAME_SIMILARITY', 0.2))  # same filename
+    RESUME_DIFF_MAX_LINES = int(os.getenv('RESUME_DIFF_MAX_LINES', 20))  # changed lines listed per section
+    
+    # Result Cache Configuration
+    RESULT_CACHE_SIZE = int(os.getenv('RESULT_CACHE_SIZE', 512))
+    
+    # Response Cache Configuration
+    RESPONSE_CACHE_BACKEND = os.getenv('RESPONSE_CACHE_BACKEND', 'memory')  # memory, disk, redis or none
+    RESPONSE_CACHE_SIZE = int(os.getenv('RESPONSE_CACHE_SIZE', 1024))
+    RESPONSE_CACHE_TTL = int(os.getenv('RESPONSE_CACHE_TTL', 300))
+    RESPONSE_CACHE_DIR = os.getenv('RESPONSE_CACHE_DIR', 'data/response_cache')
+    RESPONSE_CACHE_URL = os.getenv('RESPONSE_CACHE_URL', 'redis://localhost:6379/0')
+    
+    # Job List Configuration
+    JOB_LIST_MAX_LIMIT = int(os.getenv('JOB_LIST_MAX_LIMIT', 500))  # largest ?limit= page
+    
+    # Batch Operations Configuration
+    BATCH_MAX_ITEMS = int(os.getenv('BATCH_MAX_ITEMS', 500))  # updates + deletes per /batch request
+    
+    # Job Import Configuration
+    JOB_IMPORT_BATCH_SIZE = int(os.getenv('JOB_IMPORT_BATCH_SIZE', 1000))
+    JOB_IMPORT_MAX_ERRORS = int(os.getenv('JOB_IMPORT_MAX_ERRORS', 100))  # row errors listed in the response
+    
+    # Job Matching Configuration
+    # tfidf re-fits per resume/job pair and does not read the stored description
+    # vectors (those still drive candidate retrieval); hashing and sections reuse them
+    MATCHER_MODE = os.getenv('MATCHER_MODE', 'tfidf')  # tfidf, hashing or sections
+    MATCHER_HASH_FEATURES = int(os.getenv('MATCHER_HASH_FEATURES', 2 ** 18))
+    # Weight of each resume section kind in 'sections' mode (unlisted kinds: 0)
+    MATCHER_SECTION_WEIGHTS = os.getenv(
+        'MATCHER_SECTION_WEIGHTS',
+        'experience:1.0,projects:0.8,skills:0.8,summary:0.5,certifications:0.5,'
+        'education:0.3,awards:0.3,publications:0.3,header:0.1'
+    )
+    JOB_VECTOR_STORE_PATH = os.getenv('JOB_VECTOR_STORE_PATH', 'data/job_vectors')
+    JOB_VECTOR_MAX_SEGMENTS = int(os.getenv('JOB_VECTOR_MAX_SEGMENTS', 16))  # compacted in the background beyond this
+    
+    # Activity Feed Configuration (TTL is ignored for a capped collection)
+    ACTIVITY_TTL_DAYS = int(os.getenv('ACTIVITY_TTL_DAYS', 0))  # 0: keep forever
+    ACTIVITY_CAPPED_BYTES = int(os.getenv('ACTIVITY_CAPPED_BYTES', 0))  # 0: not capped
+    
+    # Metrics Configuration
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
+    METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')  # empty: /api/metrics is not served
+    
+    # Query Inspector Configuration
+    QUERY_INSPECTOR_ENABLED = os.getenv('QUERY_INSPECTOR_ENABLED', str(DEBUG)).lower() == 'true'
+    QUERY_BUDGET_STRICT = os.getenv('QUERY_BUDGET_STRICT', 'false').lower() == 'true'
+    QUERY_REPEAT_THRESHOLD = int(os.getenv('QUERY_REPEAT_THRESHOLD', 3))
+    SLOW_QUERY_MS = float(os.getenv('SLOW_QUERY_MS', 100))
+    
+    # Profiler Configuration
+    PROFILER_ENABLED = os.getenv('PROFILER_ENABLED', 'false').lower() == 'true'
+    PROFILER_TOKEN = os.getenv('PROFILER_TOKEN', '')
+    PROFILE_ENDPOINTS = set(filter(None, os.getenv('PROFILE_ENDPOINTS', '').split(',')))
+    PROFILE_SAMPLE_RATE = float(os.getenv('PROFILE_SAMPLE_RATE', 0))
+    PROFILE_INTERVAL_MS = float(os.getenv('PROFILE_INTERVAL_MS', 5))
+    PROFILE_DIR = os.getenv('PROFILE_DIR', 'data/profiles')
+    
+    # ASGI Configuration
+    ASGI_CPU_WORKERS = int(os.getenv('ASGI_CPU_WORKERS', 2))
+    
+    @staticmethod
+    def mongo_client_options():
+        """Connection pool settings passed to the MongoDB client."""
+        return {
+            'maxPoolSize': Config.MONGO_MAX_POOL_SIZE,
+            'minPoolSize': Config.MONGO_MIN_POOL_SIZE,
+            'maxIdleTimeMS': Config.MONGO_MAX_IDLE_TIME_MS or None,
+            'serverSelectionTimeoutMS': Config.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+            'connectTimeoutMS': Config.MONGO_CONNECT_TIMEOUT_MS,
+            'socketTimeoutMS': Config.MONGO_SOCKET_TIMEOUT_MS or None,
+            'waitQueueTimeoutMS': Config.MONGO_WAIT_QUEUE_TIMEOUT_MS or None
+        }
+    
     @staticmethod
     def init_app(app):
         """Initialize application with configuration."""
@@ -0,0 +1,35 @@
+from functools import wraps
+import jwt
+from quart import g, jsonify, request
+from bson import ObjectId
+from config import Config
+
+def decode_access_token(header):
+    """Identity of a Bearer access token issued by the auth routes."""
+    scheme, _, token = header.partition(' ')
+    if scheme != 'Bearer' or not token:
+        raise ValueError('Missing Authorization Header')
+    
+    # Same secret, algorithm and claims as Flask-JWT-Extended's defaults
+    claims = jwt.decode(token, Config.JWT_SECRET_KEY, algorithms=['HS256'])
+    if claims.get('type') != 'access':
+        raise ValueError('Only non-refresh tokens are allowed')
+    return claims['sub']
+
+def token_required(fn):
+    """Decorator to protect async routes that require authentication."""
+    @wraps(fn)
+    async def wrapper(*args, **kwargs):
+        try:
+            g.jwt_identity = decode_access_token(request.headers.get('Authorization', ''))
+        except Exception as e:
+            return jsonify({'error': 'Invalid or expired token', 'message': str(e)}), 401
+        return await fn(*args, **kwargs)
+    return wrapper
+
+def get_current_user_id():
+    """Get the current user's ID from the verified token."""
+    try:
+        return ObjectId(g.jwt_identity)
+    except Exception:
+        return None
@@ -0,0 +1,91 @@
+from flask import Response, g, jsonify, request
+from pymongo import monitoring
+from config import Config
+from utils import request_metrics
+from utils.request_metrics import current_timings, start_request, end_request
+import hmac
+
+class QueryTimingListener(monitoring.CommandListener):
+    """PyMongo command listener that charges each command to the current request."""
+    
+    def started(self, event):
+        pass
+    
+    def succeeded(self, event):
+        self._record(event)
+    
+    def failed(self, event):
+        self._record(event)
+    
+    @staticmethod
+    def _record(event):
+        timings = current_timings()
+        if timings is not None:
+            timings.record_db(event.duration_micros / 1e6)
+
+# Passed to the MongoClient in create_app
+query_listener = QueryTimingListener()
+
+def init_metrics(app):
+    """
+    Register request timing hooks and the /api/metrics endpoint. The endpoint
+    is only served when METRICS_TOKEN is set and requires it as a bearer token.
+    """
+    if not Config.METRICS_ENABLED:
+        return
+    
+    @app.before_request
+    def start_timing():
+        g.request_timings_token = start_request()
+    
+    @app.after_request
+    def record_timing(response):
+        timings = current_timings()
+        if timings is None:
+            return response
+        
+        wall = timings.wall_seconds()
+        cpu = timings.cpu_seconds()
+        endpoint = request.endpoint or 'unmatched'
+        method = request.method
+        
+        request_metrics.request_seconds.observe(wall, endpoint, method, str(response.status_code))
+        request_metrics.request_cpu_seconds.observe(cpu, endpoint, method)
+        request_metrics.db_commands.observe(timings.db_commands, endpoint, method)
+        request_metrics.db_seconds.observe(timings.db_seconds, endpoint, method)
+        for phase, seconds in timings.phases.items():
+            request_metrics.phase_seconds.observe(seconds, endpoint, method, phase)
+        
+        response.headers['Server-Timing'] = _server_timing(timings, wall, cpu)
+        return response
+    
+    @app.teardown_request
+    def stop_timing(error=None):
+        token = g.pop('request_timings_token', None)
+        if token is not None:
+            end_request(token)
+    
+    if not Config.METRICS_TOKEN:
+        return
+    
+    @app.route('/api/metrics', methods=['GET'])
+    def metrics():
+        if not _authorized(request.headers.get('Authorization', '')):
+            return jsonify({'error': 'Invalid metrics token'}), 401
+        return Response(request_metrics.registry.render(), mimetype='text/plain; version=0.0.4')
+
+def _authorized(header):
+    """Whether an Authorization header carries METRICS_TOKEN as a bearer token."""
+    scheme, _, token = header.partition(' ')
+    return scheme.lower() == 'bearer' and hmac.compare_digest(token.encode('utf-8'), Config.METRICS_TOKEN.encode('utf-8'))
+
+def _server_timing(timings, wall, cpu):
+    """Server-Timing header value (durations in milliseconds)."""
+    entries = [
+        f"app;dur={wall * 1000:.1f}",
+        f"cpu;dur={cpu * 1000:.1f}",
+        f'db;dur={timings.db_seconds * 1000:.1f};desc="{timings.db_commands} commands"'
+    ]
+    for phase, seconds in sorted(timings.phases.items()):
+        entries.append(f"{phase};dur={seconds * 1000:.1f}")
+    return ', '.join(entries)
@@ -0,0 +1,56 @@
+from flask import g, request
+from config import Config
+from utils.sampling_profiler import SamplingProfiler, write_collapsed
+from datetime import datetime
+import hmac
+import os
+import random
+import threading
+import uuid
+
+PROFILE_HEADER = 'X-Profile'
+
+def init_profiler(app):
+    """
+    Register the opt-in sampling profiler.
+    A request is profiled when it sends the X-Profile header matching
+    PROFILER_TOKEN (ignored while no token is set), its endpoint is listed in PROFILE_ENDPOINTS,
+    or it is picked at PROFILE_SAMPLE_RATE. Nothing is registered when disabled.
+    """
+    if not Config.PROFILER_ENABLED:
+        return
+    
+    @app.before_request
+    def start_profiler():
+        if _should_profile():
+            g.profiler = SamplingProfiler(
+                threading.get_ident(),
+                interval=Config.PROFILE_INTERVAL_MS / 1000
+            ).start()
+            g.profile_id = f"{request.endpoint or 'unmatched'}-{datetime.utcnow():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+    
+    @app.after_request
+    def tag_profile(response):
+        if 'profile_id' in g:
+            response.headers['X-Profile-Id'] = g.profile_id
+        return response
+    
+    @app.teardown_request
+    def stop_profiler(error=None):
+        profiler = g.pop('profiler', None)
+        if profiler is None:
+            return
+        stacks = profiler.stop()
+        try:
+            write_collapsed(stacks, os.path.join(Config.PROFILE_DIR, f"{g.profile_id}.collapsed"))
+        except OSError as e:
+            app.logger.warning("Failed to write profile %s: %s", g.profile_id, e)
+
+def _should_profile():
+    header = request.headers.get(PROFILE_HEADER)
+    if header and Config.PROFILER_TOKEN:
+        if hmac.compare_digest(header.encode('utf-8'), Config.PROFILER_TOKEN.encode('utf-8')):
+            return True
+    if request.endpoint in Config.PROFILE_ENDPOINTS:
+        return True
+    return Config.PROFILE_SAMPLE_RATE > 0 and random.random() < Config.PROFILE_SAMPLE_RATE
@@ -0,0 +1,141 @@
+from contextvars import ContextVar
+from collections import Counter
+from functools import wraps
+from threading import Lock
+from flask import current_app, g, request
+from pymongo import monitoring
+from config import Config
+import json
+
+# Queries of the request being inspected in the current thread/context
+_current = ContextVar('query_log', default=None)
+
+# Part of each command that holds its filter, used to derive the query shape
+FILTER_FIELDS = {
+    'find': 'filter',
+    'aggregate': 'pipeline',
+    'count': 'query',
+    'distinct': 'query',
+    'findAndModify': 'query',
+    'update': 'updates',
+    'delete': 'deletes'
+}
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised in strict mode when an endpoint issues more queries than declared."""
+
+class QueryLog:
+    """Commands issued while handling one request."""
+    
+    def __init__(self):
+        self.pending = {}
+        self.shapes = Counter()
+        self.total = 0
+        self.slow = []
+        # Commands may finish on several threads (see utils.concurrent_queries)
+        self.lock = Lock()
+
+class QueryInspector(monitoring.CommandListener):
+    """PyMongo command listener that groups commands by shape and times them."""
+    
+    def started(self, event):
+        log = _current.get()
+        if log is None:
+            return
+        collection = event.command.get(event.command_name)
+        query = event.command.get(FILTER_FIELDS.get(event.command_name))
+        shape = f"{collection}.{event.command_name} {json.dumps(_shape(query), sort_keys=True)}"
+        log.pending[event.request_id] = (shape, query)
+    
+    def succeeded(self, event):
+        self._finish(event)
+    
+    def failed(self, event):
+        self._finish(event)
+    
+    @staticmethod
+    def _finish(event):
+        log = _current.get()
+        if log is None or event.request_id not in log.pending:
+            return
+        shape, query = log.pending.pop(event.request_id)
+        duration_ms = event.duration_micros / 1000
+        with log.lock:
+            # Fetching further batches of a cursor is not a separate query
+            if event.command_name != 'getMore':
+                log.total += 1
+                log.shapes[shape] += 1
+            if duration_ms >= Config.SLOW_QUERY_MS:
+                log.slow.append((duration_ms, shape, query))
+
+# Passed to the MongoClient in create_app
+query_inspector = QueryInspector()
+
+def query_budget(max_queries):
+    """Declare the most MongoDB commands a route handler may issue per request."""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            return fn(*args, **kwargs)
+        wrapper.query_budget = max_queries
+        return wrapper
+    return decorator
+
+def init_query_inspector(app):
+    """
+    Register N+1 and slow-query detection.
+    Active when QUERY_INSPECTOR_ENABLED is set or the app is in testing mode;
+    budgets fail the request in testing mode or with QUERY_BUDGET_STRICT.
+    """
+    
+    @app.before_request
+    def start_inspection():
+        if Config.QUERY_INSPECTOR_ENABLED or app.testing:
+            g.query_log_token = _current.set(QueryLog())
+    
+    @app.after_request
+    def report_queries(response):
+        log = _current.get()
+        if log is None:
+            return response
+        endpoint = request.endpoint or 'unmatched'
+        
+        for shape, count in log.shapes.most_common():
+            if count < Config.QUERY_REPEAT_THRESHOLD:
+                break
+            current_app.logger.warning(
+                "Repeated query in %s: %d x %s (possible N+1)", endpoint, count, shape)
+        
+        for duration_ms, shape, query in log.slow:
+            current_app.logger.warning(
+                "Slow query in %s: %.1f ms %s filter=%s",
+                endpoint, duration_ms, shape, json.dumps(query, default=str)[:500])
+        
+        view = app.view_functions.get(request.endpoint)
+        budget = getattr(view, 'query_budget', None)
+        if budget is not None and log.total > budget:
+            message = f"{endpoint} issued {log.total} queries, budget is {budget}"
+            if app.testing or Config.QUERY_BUDGET_STRICT:
+                raise QueryBudgetExceeded(message)
+            current_app.logger.warning(message)
+        
+        return response
+    
+    @app.teardown_request
+    def stop_inspection(error=None):
+        token = g.pop('query_log_token', None)
+        if token is not None:
+            _current.reset(token)
+
+def _shape(value):
+    """Structure of a filter with every literal value replaced by '?'."""
+    if isinstance(value, dict):
+        return {key: _shape(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        shapes = []
+        for item in value:
+            item_shape = _shape(item)
+            if item_shape not in shapes:
+                shapes.append(item_shape)
+        return shapes
+    return '?'
@@ -0,0 +1,46 @@
+class Field:
+    """Model attribute stored in the wrapped document, read on access."""
+    
+    __slots__ = ('key', 'default')
+    
+    def __init__(self, default=None, key=None):
+        self.key = key
+        self.default = default
+    
+    def __set_name__(self, owner, name):
+        if self.key is None:
+            self.key = name
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return instance._doc.get(self.key, self.default)
+    
+    def __set__(self, instance, value):
+        instance._doc[self.key] = value
+
+
+class Document:
+    """
+    Slotted model backed by a raw MongoDB document.
+    Instances hold only a reference to the document: nothing is copied when
+    wrapping a query result, and stored values (timestamps included) are kept.
+    """
+    
+    __slots__ = ('_doc',)
+    
+    _id = Field()
+    
+    def __init__(self, document):
+        self._doc = document
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Wrap a stored document without copying it."""
+        instance = cls.__new__(cls)
+        instance._doc = data
+        return instance
+    
+    def to_dict(self):
+        """The underlying document (not a copy); insert_one adds its _id."""
+        return self._doc
@@ -1,69 +1,45 @@
 from datetime import datetime
 from bson import ObjectId
+from models.base import Document, Field
+from utils.serializers import job_serializer
 
-class JobApplication:
+class JobApplication(Document):
     """Job Application model for tracking job applications."""
     
-    def __init__(self, user_id, company, position, status='applied', **kwargs):
-        self.user_id = ObjectId(user_id) if isinstance(user_id, str) else user_id
-        self.company = company
-        self.position = position
-        self.status = status  # applied, in-review, interview, offer, rejected
-        self.applied_date = kwargs.get('applied_date', datetime.utcnow())
-        self.salary = kwargs.get('salary', '')
-        self.location = kwargs.get('location', '')
-        self.job_type = kwargs.get('job_type', 'Full-time')  # Full-time, Part-time, Contract, Remote, Hybrid
-        self.description = kwargs.get('description', '')
-        self.notes = kwargs.get('notes', '')
-        self.created_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+    __slots__ = ()
+    
+    user_id = Field()
+    company = Field()
+    position = Field()
+    status = Field('applied')  # applied, in-review, interview, offer, rejected
+    applied_date = Field()
+    salary = Field('')
+    location = Field('')
+    job_type = Field('Full-time')  # Full-time, Part-time, Contract, Remote, Hybrid
+    description = Field('')
+    notes = Field('')
+    description_vector = Field()  # Precomputed by JobMatcher.vectorize_job
+    created_at = Field()
+    updated_at = Field()
     
-    def to_dict(self):
-        """Convert job application to dictionary."""
-        return {
-            'user_id': self.user_id,
-            'company': self.company,
-            'position': self.position,
-            'status': self.status,
-            'applied_date': self.applied_date,
-            'salary': self.salary,
-            'location': self.location,
-            'job_type': self.job_type,
-            'description': self.description,
-            'notes': self.notes,
-            'created_at': self.created_at,
-            'updated_at': self.updated_at
-        }
+    def __init__(self, user_id, company, position, status='applied', **kwargs):
+        now = datetime.utcnow()
+        super().__init__({
+            'user_id': ObjectId(user_id) if isinstance(user_id, str) else user_id,
+            'company': company,
+            'position': position,
+            'status': status,
+            'applied_date': kwargs.get('applied_date', now),
+            'salary': kwargs.get('salary', ''),
+            'location': kwargs.get('location', ''),
+            'job_type': kwargs.get('job_type', 'Full-time'),
+            'description': kwargs.get('description', ''),
+            'notes': kwargs.get('notes', ''),
+            'description_vector': kwargs.get('description_vector'),
+            'created_at': now,
+            'updated_at': now
+        })
     
     def to_json(self):
-        """Convert job application to JSON-safe dictionary."""
-        return {
-            'id': str(self.user_id),
-            'company': self.company,
-            'position': self.position,
-            'status': self.status,
-            'applied_date': self.applied_date.isoformat() if self.applied_date else None,
-            'salary': self.salary,
-            'location': self.location,
-            'job_type': self.job_type,
-            'description': self.description,
-            'notes': self.notes,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
-
-    @staticmethod
-    def from_dict(data):
-        """Create JobApplication object from dictionary."""
-        return JobApplication(
-            user_id=data['user_id'],
-            company=data['company'],
-            position=data['position'],
-            status=data.get('status', 'applied'),
-            applied_date=data.get('applied_date'),
-            salary=data.get('salary', ''),
-            location=data.get('location', ''),
-            job_type=data.get('job_type', 'Full-time'),
-            description=data.get('description', ''),
-            notes=data.get('notes', '')
-        )
+        """Convert job application to its API representation."""
+        return job_serializer.one(dict(self._doc, _id=self._id))
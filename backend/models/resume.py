@@ -1,53 +1,48 @@
 from datetime import datetime
 from bson import ObjectId
+from models.base import Document, Field
+from utils.serializers import resume_serializer
 
-class Resume:
+class Resume(Document):
     """Resume model for storing resume information and analysis."""
     
-    def __init__(self, user_id, filename, file_path, **kwargs):
-        self.user_id = ObjectId(user_id) if isinstance(user_id, str) else user_id
-        self.filename = filename
-        self.file_path = file_path
-        self.file_size = kwargs.get('file_size', 0)
-        self.analysis = kwargs.get('analysis', None)
-        self.score = kwargs.get('score', 0)
-        self.ats_score = kwargs.get('ats_score', 0)
-        self.uploaded_at = datetime.utcnow()
+    __slots__ = ()
+    
+    user_id = Field()
+    filename = Field()
+    file_path = Field()
+    file_size = Field(0)
+    analysis = Field()
+    score = Field(0)
+    ats_score = Field(0)
+    extracted_text = Field()
+    sections = Field()
+    analyzer_version = Field()
+    analysis_error = Field()
+    revision_of = Field()
+    delta = Field()
+    uploaded_at = Field()
     
-    def to_dict(self):
-        """Convert resume to dictionary."""
-        return {
-            'user_id': self.user_id,
-            'filename': self.filename,
-            'file_path': self.file_path,
-            'file_size': self.file_size,
-            'analysis': self.analysis,
-            'score': self.score,
-            'ats_score': self.ats_score,
-            'uploaded_at': self.uploaded_at
-        }
+    def __init__(self, user_id, filename, file_path, **kwargs):
+        super().__init__({
+            'user_id': ObjectId(user_id) if isinstance(user_id, str) else user_id,
+            'filename': filename,
+            'file_path': file_path,
+            'file_size': kwargs.get('file_size', 0),
+            'analysis': kwargs.get('analysis', None),
+            'score': kwargs.get('score', 0),
+            'ats_score': kwargs.get('ats_score', 0),
+            # Kept so analyses can be refreshed without re-reading the PDF
+            'extracted_text': kwargs.get('extracted_text', None),
+            'sections': kwargs.get('sections', None),
+            'analyzer_version': kwargs.get('analyzer_version', None),
+            'analysis_error': kwargs.get('analysis_error', None),
+            # Earlier resume this upload revises, and what changed since
+            'revision_of': kwargs.get('revision_of', None),
+            'delta': kwargs.get('delta', None),
+            'uploaded_at': datetime.utcnow()
+        })
     
     def to_json(self):
-        """Convert resume to JSON-safe dictionary."""
-        return {
-            'id': str(self.user_id),
-            'filename': self.filename,
-            'file_size': self.file_size,
-            'analysis': self.analysis,
-            'score': self.score,
-            'ats_score': self.ats_score,
-            'uploaded_at': self.uploaded_at.isoformat() if self.uploaded_at else None
-        }
-
-    @staticmethod
-    def from_dict(data):
-        """Create Resume object from dictionary."""
-        return Resume(
-            user_id=data['user_id'],
-            filename=data['filename'],
-            file_path=data['file_path'],
-            file_size=data.get('file_size', 0),
-            analysis=data.get('analysis'),
-            score=data.get('score', 0),
-            ats_score=data.get('ats_score', 0)
-        )
+        """Convert resume to its API representation."""
+        return resume_serializer.one(dict(self._doc, _id=self._id))
@@ -0,0 +1,47 @@
+"""
+Data-Access Layer
+One repository per collection, owning its queries, projections and indexes
+"""
+
+from functools import partial
+from repositories.user_repo import UserRepo, user_repo
+from repositories.profile_repo import ProfileRepo, profile_repo
+from repositories.job_repo import JobRepo, job_repo
+from repositories.skill_repo import SkillRepo, skill_repo
+from repositories.resume_repo import ResumeRepo, resume_repo
+from repositories.activity_repo import ActivityRepo, activity_repo
+from repositories.cache_repo import CacheGenerationRepo, cache_generation_repo
+from utils.concurrent_queries import fan_out
+
+REPOSITORIES = (user_repo, profile_repo, job_repo, skill_repo, resume_repo, activity_repo, cache_generation_repo)
+
+_by_collection = {repo.collection_name: repo for repo in REPOSITORIES}
+
+
+def repository_for(collection_name):
+    """The repository owning a collection."""
+    return _by_collection[collection_name]
+
+
+def read_calls(reads):
+    """Zero-argument calls for (key, collection, operation, arguments) reads, as built in utils.overview."""
+    return [
+        partial(getattr(_by_collection[collection], operation), *arguments)
+        for _, collection, operation, arguments in reads
+    ]
+
+
+def run_reads(reads):
+    """{key: result} for independent reads, run concurrently."""
+    return dict(zip((key for key, _, _, _ in reads), fan_out(*read_calls(reads))))
+
+
+def bind_database(db):
+    """Point every repository at `db` (e.g. a mongomock database); None restores the app's."""
+    for repo in REPOSITORIES:
+        repo.bind(db)
+
+
+def ensure_indexes():
+    """Create the indexes declared by every repository; returns {collection: [index names]}."""
+    return {repo.collection_name: repo.ensure_indexes() for repo in REPOSITORIES}
@@ -0,0 +1,72 @@
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import BulkWriteError
+from config import Config
+from repositories.base import Repository, timed_query
+from utils.serializers import activity_serializer
+
+def _indexes():
+    indexes = [
+        # The feed: one range read per page
+        ([('user_id', ASCENDING), ('time', DESCENDING), ('_id', DESCENDING)], {'name': 'user_time'}),
+        # One event per source document, so backfills can be re-run
+        ([('ref', ASCENDING)], {
+            'unique': True, 'partialFilterExpression': {'ref': {'$exists': True}}, 'name': 'ref_unique'
+        }),
+        # Edit events of a document, removed with it
+        ([('source', ASCENDING)], {'partialFilterExpression': {'source': {'$exists': True}}, 'name': 'source'})
+    ]
+    # Capped collections trim themselves and cannot have TTL indexes
+    if Config.ACTIVITY_TTL_DAYS and not Config.ACTIVITY_CAPPED_BYTES:
+        indexes.append(([('time', ASCENDING)], {
+            'expireAfterSeconds': Config.ACTIVITY_TTL_DAYS * 86400, 'name': 'time_ttl'
+        }))
+    return tuple(indexes)
+
+class ActivityRepo(Repository):
+    """Append-only activity feed entries (user_id, type, action, time, ref)."""
+    
+    collection_name = 'activity'
+    indexes = _indexes()
+    
+    @timed_query
+    def append(self, events, ignore_duplicates=False):
+        """Insert events; returns how many were written."""
+        if not events:
+            return 0
+        try:
+            return len(self.collection.insert_many(events, ordered=False).inserted_ids)
+        except BulkWriteError as e:
+            # Duplicate refs mean the event was already recorded
+            if not ignore_duplicates or any(error['code'] != 11000 for error in e.details['writeErrors']):
+                raise
+            return e.details['nInserted']
+    
+    @timed_query
+    def remove_for(self, user_id, document_ids):
+        """Delete the user's events created by or about the given documents."""
+        if document_ids:
+            self.collection.delete_many({'user_id': user_id, '$or': [
+                {'ref': {'$in': document_ids}}, {'source': {'$in': document_ids}}
+            ]})
+    
+    @timed_query
+    def page(self, user_id, limit, before=None, projection=activity_serializer.projection):
+        """Up to `limit` entries, newest first, older than the (time, _id) in `before`."""
+        query = {'user_id': user_id}
+        if before is not None:
+            time, entry_id = before
+            query['$or'] = [{'time': {'$lt': time}}, {'time': time, '_id': {'$lt': entry_id}}]
+        return list(self.collection.find(query, projection)
+                    .sort([('time', DESCENDING), ('_id', DESCENDING)])
+                    .limit(limit))
+    
+    def ensure_indexes(self):
+        if Config.ACTIVITY_CAPPED_BYTES:
+            database = self.collection.database
+            if self.collection_name not in database.list_collection_names():
+                database.create_collection(self.collection_name, capped=True, size=Config.ACTIVITY_CAPPED_BYTES)
+            elif not self.collection.options().get('capped'):
+                database.command('convertToCapped', self.collection_name, size=Config.ACTIVITY_CAPPED_BYTES)
+        return super().ensure_indexes()
+
+activity_repo = ActivityRepo()
@@ -0,0 +1,115 @@
+"""
+Repository Base
+Collection binding, index declarations, read preferences and per-method timing
+shared by the data-access layer
+"""
+
+import time
+from functools import wraps
+from pymongo import DeleteOne, UpdateOne
+from pymongo.read_preferences import make_read_preference, read_pref_mode_from_name
+from config import Config
+from utils import request_metrics
+
+# Read preference for aggregate reads (dashboard and profile counts)
+ANALYTICS_READ_PREFERENCE = make_read_preference(
+    read_pref_mode_from_name(Config.MONGO_ANALYTICS_READ_PREFERENCE), None
+)
+
+
+def with_analytics_reads(collection):
+    """`collection` reading with ANALYTICS_READ_PREFERENCE (PyMongo or Motor)."""
+    if ANALYTICS_READ_PREFERENCE.mongos_mode == 'primary':
+        return collection
+    return collection.with_options(read_preference=ANALYTICS_READ_PREFERENCE)
+
+
+def timed_query(fn):
+    """Record each call in the repository_call_seconds{repository, method} histogram."""
+    if not Config.METRICS_ENABLED:
+        return fn
+    
+    @wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return fn(self, *args, **kwargs)
+        finally:
+            request_metrics.repository_seconds.observe(
+                time.perf_counter() - started, type(self).__name__, fn.__name__
+            )
+    return wrapper
+
+
+class Repository:
+    """
+    Data access for one collection.
+    Repositories use the app's database unless bound to another one with
+    bind(), e.g. a mongomock database in tests.
+    """
+    
+    collection_name = None
+    
+    # (keys, options) pairs applied by ensure_indexes()
+    indexes = ()
+    
+    def __init__(self):
+        self._db = None
+    
+    def bind(self, db):
+        """Use `db` instead of the app's database; None restores the default."""
+        self._db = db
+    
+    @property
+    def collection(self):
+        db = self._db
+        if db is None:
+            from app import mongo
+            db = mongo.db
+        return db[self.collection_name]
+    
+    @property
+    def analytics_collection(self):
+        """Collection for aggregate reads that may be served by a secondary."""
+        return with_analytics_reads(self.collection)
+    
+    @timed_query
+    def count(self, query):
+        """Number of documents matching `query`."""
+        return self.analytics_collection.count_documents(query)
+    
+    @timed_query
+    def find_one(self, query, projection=None):
+        """First document matching `query`, or None."""
+        return self.collection.find_one(query, projection)
+    
+    @timed_query
+    def aggregate(self, pipeline):
+        """Result rows of an aggregation `pipeline`, read like count()."""
+        return list(self.analytics_collection.aggregate(pipeline))
+    
+    @timed_query
+    def recent(self, query, sort_field, limit, projection=None):
+        """Newest `limit` documents matching `query` by `sort_field`."""
+        return list(self.collection.find(query, projection).sort(sort_field, -1).limit(limit))
+    
+    @timed_query
+    def owned(self, ids, user_id, projection=None):
+        """{_id: document} for the user's documents among `ids`."""
+        documents = self.collection.find({'_id': {'$in': list(ids)}, 'user_id': user_id}, projection or {'_id': 1})
+        return {document['_id']: document for document in documents}
+    
+    @timed_query
+    def bulk_apply(self, user_id, updates, deletes):
+        """
+        Apply [(id, fields)] $set updates and [id] deletes to the user's
+        documents in one unordered bulk_write; returns the BulkWriteResult.
+        """
+        operations = [UpdateOne({'_id': doc_id, 'user_id': user_id}, {'$set': fields}) for doc_id, fields in updates]
+        operations += [DeleteOne({'_id': doc_id, 'user_id': user_id}) for doc_id in deletes]
+        if operations:
+            return self.collection.bulk_write(operations, ordered=False)
+    
+    def ensure_indexes(self):
+        """Create the declared indexes (no-op for existing ones)."""
+        return [self.collection.create_index(keys, **options) for keys, options in self.indexes]
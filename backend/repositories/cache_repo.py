@@ -0,0 +1,27 @@
+from pymongo import ReturnDocument
+from repositories.base import Repository, timed_query
+
+class CacheGenerationRepo(Repository):
+    """
+    Per-user cache generations ({_id: owner, generation}). Cached responses
+    are keyed by the owner's generation, so bumping it invalidates them in
+    every worker and process at once.
+    """
+    
+    collection_name = 'cache_generations'
+    
+    @timed_query
+    def generation(self, owner):
+        """Current generation of an owner (0 before the first write)."""
+        document = self.collection.find_one({'_id': owner}, {'generation': 1})
+        return document['generation'] if document else 0
+    
+    @timed_query
+    def bump(self, owner):
+        """Start a new generation for an owner; returns it."""
+        return self.collection.find_one_and_update(
+            {'_id': owner}, {'$inc': {'generation': 1}},
+            upsert=True, return_document=ReturnDocument.AFTER
+        )['generation']
+
+cache_generation_repo = CacheGenerationRepo()
@@ -0,0 +1,92 @@
+from pymongo import ASCENDING, DESCENDING, TEXT, UpdateOne
+from bson import ObjectId
+from repositories.base import Repository, timed_query
+from utils.serializers import job_serializer
+
+# Fields read when indexing and re-scoring jobs for recommendations
+MATCHING_PROJECTION = {'user_id': 1, 'company': 1, 'position': 1, 'description': 1, 'description_vector': 1}
+
+class JobRepo(Repository):
+    """Job applications."""
+    
+    collection_name = 'job_applications'
+    indexes = (
+        # Job list and dashboard trend counts
+        ([('user_id', ASCENDING), ('applied_date', DESCENDING)], {'name': 'user_applied_date'}),
+        # Status-filtered list and status counts
+        ([('user_id', ASCENDING), ('status', ASCENDING), ('applied_date', DESCENDING)], {'name': 'user_status_applied_date'}),
+        # Recent activity and ?sort=created_at
+        ([('user_id', ASCENDING), ('created_at', DESCENDING)], {'name': 'user_created_at'}),
+        # ?company= filter and ?sort=company; location and job_type filters scan
+        # the user's applications through user_applied_date instead
+        ([('user_id', ASCENDING), ('company', ASCENDING), ('applied_date', DESCENDING)], {'name': 'user_company_applied_date'}),
+        # Ranked ?q= search; the user_id prefix keeps each search within one user
+        ([('user_id', ASCENDING), ('company', TEXT), ('position', TEXT), ('description', TEXT), ('notes', TEXT)], {
+            'name': 'user_job_text',
+            'weights': {'company': 5, 'position': 5, 'description': 1, 'notes': 1},
+            'default_language': 'english'
+        })
+    )
+    
+    @timed_query
+    def search(self, job_query, projection=job_serializer.projection):
+        """Applications matching a JobQuery, in its sort order and page."""
+        return list(self.iter_search(job_query, projection))
+    
+    def iter_search(self, job_query, projection=job_serializer.projection, batch_size=1000):
+        """Cursor over the applications matching a JobQuery."""
+        cursor = self.collection.find(job_query.filter, job_query.projection(projection)).sort(job_query.sort)
+        if job_query.offset:
+            cursor = cursor.skip(job_query.offset)
+        if job_query.limit:
+            cursor = cursor.limit(job_query.limit)
+        return cursor.batch_size(batch_size)
+    
+    @timed_query
+    def get(self, job_id, user_id, projection=job_serializer.projection):
+        return self.collection.find_one({'_id': ObjectId(job_id), 'user_id': user_id}, projection)
+    
+    @timed_query
+    def get_many(self, job_ids, user_id, projection=MATCHING_PROJECTION):
+        """The user's applications among `job_ids` (in no particular order)."""
+        return list(self.collection.find(
+            {'_id': {'$in': [ObjectId(job_id) for job_id in job_ids]}, 'user_id': user_id}, projection
+        ))
+    
+    def iter_for_matching(self, user_id=None, batch_size=5000):
+        """Cursor over the fields needed to index jobs, for one user or all."""
+        query = {} if user_id is None else {'user_id': user_id}
+        return self.collection.find(query, MATCHING_PROJECTION).batch_size(batch_size)
+    
+    @timed_query
+    def create(self, document):
+        """Insert an application document; returns its _id."""
+        return self.collection.insert_one(document).inserted_id
+    
+    @timed_query
+    def create_many(self, documents):
+        """Insert application documents in one batch; each gets its _id set."""
+        if documents:
+            self.collection.insert_many(documents, ordered=False)
+    
+    @timed_query
+    def update(self, job_id, user_id, fields):
+        """Set fields on the user's application; False if it does not exist."""
+        result = self.collection.update_one({'_id': ObjectId(job_id), 'user_id': user_id}, {'$set': fields})
+        return result.matched_count > 0
+    
+    @timed_query
+    def set_features(self, features_by_id):
+        """Store precomputed description features for {job _id: features}."""
+        if features_by_id:
+            self.collection.bulk_write(
+                [UpdateOne({'_id': job_id}, {'$set': features}) for job_id, features in features_by_id.items()],
+                ordered=False
+            )
+    
+    @timed_query
+    def delete(self, job_id, user_id):
+        """Delete the user's application; False if it does not exist."""
+        return self.collection.delete_one({'_id': ObjectId(job_id), 'user_id': user_id}).deleted_count > 0
+
+job_repo = JobRepo()
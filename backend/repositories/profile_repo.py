@@ -0,0 +1,20 @@
+from pymongo import ASCENDING
+from repositories.base import Repository, timed_query
+
+class ProfileRepo(Repository):
+    """Extended profile data, one document per user."""
+    
+    collection_name = 'profiles'
+    indexes = (
+        ([('user_id', ASCENDING)], {'unique': True, 'name': 'user_unique'}),
+    )
+    
+    @timed_query
+    def get(self, user_id, projection=None):
+        return self.collection.find_one({'user_id': user_id}, projection)
+    
+    @timed_query
+    def upsert(self, user_id, fields):
+        self.collection.update_one({'user_id': user_id}, {'$set': fields}, upsert=True)
+
+profile_repo = ProfileRepo()
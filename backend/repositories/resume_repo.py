@@ -0,0 +1,78 @@
+from pymongo import ASCENDING, DESCENDING, UpdateOne
+from bson import ObjectId
+from repositories.base import Repository, timed_query
+from utils.serializers import resume_serializer, resume_summary_serializer
+
+class ResumeRepo(Repository):
+    """Uploaded resumes and their analyses."""
+    
+    collection_name = 'resumes'
+    indexes = (
+        ([('user_id', ASCENDING), ('uploaded_at', DESCENDING)], {'name': 'user_uploaded_at'}),
+        # Re-analysis scans resumes by analyzer version in _id order
+        ([('analyzer_version', ASCENDING), ('_id', ASCENDING)], {'name': 'analyzer_version_id'})
+    )
+    
+    @timed_query
+    def list_for_user(self, user_id, projection=resume_summary_serializer.projection):
+        """The user's resumes, newest first."""
+        return list(self.collection.find({'user_id': user_id}, projection).sort('uploaded_at', DESCENDING))
+    
+    @timed_query
+    def get(self, resume_id, user_id, projection=resume_serializer.projection):
+        return self.collection.find_one({'_id': ObjectId(resume_id), 'user_id': user_id}, projection)
+    
+    @timed_query
+    def create(self, document):
+        """Insert a resume document; returns its _id."""
+        return self.collection.insert_one(document).inserted_id
+    
+    @timed_query
+    def count_stale(self, version):
+        """Number of resumes analyzed by another analyzer version (or none recorded)."""
+        return self.collection.count_documents({'analyzer_version': {'$ne': version}})
+    
+    @timed_query
+    def stale_batch(self, version, after_id=None, limit=100):
+        """
+        Next `limit` resumes not analyzed by `version`, in _id order after
+        `after_id`, with the fields needed to analyze them again.
+        """
+        query = {'analyzer_version': {'$ne': version}}
+        if after_id is not None:
+            query['_id'] = {'$gt': after_id}
+        projection = {'user_id': 1, 'file_path': 1, 'extracted_text': 1}
+        return list(self.collection.find(query, projection).sort('_id', ASCENDING).limit(limit))
+    
+    @timed_query
+    def set_analyses(self, results, version, analyzed_at):
+        """Store [(resume _id, text, analysis, sections)] as analyzed by `version`."""
+        if results:
+            self.collection.bulk_write([
+                UpdateOne({'_id': resume_id}, {'$set': {
+                    'analysis': analysis,
+                    'score': analysis.get('score', 0),
+                    'ats_score': analysis.get('atsScore', 0),
+                    'extracted_text': text,
+                    'sections': sections,
+                    'analyzer_version': version,
+                    'analysis_error': None,
+                    'analyzed_at': analyzed_at
+                }})
+                for resume_id, text, analysis, sections in results
+            ], ordered=False)
+    
+    @timed_query
+    def mark_unreadable(self, resume_ids, version, analyzed_at, error):
+        """
+        Record that `version` could not analyze these resumes (no readable
+        text), so they stop counting as stale; the previous analysis is kept.
+        """
+        if resume_ids:
+            self.collection.update_many({'_id': {'$in': list(resume_ids)}}, {'$set': {
+                'analysis_error': error,
+                'analyzer_version': version,
+                'analyzed_at': analyzed_at
+            }})
+
+resume_repo = ResumeRepo()
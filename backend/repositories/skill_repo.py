@@ -0,0 +1,73 @@
+from pymongo import ASCENDING, DESCENDING
+from bson import ObjectId
+from datetime import datetime
+from repositories.base import Repository, timed_query
+from utils.serializers import skill_serializer
+
+class SkillRepo(Repository):
+    """User skills."""
+    
+    collection_name = 'skills'
+    indexes = (
+        # Skill list (sorted by level) and stats
+        ([('user_id', ASCENDING), ('level', DESCENDING)], {'name': 'user_level'}),
+        # Duplicate checks
+        ([('user_id', ASCENDING), ('name', ASCENDING)], {'name': 'user_name'}),
+        # Recent activity
+        ([('user_id', ASCENDING), ('created_at', DESCENDING)], {'name': 'user_created_at'})
+    )
+    
+    @timed_query
+    def list_for_user(self, user_id, category=None, projection=skill_serializer.projection):
+        """The user's skills, strongest first."""
+        query = {'user_id': user_id}
+        if category:
+            query['category'] = category
+        return list(self.collection.find(query, projection).sort('level', DESCENDING))
+    
+    @timed_query
+    def names(self, user_id):
+        """Names of the user's skills."""
+        return [skill['name'] for skill in self.collection.find({'user_id': user_id}, {'name': 1, '_id': 0})]
+    
+    @timed_query
+    def get(self, skill_id, user_id, projection=skill_serializer.projection):
+        return self.collection.find_one({'_id': ObjectId(skill_id), 'user_id': user_id}, projection)
+    
+    @timed_query
+    def exists(self, user_id, name):
+        return self.collection.find_one({'user_id': user_id, 'name': name}, {'_id': 1}) is not None
+    
+    @timed_query
+    def create(self, document):
+        """Insert a skill document; returns its _id."""
+        return self.collection.insert_one(document).inserted_id
+    
+    @timed_query
+    def add_missing(self, user_id, names, defaults):
+        """Insert skills for names the user does not have yet; returns the inserted documents."""
+        existing = {skill['name'] for skill in self.collection.find(
+            {'user_id': user_id, 'name': {'$in': list(names)}}, {'name': 1, '_id': 0}
+        )}
+        now = datetime.utcnow()
+        added = [
+            dict(defaults, user_id=user_id, name=name, created_at=now, updated_at=now)
+            for name in dict.fromkeys(names) if name not in existing
+        ]
+        if added:
+            # insert_many sets each document's _id
+            self.collection.insert_many(added, ordered=False)
+        return added
+    
+    @timed_query
+    def update(self, skill_id, user_id, fields):
+        """Set fields on the user's skill; False if it does not exist."""
+        result = self.collection.update_one({'_id': ObjectId(skill_id), 'user_id': user_id}, {'$set': fields})
+        return result.matched_count > 0
+    
+    @timed_query
+    def delete(self, skill_id, user_id):
+        """Delete the user's skill; False if it does not exist."""
+        return self.collection.delete_one({'_id': ObjectId(skill_id), 'user_id': user_id}).deleted_count > 0
+
+skill_repo = SkillRepo()
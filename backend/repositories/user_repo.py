@@ -0,0 +1,36 @@
+from pymongo import ASCENDING
+from repositories.base import Repository, timed_query
+
+class UserRepo(Repository):
+    """User accounts."""
+    
+    collection_name = 'users'
+    indexes = (
+        ([('email', ASCENDING)], {'unique': True, 'name': 'email_unique'}),
+    )
+    
+    @timed_query
+    def get(self, user_id, projection=None):
+        return self.collection.find_one({'_id': user_id}, projection)
+    
+    @timed_query
+    def find_by_email(self, email, projection=None):
+        return self.collection.find_one({'email': email.lower()}, projection)
+    
+    @timed_query
+    def email_in_use(self, email, exclude_id):
+        """Whether another user already has this email."""
+        return self.collection.find_one(
+            {'email': email.lower(), '_id': {'$ne': exclude_id}}, {'_id': 1}
+        ) is not None
+    
+    @timed_query
+    def create(self, document):
+        """Insert a user document; returns its _id."""
+        return self.collection.insert_one(document).inserted_id
+    
+    @timed_query
+    def update(self, user_id, fields):
+        self.collection.update_one({'_id': user_id}, {'$set': fields})
+
+user_repo = UserRepo()
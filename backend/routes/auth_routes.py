@@ -1,8 +1,9 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import create_access_token
-from app import mongo
+from repositories import user_repo
 from models.user import User
 from utils.validators import validate_email_address, validate_password, validate_required_fields
+from utils.serializers import user_serializer
 
 auth_bp = Blueprint('auth', __name__)
 
@@ -28,23 +29,18 @@ def register():
             return jsonify({'error': error}), 400
         
         # Check if user already exists
-        existing_user = mongo.db.users.find_one({'email': data['email'].lower()})
-        if existing_user:
+        if user_repo.find_by_email(data['email'], {'_id': 1}):
             return jsonify({'error': 'User with this email already exists'}), 409
         
         # Create new user
         user = User(name=data['name'], email=data['email'], password=data['password'])
-        result = mongo.db.users.insert_one(user.to_dict())
+        user_id = user_repo.create(user.to_dict())
         
         return jsonify({
             'message': 'User registered successfully',
-            'user': {
-                'id': str(result.inserted_id),
-                'name': user.name,
-                'email': user.email
-            }
+            'user': user_serializer.one(dict(user.to_dict(), _id=user_id))
         }), 201
-        
+    
     except Exception as e:
         return jsonify({'error': 'Registration failed', 'message': str(e)}), 500
 
@@ -60,7 +56,7 @@ def login():
             return jsonify({'error': error}), 400
         
         # Find user
-        user_data = mongo.db.users.find_one({'email': data['email'].lower()})
+        user_data = user_repo.find_by_email(data['email'])
         if not user_data:
             return jsonify({'error': 'Invalid email or password'}), 401
         
@@ -75,13 +71,9 @@ def login():
         return jsonify({
             'message': 'Login successful',
             'token': access_token,
-            'user': {
-                'id': str(user_data['_id']),
-                'name': user.name,
-                'email': user.email
-            }
+            'user': user_serializer.one(user_data)
         }), 200
-        
+    
     except Exception as e:
         return jsonify({'error': 'Login failed', 'message': str(e)}), 500
 
@@ -95,18 +87,13 @@ def verify_token():
         from middleware.auth_middleware import get_current_user_id
         user_id = get_current_user_id()
         
-        user_data = mongo.db.users.find_one({'_id': user_id})
+        user_data = user_repo.get(user_id, user_serializer.projection)
         if not user_data:
             return jsonify({'error': 'User not found'}), 404
         
-        user = User.from_dict(user_data)
         return jsonify({
             'valid': True,
-            'user': {
-                'id': str(user_data['_id']),
-                'name': user.name,
-                'email': user.email
-            }
+            'user': user_serializer.one(user_data)
         }), 200
     
     return verify()
@@ -7,16 +7,58 @@ from flask import Blueprint, request, jsonify
 from middleware.auth_middleware import token_required, get_current_user_id
 from utils.job_matcher import JobMatcher
 from utils.skill_gap_analyzer import SkillGapAnalyzer
-from bson import ObjectId
+from utils.result_cache import career_results, fingerprint, skill_set_fingerprint, conditional_response
+from utils.job_vector_store import job_vectors, job_document_text, index_jobs
+from utils.response_cache import cached_response
+from repositories import job_repo, skill_repo, resume_repo
 
 career_bp = Blueprint('career', __name__)
 
+# Skill tiers used to build the roadmap, by current level
+ROADMAP_LEVELS = {
+    'Beginner': ['html', 'css', 'javascript', 'git', 'python'],
+    'Intermediate': ['react', 'node.js', 'sql', 'docker', 'api development'],
+    'Advanced': ['kubernetes', 'microservices', 'system design', 'aws', 'ci/cd']
+}
+ROADMAP_VERSION = fingerprint(ROADMAP_LEVELS)[:12]
+
+# Nearest jobs fetched from the vector store before re-scoring
+RECOMMEND_CANDIDATES = 25
+
+# Resume fields read for matching: the stored text spares a PDF read
+RESUME_TEXT_PROJECTION = {'file_path': 1, 'extracted_text': 1, 'sections': 1, 'analyzer_version': 1}
+
+def match_resume(resume, job_description):
+    """
+    Match payload for a stored resume (RESUME_TEXT_PROJECTION fields) against
+    a job description, or None when no text could be extracted. Module-level
+    so the ASGI entry point can run it in a worker process.
+    """
+    from utils.resume_analyzer import load_resume_text
+    resume_text, sections = load_resume_text(resume)
+    
+    if not resume_text:
+        return None
+    
+    result = JobMatcher.calculate_match_score(resume_text, job_description, resume_sections=sections)
+    
+    payload = {
+        'match_score': result['score'],
+        'matching_keywords': result['matching_keywords'],
+        'missing_keywords': result['missing_keywords'],
+        'recommendation': 'Strong match' if result['score'] >= 70 else 
+                        'Good match' if result['score'] >= 50 else 
+                        'Needs improvement'
+    }
+    if 'section_scores' in result:
+        payload['section_scores'] = result['section_scores']
+    return payload
+
 @career_bp.route('/match-job', methods=['POST'])
 @token_required
 def match_job():
     """Match resume with job description using TF-IDF."""
     try:
-        from app import mongo
         data = request.json
         
         resume_id = data.get('resume_id')
@@ -27,33 +69,18 @@ def match_job():
         
         # Get resume text
         user_id = get_current_user_id()
-        resume = mongo.db.resumes.find_one({
-            '_id': ObjectId(resume_id),
-            'user_id': user_id
-        })
+        resume = resume_repo.get(resume_id, user_id, RESUME_TEXT_PROJECTION)
         
         if not resume:
             return jsonify({'error': 'Resume not found'}), 404
         
-        # Get resume text from file
-        from utils.resume_analyzer import ResumeAnalyzer
-        resume_text = ResumeAnalyzer.extract_text_from_pdf(resume['file_path'])
+        result = match_resume(resume, job_description)
         
-        if not resume_text:
+        if result is None:
             return jsonify({'error': 'Could not extract resume text'}), 400
         
-        # Calculate match
-        result = JobMatcher.calculate_match_score(resume_text, job_description)
-        
-        return jsonify({
-            'match_score': result['score'],
-            'matching_keywords': result['matching_keywords'],
-            'missing_keywords': result['missing_keywords'],
-            'recommendation': 'Strong match' if result['score'] >= 70 else 
-                            'Good match' if result['score'] >= 50 else 
-                            'Needs improvement'
-        }), 200
-        
+        return jsonify(result), 200
+    
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -63,7 +90,6 @@ def match_job():
 def recommend_jobs():
     """Recommend jobs based on resume."""
     try:
-        from app import mongo
         data = request.json
         
         resume_id = data.get('resume_id')
@@ -73,28 +99,35 @@ def recommend_jobs():
         
         # Get resume text
         user_id = get_current_user_id()
-        resume = mongo.db.resumes.find_one({
-            '_id': ObjectId(resume_id),
-            'user_id': user_id
-        })
+        resume = resume_repo.get(resume_id, user_id, RESUME_TEXT_PROJECTION)
         
         if not resume:
             return jsonify({'error': 'Resume not found'}), 404
         
-        from utils.resume_analyzer import ResumeAnalyzer
-        resume_text = ResumeAnalyzer.extract_text_from_pdf(resume['file_path'])
+        from utils.resume_analyzer import load_resume_text
+        resume_text, sections = load_resume_text(resume)
         
         if not resume_text:
             return jsonify({'error': 'Could not extract resume text'}), 400
         
-        # Get user's job applications to recommend similar ones
-        jobs = list(mongo.db.job_applications.find({'user_id': user_id}).limit(20))
+        # Jobs the store is missing (created before it existed, or whose
+        # indexing failed) are indexed here, keeping the vectors computed for
+        # jobs stored without one
+        if job_vectors.count(user_id) < job_repo.count({'user_id': user_id}):
+            job_repo.set_features(index_jobs(job_repo.iter_for_matching(user_id)))
         
+        # Retrieve the user's nearest job descriptions from the vector store
+        nearest = job_vectors.search(resume_text, k=RECOMMEND_CANDIDATES, owner_id=user_id)
+        
+        jobs = job_repo.get_many([job_id for job_id, _ in nearest], user_id)
+        
+        # Re-score the candidates with the full matcher, reusing stored job vectors
         job_listings = [{
             'id': str(job['_id']),
             'title': job.get('position', ''),
             'company': job.get('company', ''),
-            'description': job.get('description', job.get('position', ''))
+            'description': job_document_text(job),
+            'vector': job.get('description_vector')
         } for job in jobs]
         
         if not job_listings:
@@ -103,12 +136,12 @@ def recommend_jobs():
                 'recommendations': []
             }), 200
         
-        recommendations = JobMatcher.recommend_jobs(resume_text, job_listings)
+        recommendations = JobMatcher.recommend_jobs(resume_text, job_listings, resume_sections=sections)
         
         return jsonify({
             'recommendations': recommendations[:10]  # Top 10
         }), 200
-        
+    
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -118,7 +151,6 @@ def recommend_jobs():
 def analyze_skill_gap():
     """Analyze skill gap for target role."""
     try:
-        from app import mongo
         data = request.json
         
         target_role = data.get('target_role', '').lower().replace(' ', '_')
@@ -128,8 +160,7 @@ def analyze_skill_gap():
         
         # Get user's skills
         user_id = get_current_user_id()
-        skills = list(mongo.db.skills.find({'user_id': user_id}))
-        user_skills = [skill['name'] for skill in skills]
+        user_skills = skill_repo.names(user_id)
         
         if not user_skills:
             return jsonify({
@@ -137,20 +168,26 @@ def analyze_skill_gap():
                 'available_roles': SkillGapAnalyzer.get_available_roles()
             }), 400
         
-        # Analyze gap
-        analysis = SkillGapAnalyzer.analyze_gap(user_skills, target_role)
+        # Reuse a previous analysis of the same skill set for this role
+        cache_key = ('skill-gap', SkillGapAnalyzer.CATALOG_VERSION, target_role,
+                     skill_set_fingerprint(user_skills))
+        analysis = career_results.get(cache_key)
+        if analysis is None:
+            analysis = SkillGapAnalyzer.analyze_gap(user_skills, target_role)
+            career_results.set(cache_key, analysis, owner=user_id)
         
         if 'error' in analysis:
             return jsonify(analysis), 400
         
-        return jsonify(analysis), 200
-        
+        return conditional_response(analysis, fingerprint(*cache_key))
+    
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
 @career_bp.route('/available-roles', methods=['GET'])
 @token_required
+@cached_response('available-roles', per_user=False, version=SkillGapAnalyzer.CATALOG_VERSION)
 def get_available_roles():
     """Get list of roles for skill gap analysis."""
     try:
@@ -165,55 +202,57 @@ def get_available_roles():
 def get_career_roadmap():
     """Get personalized career roadmap."""
     try:
-        from app import mongo
         user_id = get_current_user_id()
         
-        # Get user profile
-        user = mongo.db.users.find_one({'_id': ObjectId(user_id)})
-        profile = mongo.db.profiles.find_one({'user_id': user_id})
-        
         # Get user skills
-        skills = list(mongo.db.skills.find({'user_id': user_id}))
-        skill_names = [skill['name'].lower() for skill in skills]
-        
-        # Determine current level based on skills
-        if len(skills) < 3:
-            current_level = 'Beginner'
-            next_skills = ['html', 'css', 'javascript', 'git', 'python']
-        elif len(skills) < 8:
-            current_level = 'Intermediate'
-            next_skills = ['react', 'node.js', 'sql', 'docker', 'api development']
-        else:
-            current_level = 'Advanced'
-            next_skills = ['kubernetes', 'microservices', 'system design', 'aws', 'ci/cd']
-        
-        # Filter out already learned skills
-        recommended_skills = [s for s in next_skills if s not in skill_names]
-        
-        roadmap = {
-            'current_level': current_level,
-            'skills_count': len(skills),
-            'recommended_next_steps': recommended_skills[:5],
-            'milestones': [
-                {
-                    'phase': 'Short Term (1-2 months)',
-                    'goals': recommended_skills[:2] if recommended_skills else ['Build projects', 'Practice coding'],
-                    'actions': ['Online courses', 'Build 1-2 projects', 'Daily practice']
-                },
-                {
-                    'phase': 'Medium Term (3-6 months)',
-                    'goals': recommended_skills[2:4] if len(recommended_skills) > 2 else ['Advanced concepts', 'Contribute to open source'],
-                    'actions': ['Advanced tutorials', 'Contribute to projects', 'Networking']
-                },
-                {
-                    'phase': 'Long Term (6-12 months)',
-                    'goals': ['Job ready', 'Portfolio complete', 'Interview preparation'],
-                    'actions': ['Build portfolio', 'Apply for jobs', 'Mock interviews']
-                }
-            ]
-        }
-        
-        return jsonify(roadmap), 200
+        skill_names = [name.lower() for name in skill_repo.names(user_id)]
+        
+        # Reuse a previous roadmap for the same skill set
+        cache_key = ('roadmap', ROADMAP_VERSION, skill_set_fingerprint(skill_names))
+        roadmap = career_results.get(cache_key)
+        if roadmap is None:
+            roadmap = _build_roadmap(skill_names)
+            career_results.set(cache_key, roadmap, owner=user_id)
         
+        return conditional_response(roadmap, fingerprint(*cache_key))
+    
     except Exception as e:
         return jsonify({'error': str(e)}), 500
+
+
+def _build_roadmap(skill_names):
+    """Build roadmap from the user's lowercased skill names."""
+    # Determine current level based on skills
+    if len(skill_names) < 3:
+        current_level = 'Beginner'
+    elif len(skill_names) < 8:
+        current_level = 'Intermediate'
+    else:
+        current_level = 'Advanced'
+    next_skills = ROADMAP_LEVELS[current_level]
+    
+    # Filter out already learned skills
+    recommended_skills = [s for s in next_skills if s not in skill_names]
+    
+    return {
+        'current_level': current_level,
+        'skills_count': len(skill_names),
+        'recommended_next_steps': recommended_skills[:5],
+        'milestones': [
+            {
+                'phase': 'Short Term (1-2 months)',
+                'goals': recommended_skills[:2] if recommended_skills else ['Build projects', 'Practice coding'],
+                'actions': ['Online courses', 'Build 1-2 projects', 'Daily practice']
+            },
+            {
+                'phase': 'Medium Term (3-6 months)',
+                'goals': recommended_skills[2:4] if len(recommended_skills) > 2 else ['Advanced concepts', 'Contribute to open source'],
+                'actions': ['Advanced tutorials', 'Contribute to projects', 'Networking']
+            },
+            {
+                'phase': 'Long Term (6-12 months)',
+                'goals': ['Job ready', 'Portfolio complete', 'Interview preparation'],
+                'actions': ['Build portfolio', 'Apply for jobs', 'Mock interviews']
+            }
+        ]
+    }
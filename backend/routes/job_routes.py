@@ -1,46 +1,47 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify, current_app, stream_with_context
 from middleware.auth_middleware import token_required, get_current_user_id
-from app import mongo
+from middleware.query_inspector import query_budget
+from repositories import job_repo
 from models.job_application import JobApplication
 from utils.validators import validate_required_fields
-from bson import ObjectId
+from utils.job_vector_store import job_vectors, job_document_text, index_jobs
+from utils.job_matcher import JobMatcher
+from utils.response_cache import invalidate_user
+from utils.batch_ops import parse_batch, apply_batch, batch_response
+from utils.activity_feed import record_activity, forget_activity, job_event, job_update_event, import_event
+from utils import job_transfer
+from utils.job_query import parse_job_query
+from utils.serializers import job_serializer, job_search_serializer
+from config import Config
 from datetime import datetime
+from bson import ObjectId
+from scipy import sparse
+import io
 
 job_bp = Blueprint('job', __name__)
 
+UPDATABLE_FIELDS = ['company', 'position', 'status', 'salary', 'location', 'job_type', 'description', 'notes']
+
 @job_bp.route('/list', methods=['GET'])
 @token_required
+@query_budget(1)
 def list_jobs():
-    """Get all job applications for current user."""
+    """
+    Get job applications for current user, filtered, sorted and searched
+    server-side (see utils/job_query.py for the query parameters).
+    """
     try:
         user_id = get_current_user_id()
         
-        # Get filter from query params
-        status_filter = request.args.get('status', None)
-        
-        query = {'user_id': user_id}
-        if status_filter and status_filter != 'all':
-            query['status'] = status_filter
-        
-        jobs = list(mongo.db.job_applications.find(query).sort('applied_date', -1))
-        
-        job_list = []
-        for job in jobs:
-            job_list.append({
-                'id': str(job['_id']),
-                'company': job['company'],
-                'position': job['position'],
-                'status': job['status'],
-                'applied_date': job['applied_date'].isoformat() if job.get('applied_date') else None,
-                'salary': job.get('salary', ''),
-                'location': job.get('location', ''),
-                'job_type': job.get('job_type', 'Full-time'),
-                'description': job.get('description', ''),
-                'notes': job.get('notes', '')
-            })
+        job_query, error = parse_job_query(request.args, user_id, Config.JOB_LIST_MAX_LIMIT)
+        if error:
+            return jsonify({'error': error}), 400
         
-        return jsonify({'jobs': job_list}), 200
+        jobs = job_repo.search(job_query)
         
+        serializer = job_search_serializer if job_query.search else job_serializer
+        return jsonify({'jobs': serializer.many(jobs)}), 200
+    
     except Exception as e:
         return jsonify({'error': 'Failed to fetch jobs', 'message': str(e)}), 500
 
@@ -58,64 +59,178 @@ def create_job():
             return jsonify({'error': error}), 400
         
         # Create job application
-        job = JobApplication(
-            user_id=user_id,
-            company=data['company'],
-            position=data['position'],
-            status=data.get('status', 'applied'),
-            applied_date=datetime.fromisoformat(data['applied_date']) if data.get('applied_date') else datetime.utcnow(),
-            salary=data.get('salary', ''),
-            location=data.get('location', ''),
-            job_type=data.get('job_type', 'Full-time'),
-            description=data.get('description', ''),
-            notes=data.get('notes', '')
-        )
+        if data.get('applied_date'):
+            data['applied_date'] = datetime.fromisoformat(data['applied_date'])
+        job = _build_job(user_id, data)
+        
+        # Precompute the description vector once, at write time
+        job.description_vector = JobMatcher.vectorize_job(job_document_text(job.to_dict()))['description_vector']
         
-        result = mongo.db.job_applications.insert_one(job.to_dict())
+        job_id = job_repo.create(job.to_dict())
+        _index_job(job_id, user_id, job.description_vector)
+        record_activity([job_event(job.to_dict())])
+        invalidate_user(user_id)
         
         return jsonify({
             'message': 'Job application created successfully',
-            'job': {
-                'id': str(result.inserted_id),
-                'company': job.company,
-                'position': job.position,
-                'status': job.status
-            }
+            'job': job_serializer.subset(['id', 'company', 'position', 'status']).one(
+                dict(job.to_dict(), _id=job_id)
+            )
         }), 201
-        
+    
     except Exception as e:
         return jsonify({'error': 'Failed to create job application', 'message': str(e)}), 500
 
+@job_bp.route('/import', methods=['POST'])
+@token_required
+def import_jobs():
+    """
+    Import job applications from a CSV or NDJSON upload (multipart `file` or
+    raw body). Rows are validated one by one and valid ones inserted in batches.
+    """
+    try:
+        user_id = get_current_user_id()
+        
+        upload = request.files.get('file')
+        fmt = job_transfer.detect_format(
+            request.args.get('format'),
+            upload.filename if upload else None,
+            upload.content_type if upload else request.content_type
+        )
+        if fmt is None:
+            return jsonify({'error': f"Unsupported format. Use one of: {', '.join(job_transfer.MIMETYPES)}"}), 400
+        stream = upload.stream if upload else io.BufferedReader(request.stream)
+        
+        imported, failed, errors = 0, 0, []
+        batch = []
+        
+        def flush():
+            # Vectors are stored with the documents, then the batch is indexed at once
+            for job, features in zip(batch, JobMatcher.vectorize_jobs([job_document_text(job) for job in batch])):
+                job.update(features)
+            job_repo.create_many(batch)
+            try:
+                index_jobs(batch)
+            except Exception as e:
+                current_app.logger.warning('Failed to index %d imported jobs: %s', len(batch), e)
+            batch.clear()
+        
+        for row_number, row, error in job_transfer.read_rows(stream, fmt):
+            error = error or job_transfer.validate_row(row)
+            if error:
+                failed += 1
+                if len(errors) < Config.JOB_IMPORT_MAX_ERRORS:
+                    errors.append({'row': row_number, 'error': error})
+                continue
+            batch.append(_build_job(user_id, row).to_dict())
+            imported += 1
+            if len(batch) >= Config.JOB_IMPORT_BATCH_SIZE:
+                flush()
+        if batch:
+            flush()
+        
+        if imported:
+            record_activity([import_event(user_id, imported, datetime.utcnow())])
+            invalidate_user(user_id)
+        
+        return jsonify({
+            'message': f'Imported {imported} job applications',
+            'imported': imported,
+            'failed': failed,
+            'errors': errors
+        }), 200
+    
+    except Exception as e:
+        return jsonify({'error': 'Failed to import jobs', 'message': str(e)}), 500
+
+@job_bp.route('/export', methods=['GET'])
+@token_required
+def export_jobs():
+    """Stream the user's job applications as CSV (default) or NDJSON."""
+    try:
+        user_id = get_current_user_id()
+        
+        fmt = job_transfer.detect_format(request.args.get('format', 'csv'))
+        if fmt is None:
+            return jsonify({'error': f"Unsupported format. Use one of: {', '.join(job_transfer.MIMETYPES)}"}), 400
+        
+        # Same filters as the job list; exports are never paged
+        job_query, error = parse_job_query(request.args, user_id, Config.JOB_LIST_MAX_LIMIT)
+        if error:
+            return jsonify({'error': error}), 400
+        job_query.limit = job_query.offset = 0
+        
+        cursor = job_repo.iter_search(job_query, projection={name: 1 for name in job_transfer.FIELDS})
+        chunks = job_transfer.write_rows(cursor, fmt, current_app.json.dumps)
+        
+        return Response(stream_with_context(chunks), mimetype=job_transfer.MIMETYPES[fmt], headers={
+            'Content-Disposition': f'attachment; filename=job_applications.{fmt}'
+        })
+    
+    except Exception as e:
+        return jsonify({'error': 'Failed to export jobs', 'message': str(e)}), 500
+
+@job_bp.route('/batch', methods=['POST'])
+@token_required
+def batch_jobs():
+    """
+    Update and delete several job applications in one bulk write.
+    Body: {"update": [{"id": ..., <fields as for PUT>}], "delete": [ids]}.
+    """
+    try:
+        user_id = get_current_user_id()
+        
+        items, error = parse_batch(request.get_json(silent=True), _job_patch, Config.BATCH_MAX_ITEMS)
+        if error:
+            return jsonify({'error': error}), 400
+        
+        updated, deleted = apply_batch(
+            job_repo, user_id, items, {'company': 1, 'position': 1, 'description': 1}, _revectorize
+        )
+        
+        # Derived data is refreshed once for the whole batch
+        reindexed = [item for item in updated if 'description_vector' in item.fields]
+        if reindexed:
+            try:
+                job_vectors.upsert_vectors(
+                    [item.id for item in reindexed],
+                    [user_id] * len(reindexed),
+                    sparse.vstack([JobMatcher.decode_vector(item.fields['description_vector']) for item in reindexed], format='csr')
+                )
+            except Exception as e:
+                current_app.logger.warning('Failed to index %d updated jobs: %s', len(reindexed), e)
+        if deleted:
+            try:
+                job_vectors.remove_many([item.id for item in deleted])
+            except Exception as e:
+                current_app.logger.warning('Failed to remove %d jobs from vector store: %s', len(deleted), e)
+        now = datetime.utcnow()
+        record_activity([job_update_event(user_id, item.document, item.fields, now) for item in updated])
+        if deleted:
+            forget_activity(user_id, [item.id for item in deleted])
+        if updated or deleted:
+            invalidate_user(user_id)
+        
+        return jsonify(batch_response(items)), 200
+    
+    except Exception as e:
+        return jsonify({'error': 'Failed to apply batch', 'message': str(e)}), 500
+
 @job_bp.route('/<job_id>', methods=['GET'])
 @token_required
+@query_budget(1)
 def get_job(job_id):
     """Get specific job application."""
     try:
         user_id = get_current_user_id()
         
-        job = mongo.db.job_applications.find_one({
-            '_id': ObjectId(job_id),
-            'user_id': user_id
-        })
+        job = job_repo.get(job_id, user_id)
         
         if not job:
             return jsonify({'error': 'Job application not found'}), 404
         
-        return jsonify({
-            'job': {
-                'id': str(job['_id']),
-                'company': job['company'],
-                'position': job['position'],
-                'status': job['status'],
-                'applied_date': job['applied_date'].isoformat() if job.get('applied_date') else None,
-                'salary': job.get('salary', ''),
-                'location': job.get('location', ''),
-                'job_type': job.get('job_type', 'Full-time'),
-                'description': job.get('description', ''),
-                'notes': job.get('notes', '')
-            }
-        }), 200
-        
+        return jsonify({'job': job_serializer.one(job)}), 200
+    
     except Exception as e:
         return jsonify({'error': 'Failed to fetch job', 'message': str(e)}), 500
 
@@ -130,24 +245,29 @@ def update_job(job_id):
         # Build update document
         update_data = {'updated_at': datetime.utcnow()}
         
-        allowed_fields = ['company', 'position', 'status', 'salary', 'location', 'job_type', 'description', 'notes']
-        for field in allowed_fields:
+        for field in UPDATABLE_FIELDS:
             if field in data:
                 update_data[field] = data[field]
         
         if 'applied_date' in data:
             update_data['applied_date'] = datetime.fromisoformat(data['applied_date'])
         
-        result = mongo.db.job_applications.update_one(
-            {'_id': ObjectId(job_id), 'user_id': user_id},
-            {'$set': update_data}
-        )
-        
-        if result.matched_count == 0:
+        if not job_repo.update(job_id, user_id, update_data):
             return jsonify({'error': 'Job application not found'}), 404
         
-        return jsonify({'message': 'Job application updated successfully'}), 200
+        job = job_repo.get(job_id, user_id, {'company': 1, 'position': 1, 'description': 1})
+        if job and ('description' in update_data or 'position' in update_data):
+            # Indexed text changed; refresh the stored vector
+            features = JobMatcher.vectorize_job(job_document_text(job))
+            job_repo.set_features({job['_id']: features})
+            _index_job(job['_id'], user_id, features['description_vector'])
+        if job:
+            record_activity([job_update_event(user_id, job, update_data, update_data['updated_at'])])
         
+        invalidate_user(user_id)
+        
+        return jsonify({'message': 'Job application updated successfully'}), 200
+    
     except Exception as e:
         return jsonify({'error': 'Failed to update job', 'message': str(e)}), 500
 
@@ -158,15 +278,68 @@ def delete_job(job_id):
     try:
         user_id = get_current_user_id()
         
-        result = mongo.db.job_applications.delete_one({
-            '_id': ObjectId(job_id),
-            'user_id': user_id
-        })
-        
-        if result.deleted_count == 0:
+        if not job_repo.delete(job_id, user_id):
             return jsonify({'error': 'Job application not found'}), 404
         
-        return jsonify({'message': 'Job application deleted successfully'}), 200
+        try:
+            job_vectors.remove(job_id)
+        except Exception as e:
+            current_app.logger.warning('Failed to remove job %s from vector store: %s', job_id, e)
+        forget_activity(user_id, [ObjectId(job_id)])
         
+        invalidate_user(user_id)
+        
+        return jsonify({'message': 'Job application deleted successfully'}), 200
+    
     except Exception as e:
         return jsonify({'error': 'Failed to delete job', 'message': str(e)}), 500
+
+
+def _build_job(user_id, data):
+    """JobApplication from validated request or import data (applied_date already parsed)."""
+    return JobApplication(
+        user_id=user_id,
+        company=data['company'],
+        position=data['position'],
+        status=data.get('status', 'applied'),
+        applied_date=data.get('applied_date') or datetime.utcnow(),
+        salary=data.get('salary', ''),
+        location=data.get('location', ''),
+        job_type=data.get('job_type', 'Full-time'),
+        description=data.get('description', ''),
+        notes=data.get('notes', '')
+    )
+
+
+def _job_patch(entry):
+    """Fields to $set for one batch update entry, or an error message."""
+    update_data = {'updated_at': datetime.utcnow()}
+    for field in UPDATABLE_FIELDS:
+        if field in entry:
+            update_data[field] = entry[field]
+    
+    if entry.get('applied_date'):
+        try:
+            update_data['applied_date'] = datetime.fromisoformat(entry['applied_date'])
+        except (TypeError, ValueError):
+            return None, 'Invalid applied_date'
+    return update_data, None
+
+
+def _revectorize(items, existing):
+    """Add fresh description vectors to updates that change the indexed text."""
+    changed = [item for item in items if 'description' in item.fields or 'position' in item.fields]
+    if not changed:
+        return
+    texts = [job_document_text(dict(existing[item.id], **item.fields)) for item in changed]
+    for item, features in zip(changed, JobMatcher.vectorize_jobs(texts)):
+        item.fields.update(features)
+
+
+def _index_job(job_id, user_id, stored_vector):
+    """Add a job's precomputed vector to the recommendation vector store."""
+    # The store is derived data; a failed write must not fail the request
+    try:
+        job_vectors.upsert_vectors([job_id], [user_id], JobMatcher.decode_vector(stored_vector))
+    except Exception as e:
+        current_app.logger.warning('Failed to index job %s: %s', job_id, e)
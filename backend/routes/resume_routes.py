@@ -1,10 +1,14 @@
 from flask import Blueprint, request, jsonify
 from werkzeug.utils import secure_filename
 from middleware.auth_middleware import token_required, get_current_user_id
-from app import mongo
+from repositories import resume_repo, skill_repo
 from models.resume import Resume
 from utils.validators import allowed_file
 from utils.resume_analyzer import ResumeAnalyzer
+from utils import resume_revisions
+from utils.response_cache import cached_response, invalidate_user
+from utils.serializers import resume_serializer, resume_summary_serializer
+from utils.activity_feed import record_activity, resume_event, skill_event
 from config import Config
 import os
 
@@ -42,8 +46,29 @@ def upload_resume():
         # Get file size
         file_size = os.path.getsize(file_path)
         
-        # Analyze resume
-        analysis_result = ResumeAnalyzer.analyze_resume(file_path)
+        # Analyze resume; a revision of an earlier upload only re-scores changed sections
+        resume_text = ResumeAnalyzer.extract_text_from_pdf(file_path)
+        previous, matched_by, similarity = None, None, 0
+        old_analysis, old_sections = None, []
+        if resume_text:
+            candidates = resume_repo.recent(
+                {'user_id': user_id}, 'uploaded_at', Config.RESUME_REVISION_CANDIDATES,
+                resume_revisions.REVISION_PROJECTION
+            )
+            previous, matched_by, similarity = resume_revisions.find_previous(
+                candidates, filename, resume_text,
+                Config.RESUME_REVISION_SIMILARITY, Config.RESUME_REVISION_FILENAME_SIMILARITY
+            )
+        if previous:
+            old_analysis, old_sections = resume_revisions.previous_sections(previous)
+        
+        analysis_result, sections = ResumeAnalyzer.analyze_sections(
+            resume_text, {section['hash']: section['features'] for section in old_sections}
+        )
+        delta = resume_revisions.delta_report(
+            previous, matched_by, similarity, old_analysis, old_sections,
+            analysis_result, sections, resume_text, Config.RESUME_DIFF_MAX_LINES
+        ) if previous else None
         
         # Save resume record
         resume = Resume(
@@ -53,41 +78,41 @@ def upload_resume():
             file_size=file_size,
             analysis=analysis_result,
             score=analysis_result.get('score', 0),
-            ats_score=analysis_result.get('atsScore', 0)
+            ats_score=analysis_result.get('atsScore', 0),
+            extracted_text=resume_text,
+            sections=sections,
+            analyzer_version=ResumeAnalyzer.version(),
+            revision_of=previous['_id'] if previous else None,
+            delta=delta
         )
         
-        result = mongo.db.resumes.insert_one(resume.to_dict())
+        resume_id = resume_repo.create(resume.to_dict())
         
-        # Update user's skills based on detected skills
+        # Add detected skills the user does not have yet
         detected_skills = analysis_result.get('skills', {}).get('detected', [])
-        for skill_name in detected_skills:
-            # Check if skill already exists
-            existing_skill = mongo.db.skills.find_one({
-                'user_id': user_id,
-                'name': skill_name
-            })
-            
-            if not existing_skill:
-                # Add new skill
-                mongo.db.skills.insert_one({
-                    'user_id': user_id,
-                    'name': skill_name,
-                    'level': 80,  # Default level for detected skills
-                    'category': 'Technical',
-                    'demand': 'High',
-                    'trend': '+5%'
-                })
+        added_skills = skill_repo.add_missing(user_id, detected_skills, {
+            'level': 80,  # Default level for detected skills
+            'category': 'Technical',
+            'demand': 'High',
+            'trend': '+5%'
+        })
+        
+        record_activity([resume_event(resume.to_dict())] + [skill_event(skill) for skill in added_skills])
+        
+        # Detected skills may have changed the skill set
+        invalidate_user(user_id)
         
         return jsonify({
             'message': 'Resume uploaded and analyzed successfully',
             'resume': {
-                'id': str(result.inserted_id),
+                'id': str(resume_id),
                 'filename': filename,
                 'file_size': file_size,
-                'analysis': analysis_result
+                'analysis': analysis_result,
+                'delta': delta
             }
         }), 201
-        
+    
     except Exception as e:
         return jsonify({'error': 'Failed to upload resume', 'message': str(e)}), 500
 
@@ -98,53 +123,27 @@ def list_resumes():
     try:
         user_id = get_current_user_id()
         
-        resumes = list(mongo.db.resumes.find(
-            {'user_id': user_id}
-        ).sort('uploaded_at', -1))
-        
-        resume_list = []
-        for resume in resumes:
-            resume_list.append({
-                'id': str(resume['_id']),
-                'filename': resume['filename'],
-                'file_size': resume.get('file_size', 0),
-                'score': resume.get('score', 0),
-                'ats_score': resume.get('ats_score', 0),
-                'uploaded_at': resume['uploaded_at'].isoformat() if resume.get('uploaded_at') else None
-            })
-        
-        return jsonify({'resumes': resume_list}), 200
+        resumes = resume_repo.list_for_user(user_id)
         
+        return jsonify({'resumes': resume_summary_serializer.many(resumes)}), 200
+    
     except Exception as e:
         return jsonify({'error': 'Failed to fetch resumes', 'message': str(e)}), 500
 
 @resume_bp.route('/<resume_id>', methods=['GET'])
 @token_required
+@cached_response('resume')
 def get_resume(resume_id):
     """Get specific resume with analysis."""
     try:
-        from bson import ObjectId
         user_id = get_current_user_id()
         
-        resume = mongo.db.resumes.find_one({
-            '_id': ObjectId(resume_id),
-            'user_id': user_id
-        })
+        resume = resume_repo.get(resume_id, user_id)
         
         if not resume:
             return jsonify({'error': 'Resume not found'}), 404
         
-        return jsonify({
-            'resume': {
-                'id': str(resume['_id']),
-                'filename': resume['filename'],
-                'file_size': resume.get('file_size', 0),
-                'score': resume.get('score', 0),
-                'ats_score': resume.get('ats_score', 0),
-                'analysis': resume.get('analysis', {}),
-                'uploaded_at': resume['uploaded_at'].isoformat() if resume.get('uploaded_at') else None
-            }
-        }), 200
-        
+        return jsonify({'resume': resume_serializer.one(resume)}), 200
+    
     except Exception as e:
         return jsonify({'error': 'Failed to fetch resume', 'message': str(e)}), 500
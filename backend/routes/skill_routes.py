@@ -1,15 +1,24 @@
 from flask import Blueprint, request, jsonify
 from middleware.auth_middleware import token_required, get_current_user_id
-from app import mongo
+from middleware.query_inspector import query_budget
+from repositories import skill_repo
 from models.skill import Skill
 from utils.validators import validate_required_fields
-from bson import ObjectId
+from utils.response_cache import cached_response, invalidate_user
+from utils.serializers import skill_serializer
+from utils.activity_feed import record_activity, forget_activity, skill_event, skill_update_event
+from utils.batch_ops import parse_batch, apply_batch, batch_response
+from config import Config
 from datetime import datetime
+from bson import ObjectId
 
 skill_bp = Blueprint('skill', __name__)
 
+UPDATABLE_FIELDS = ['name', 'level', 'category', 'demand', 'trend']
+
 @skill_bp.route('/list', methods=['GET'])
 @token_required
+@query_budget(1)
 def list_skills():
     """Get all skills for current user."""
     try:
@@ -18,25 +27,10 @@ def list_skills():
         # Get category filter from query params
         category_filter = request.args.get('category', None)
         
-        query = {'user_id': user_id}
-        if category_filter:
-            query['category'] = category_filter
-        
-        skills = list(mongo.db.skills.find(query).sort('level', -1))
-        
-        skill_list = []
-        for skill in skills:
-            skill_list.append({
-                'id': str(skill['_id']),
-                'name': skill['name'],
-                'level': skill['level'],
-                'category': skill.get('category', 'Technical'),
-                'demand': skill.get('demand', 'Medium'),
-                'trend': skill.get('trend', '+0%')
-            })
-        
-        return jsonify({'skills': skill_list}), 200
+        skills = skill_repo.list_for_user(user_id, category=category_filter)
         
+        return jsonify({'skills': skill_serializer.many(skills)}), 200
+    
     except Exception as e:
         return jsonify({'error': 'Failed to fetch skills', 'message': str(e)}), 500
 
@@ -58,12 +52,7 @@ def create_skill():
             return jsonify({'error': 'Skill level must be between 0 and 100'}), 400
         
         # Check if skill already exists for user
-        existing_skill = mongo.db.skills.find_one({
-            'user_id': user_id,
-            'name': data['name']
-        })
-        
-        if existing_skill:
+        if skill_repo.exists(user_id, data['name']):
             return jsonify({'error': 'Skill already exists'}), 409
         
         # Create skill
@@ -76,47 +65,64 @@ def create_skill():
             trend=data.get('trend', '+0%')
         )
         
-        result = mongo.db.skills.insert_one(skill.to_dict())
+        skill_id = skill_repo.create(skill.to_dict())
+        record_activity([skill_event(skill.to_dict())])
+        
+        # Skill set changed, drop memoized career results for this user
+        invalidate_user(user_id)
         
         return jsonify({
             'message': 'Skill created successfully',
-            'skill': {
-                'id': str(result.inserted_id),
-                'name': skill.name,
-                'level': skill.level,
-                'category': skill.category
-            }
+            'skill': skill_serializer.subset(['id', 'name', 'level', 'category']).one(
+                dict(skill.to_dict(), _id=skill_id)
+            )
         }), 201
-        
+    
     except Exception as e:
         return jsonify({'error': 'Failed to create skill', 'message': str(e)}), 500
 
+@skill_bp.route('/batch', methods=['POST'])
+@token_required
+def batch_skills():
+    """
+    Update and delete several skills in one bulk write.
+    Body: {"update": [{"id": ..., <fields as for PUT>}], "delete": [ids]}.
+    """
+    try:
+        user_id = get_current_user_id()
+        
+        items, error = parse_batch(request.get_json(silent=True), _skill_patch, Config.BATCH_MAX_ITEMS)
+        if error:
+            return jsonify({'error': error}), 400
+        
+        updated, deleted = apply_batch(skill_repo, user_id, items, {'name': 1})
+        now = datetime.utcnow()
+        record_activity([skill_update_event(user_id, item.document, item.fields, now) for item in updated])
+        if deleted:
+            forget_activity(user_id, [item.id for item in deleted])
+        if updated or deleted:
+            invalidate_user(user_id)
+        
+        return jsonify(batch_response(items)), 200
+    
+    except Exception as e:
+        return jsonify({'error': 'Failed to apply batch', 'message': str(e)}), 500
+
 @skill_bp.route('/<skill_id>', methods=['GET'])
 @token_required
+@query_budget(1)
 def get_skill(skill_id):
     """Get specific skill."""
     try:
         user_id = get_current_user_id()
         
-        skill = mongo.db.skills.find_one({
-            '_id': ObjectId(skill_id),
-            'user_id': user_id
-        })
+        skill = skill_repo.get(skill_id, user_id)
         
         if not skill:
             return jsonify({'error': 'Skill not found'}), 404
         
-        return jsonify({
-            'skill': {
-                'id': str(skill['_id']),
-                'name': skill['name'],
-                'level': skill['level'],
-                'category': skill.get('category', 'Technical'),
-                'demand': skill.get('demand', 'Medium'),
-                'trend': skill.get('trend', '+0%')
-            }
-        }), 200
-        
+        return jsonify({'skill': skill_serializer.one(skill)}), 200
+    
     except Exception as e:
         return jsonify({'error': 'Failed to fetch skill', 'message': str(e)}), 500
 
@@ -135,21 +141,21 @@ def update_skill(skill_id):
         # Build update document
         update_data = {'updated_at': datetime.utcnow()}
         
-        allowed_fields = ['name', 'level', 'category', 'demand', 'trend']
-        for field in allowed_fields:
+        for field in UPDATABLE_FIELDS:
             if field in data:
                 update_data[field] = data[field]
         
-        result = mongo.db.skills.update_one(
-            {'_id': ObjectId(skill_id), 'user_id': user_id},
-            {'$set': update_data}
-        )
-        
-        if result.matched_count == 0:
+        if not skill_repo.update(skill_id, user_id, update_data):
             return jsonify({'error': 'Skill not found'}), 404
         
-        return jsonify({'message': 'Skill updated successfully'}), 200
+        skill = skill_repo.get(skill_id, user_id, {'name': 1})
+        if skill:
+            record_activity([skill_update_event(user_id, skill, update_data, update_data['updated_at'])])
         
+        invalidate_user(user_id)
+        
+        return jsonify({'message': 'Skill updated successfully'}), 200
+    
     except Exception as e:
         return jsonify({'error': 'Failed to update skill', 'message': str(e)}), 500
 
@@ -160,28 +166,28 @@ def delete_skill(skill_id):
     try:
         user_id = get_current_user_id()
         
-        result = mongo.db.skills.delete_one({
-            '_id': ObjectId(skill_id),
-            'user_id': user_id
-        })
-        
-        if result.deleted_count == 0:
+        if not skill_repo.delete(skill_id, user_id):
             return jsonify({'error': 'Skill not found'}), 404
         
-        return jsonify({'message': 'Skill deleted successfully'}), 200
+        forget_activity(user_id, [ObjectId(skill_id)])
+        invalidate_user(user_id)
         
+        return jsonify({'message': 'Skill deleted successfully'}), 200
+    
     except Exception as e:
         return jsonify({'error': 'Failed to delete skill', 'message': str(e)}), 500
 
 @skill_bp.route('/stats', methods=['GET'])
 @token_required
+@query_budget(2)  # stats + cache generation
+@cached_response('skill-stats')
 def get_skill_stats():
     """Get skill statistics and analysis."""
     try:
         user_id = get_current_user_id()
         
         # Get all skills
-        skills = list(mongo.db.skills.find({'user_id': user_id}))
+        skills = skill_repo.list_for_user(user_id, projection={'name': 1, 'level': 1, 'category': 1})
         
         if not skills:
             return jsonify({
@@ -220,6 +226,19 @@ def get_skill_stats():
                 for k, v in category_count.items()
             ]
         }), 200
-        
+    
     except Exception as e:
         return jsonify({'error': 'Failed to fetch skill stats', 'message': str(e)}), 500
+
+
+def _skill_patch(entry):
+    """Fields to $set for one batch update entry, or an error message."""
+    level = entry.get('level')
+    if 'level' in entry and not (isinstance(level, (int, float)) and 0 <= level <= 100):
+        return None, 'Skill level must be between 0 and 100'
+    
+    update_data = {'updated_at': datetime.utcnow()}
+    for field in UPDATABLE_FIELDS:
+        if field in entry:
+            update_data[field] = entry[field]
+    return update_data, None
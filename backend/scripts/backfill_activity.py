@@ -0,0 +1,56 @@
+"""
+Backfill the activity collection from existing job applications, resumes and skills.
+Events already recorded (same source document) are skipped, so the script can
+be re-run safely. With ACTIVITY_TTL_DAYS set, events older than the TTL are
+not written.
+
+Usage (from backend/):
+    python scripts/backfill_activity.py [--batch-size 1000]
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from config import Config
+from repositories import activity_repo, job_repo, resume_repo, skill_repo
+from utils.activity_feed import job_event, resume_event, skill_event
+
+SOURCES = [
+    (job_repo, job_event, {'user_id': 1, 'company': 1, 'position': 1, 'created_at': 1}),
+    (resume_repo, resume_event, {'user_id': 1, 'filename': 1, 'uploaded_at': 1}),
+    (skill_repo, skill_event, {'user_id': 1, 'name': 1, 'created_at': 1})
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Backfill the activity collection.')
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+    
+    cutoff = datetime.utcnow() - timedelta(days=Config.ACTIVITY_TTL_DAYS) if Config.ACTIVITY_TTL_DAYS else None
+    
+    app = create_app()
+    with app.app_context():
+        activity_repo.ensure_indexes()
+        for repo, make_event, projection in SOURCES:
+            seen = written = 0
+            batch = []
+            for document in repo.collection.find({}, projection).batch_size(args.batch_size):
+                seen += 1
+                event = make_event(document)
+                if cutoff is None or event['time'] >= cutoff:
+                    batch.append(event)
+                if len(batch) >= args.batch_size:
+                    written += activity_repo.append(batch, ignore_duplicates=True)
+                    batch = []
+            written += activity_repo.append(batch, ignore_duplicates=True)
+            print(f"{repo.collection_name}: {seen} documents, {written} new events")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+Rebuild the job-description vector store from MongoDB, or only compact it.
+Job documents missing a precomputed description vector get one stored.
+
+Usage (from backend/):
+    python scripts/build_job_index.py [--compact-only]
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from repositories import job_repo
+from utils.job_vector_store import job_vectors, index_jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rebuild or compact the job vector store.')
+    parser.add_argument('--compact-only', action='store_true', help='merge segments without rebuilding')
+    args = parser.parse_args()
+    
+    app = create_app()
+    with app.app_context():
+        if args.compact_only:
+            job_vectors.compact()
+            print(f"Compacted {job_vectors.count()} job descriptions in {job_vectors.path}")
+            return
+        
+        job_vectors.clear()
+        computed = index_jobs(job_repo.iter_for_matching())
+        if computed:
+            job_repo.set_features(computed)
+            print(f"Stored description vectors for {len(computed)} job applications")
+        job_vectors.compact()
+        print(f"Indexed {job_vectors.count()} job descriptions into {job_vectors.path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,26 @@
+"""
+Create the MongoDB indexes declared by the repositories.
+Safe to re-run: existing indexes with the same definition are left alone.
+
+Usage (from backend/):
+    python scripts/create_indexes.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from repositories import ensure_indexes
+
+
+def main():
+    app = create_app()
+    with app.app_context():
+        for collection, names in ensure_indexes().items():
+            print(f"{collection}: {', '.join(names)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Re-analyze stored resumes whose analysis came from an older ResumeAnalyzer.
+Resumes are read in _id order in batches and analyzed across a process pool,
+reusing their stored extracted text (the PDF is only read for resumes uploaded
+before the text was kept). Each batch is written before the next is read, and
+written resumes carry the current version, so an interrupted run continues
+where it stopped when started again. Resumes without readable text are marked
+with the current version and an analysis_error so they are not retried until
+the analyzer changes again.
+
+Usage (from backend/):
+    python scripts/reanalyze_resumes.py [--batch-size 200] [--workers 4] [--dry-run]
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from repositories import resume_repo
+from utils.resume_analyzer import ResumeAnalyzer, reanalyze_resume
+from utils.response_cache import invalidate_user
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Re-analyze resumes with stale analyzer versions.')
+    parser.add_argument('--batch-size', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--dry-run', action='store_true', help='only count stale resumes')
+    args = parser.parse_args()
+    
+    version = ResumeAnalyzer.version()
+    
+    app = create_app()
+    with app.app_context():
+        resume_repo.ensure_indexes()
+        total = resume_repo.count_stale(version)
+        print(f"{total} resumes to re-analyze with analyzer {version}")
+        if not total or args.dry_run:
+            return
+        
+        done = updated = unreadable = 0
+        after_id = None
+        started = time.monotonic()
+        # Workers are spawned so they do not inherit the MongoDB client
+        with ProcessPoolExecutor(args.workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+            while True:
+                batch = resume_repo.stale_batch(version, after_id, args.batch_size)
+                if not batch:
+                    break
+                after_id = batch[-1]['_id']
+                
+                chunksize = max(1, len(batch) // (args.workers * 4))
+                results = list(pool.map(reanalyze_resume, batch, chunksize=chunksize))
+                analyzed = [result for result in results if result[2] is not None]
+                analyzed_at = datetime.utcnow()
+                resume_repo.set_analyses(analyzed, version, analyzed_at)
+                resume_repo.mark_unreadable([result[0] for result in results if result[2] is None],
+                                            version, analyzed_at, 'No readable text')
+                for user_id in {resume['user_id'] for resume in batch}:
+                    invalidate_user(user_id)
+                
+                done += len(batch)
+                updated += len(analyzed)
+                unreadable += len(batch) - len(analyzed)
+                elapsed = time.monotonic() - started
+                rate = done / elapsed if elapsed else 0
+                remaining = max(total - done, 0) / rate if rate else 0
+                print(f"{done}/{total} ({done * 100 // total}%)  {rate:.1f} resumes/s  ~{remaining:.0f}s left")
+        
+        print(f"Re-analyzed {updated} resumes in {time.monotonic() - started:.1f}s; "
+              f"{unreadable} without readable text were marked with analysis_error")
+
+
+if __name__ == '__main__':
+    main()
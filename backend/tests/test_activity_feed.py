@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta
+from bson import ObjectId
+from repositories import activity_repo
+from utils import activity_feed
+from utils.activity_feed import job_event, job_update_event, skill_update_event, encode_cursor, decode_cursor
+import mongomock
+import pytest
+
+USER = ObjectId()
+NOW = datetime(2024, 3, 1, 12)
+
+
+@pytest.fixture
+def repo():
+    activity_repo.bind(mongomock.MongoClient().db)
+    yield activity_repo
+    activity_repo.bind(None)
+
+
+def job(**fields):
+    return dict({'_id': ObjectId(), 'user_id': USER, 'company': 'Acme', 'position': 'Engineer'}, **fields)
+
+
+def test_job_update_events():
+    stored = job()
+    moved = job_update_event(USER, stored, {'status': 'interview', 'updated_at': NOW}, NOW)
+    assert moved['action'] == 'Moved Acme - Engineer to interview'
+    assert (moved['type'], moved['source'], moved['time']) == ('job_update', stored['_id'], NOW)
+    assert 'ref' not in moved
+    
+    renamed = job_update_event(USER, stored, {'position': 'Lead'}, NOW)
+    assert renamed['action'] == 'Updated Acme - Lead'
+    # Bookkeeping-only edits are not shown
+    assert job_update_event(USER, stored, {'updated_at': NOW, 'description_vector': {}}, NOW) is None
+
+
+def test_skill_update_events():
+    skill = {'_id': ObjectId(), 'user_id': USER, 'name': 'python'}
+    assert skill_update_event(USER, skill, {'level': 80}, NOW)['action'] == 'Updated skill: python (80%)'
+    assert skill_update_event(USER, skill, {'name': 'go'}, NOW)['action'] == 'Updated skill: go'
+    assert skill_update_event(USER, skill, {'updated_at': NOW}, NOW) is None
+
+
+def test_forget_activity_removes_creation_and_edit_events(repo):
+    deleted, kept = job(created_at=NOW), job(created_at=NOW)
+    repo.append([
+        job_event(deleted),
+        job_update_event(USER, deleted, {'status': 'offer'}, NOW + timedelta(hours=1)),
+        job_event(kept)
+    ])
+    activity_feed.forget_activity(USER, [deleted['_id']])
+    assert [entry['ref'] for entry in repo.collection.find()] == [kept['_id']]
+
+
+def test_cursor_pages(repo):
+    repo.append([job_event(job(created_at=NOW - timedelta(minutes=i))) for i in range(5)])
+    first = repo.page(USER, 2)
+    cursor = encode_cursor(first[-1])
+    second = repo.page(USER, 10, decode_cursor(cursor))
+    assert len(second) == 3
+    assert max(entry['time'] for entry in second) < min(entry['time'] for entry in first)
+    with pytest.raises(ValueError):
+        decode_cursor('garbage')
@@ -0,0 +1,93 @@
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+from repositories import skill_repo
+from utils.batch_ops import parse_batch, apply_batch, batch_response
+import mongomock
+import pytest
+
+USER = ObjectId()
+
+
+def clean_patch(entry):
+    if 'level' in entry and not isinstance(entry['level'], int):
+        return None, 'level must be an integer'
+    return {key: value for key, value in entry.items() if key != 'id'}, None
+
+
+@pytest.fixture
+def repo():
+    skill_repo.bind(mongomock.MongoClient().db)
+    yield skill_repo
+    skill_repo.bind(None)
+
+
+def add_skill(repo, name, user_id=USER):
+    return repo.collection.insert_one({'user_id': user_id, 'name': name, 'level': 10}).inserted_id
+
+
+def test_parse_batch_rejects_malformed_requests():
+    assert parse_batch([], clean_patch, 10) == (None, 'Expected a JSON object with "update" and/or "delete" lists')
+    assert parse_batch({'update': {'id': 'x'}}, clean_patch, 10) == (None, '"update" and "delete" must be lists')
+    assert parse_batch({}, clean_patch, 10) == (None, 'Nothing to do: "update" and "delete" are empty')
+    assert parse_batch({'delete': ['a'] * 3}, clean_patch, 2) == (None, 'At most 2 operations per batch')
+
+
+def test_parse_batch_marks_invalid_items():
+    duplicate = str(ObjectId())
+    items, error = parse_batch({
+        'update': [
+            'not an object',
+            {'id': 'bad'},
+            {'id': str(ObjectId()), 'level': 'high'},
+            {'id': duplicate, 'level': 50}
+        ],
+        'delete': [duplicate, str(ObjectId())]
+    }, clean_patch, 10)
+    assert error is None
+    assert [(item.status, item.error) for item in items] == [
+        ('invalid', 'Expected an object with an "id"'),
+        ('invalid', 'Invalid id'),
+        ('invalid', 'level must be an integer'),
+        ('invalid', 'Id appears more than once in the batch'),
+        ('invalid', 'Id appears more than once in the batch'),
+        (None, None)
+    ]
+
+
+def test_apply_batch(repo):
+    kept, removed, other_users = add_skill(repo, 'python'), add_skill(repo, 'java'), add_skill(repo, 'go', ObjectId())
+    items, _ = parse_batch({
+        'update': [{'id': str(kept), 'level': 80}, {'id': str(other_users), 'level': 1}],
+        'delete': [str(removed), str(ObjectId())]
+    }, clean_patch, 10)
+    
+    updated, deleted = apply_batch(repo, USER, items, {'name': 1})
+    assert [item.document['name'] for item in updated] == ['python']
+    assert [item.document['name'] for item in deleted] == ['java']
+    assert batch_response(items) == {
+        'results': [
+            {'id': str(kept), 'op': 'update', 'status': 'updated'},
+            {'id': str(other_users), 'op': 'update', 'status': 'not_found', 'error': 'Not found'},
+            {'id': str(removed), 'op': 'delete', 'status': 'deleted'},
+            {'id': items[3].raw_id, 'op': 'delete', 'status': 'not_found', 'error': 'Not found'}
+        ],
+        'updated': 1,
+        'deleted': 1,
+        'failed': 2
+    }
+    assert repo.collection.find_one({'_id': kept})['level'] == 80
+    assert repo.collection.find_one({'_id': removed}) is None
+    assert repo.collection.find_one({'_id': other_users})['level'] == 10
+
+
+def test_apply_batch_reports_rejected_writes(repo, monkeypatch):
+    first, second = add_skill(repo, 'python'), add_skill(repo, 'java')
+    
+    def reject_first(user_id, updates, deletes):
+        raise BulkWriteError({'writeErrors': [{'index': 0, 'errmsg': 'Document failed validation'}]})
+    monkeypatch.setattr(repo, 'bulk_apply', reject_first)
+    
+    items, _ = parse_batch({'update': [{'id': str(first), 'level': 500}], 'delete': [str(second)]}, clean_patch, 10)
+    updated, deleted = apply_batch(repo, USER, items)
+    assert updated == [] and deleted == items[1:]
+    assert [(item.status, item.error) for item in items] == [('error', 'Document failed validation'), ('deleted', None)]
@@ -0,0 +1,63 @@
+from datetime import datetime, time
+from pymongo import ASCENDING, DESCENDING
+from utils.job_query import parse_job_query, TEXT_SCORE
+
+USER = 'user-1'
+
+
+def parse(**args):
+    return parse_job_query(args, USER, max_limit=100)
+
+
+def test_defaults():
+    query, error = parse()
+    assert error is None
+    assert query.filter == {'user_id': USER}
+    assert query.sort == [('applied_date', DESCENDING), ('_id', DESCENDING)]
+    assert query.search is None
+    assert (query.limit, query.offset) == (0, 0)
+
+
+def test_exact_and_multi_value_filters():
+    query, _ = parse(status='interview, offer', company=' Acme ', location='all', job_type='')
+    assert query.filter == {'user_id': USER, 'status': {'$in': ['interview', 'offer']}, 'company': 'Acme'}
+
+
+def test_date_ranges():
+    query, _ = parse(applied_from='2024-01-01', applied_to='2024-01-31', created_to='2024-02-01T12:00:00')
+    assert query.filter['applied_date'] == {
+        '$gte': datetime(2024, 1, 1),
+        '$lte': datetime.combine(datetime(2024, 1, 31).date(), time.max)
+    }
+    # A bound with a time is used as given
+    assert query.filter['created_at'] == {'$lte': datetime(2024, 2, 1, 12)}
+    
+    assert parse(applied_from='last week') == (None, 'Invalid applied_from: expected an ISO 8601 date')
+
+
+def test_text_search_ranks_by_relevance():
+    query, _ = parse(q=' python ')
+    assert query.filter['$text'] == {'$search': 'python'}
+    assert query.sort == [('score', TEXT_SCORE), ('_id', DESCENDING)]
+    assert query.projection({'company': 1}) == {'company': 1, 'score': TEXT_SCORE}
+    
+    query, _ = parse(q='python', sort='company')
+    assert query.sort == [('company', ASCENDING), ('_id', ASCENDING)]
+    
+    assert parse(sort='relevance') == (None, 'sort=relevance requires q')
+
+
+def test_sort():
+    query, _ = parse(sort='-updated_at')
+    assert query.sort == [('updated_at', DESCENDING), ('_id', DESCENDING)]
+    assert query.projection({'company': 1}) == {'company': 1}
+    
+    query, error = parse(sort='salary')
+    assert query is None and error.startswith('Invalid sort')
+
+
+def test_paging():
+    query, _ = parse(limit='500', offset='20')
+    assert (query.limit, query.offset) == (100, 20)
+    assert parse(limit='ten') == (None, 'limit and offset must be integers')
+    assert parse(offset='-1') == (None, 'limit and offset must not be negative')
@@ -0,0 +1,94 @@
+from datetime import datetime
+from utils.job_transfer import read_rows, validate_row, write_rows, detect_format
+import csv
+import io
+import json
+
+
+def rows(data, fmt):
+    return list(read_rows(io.BytesIO(data), fmt))
+
+
+def test_read_csv_rows():
+    data = (
+        b'\xef\xbb\xbfcompany, position ,status,unknown\n'
+        b'Acme,Engineer,applied,x\n'
+        b'\n'
+        b'"Globex, Inc","Data\nScientist", ,y\n'
+    )
+    assert rows(data, 'csv') == [
+        (2, {'company': 'Acme', 'position': 'Engineer', 'status': 'applied'}, None),
+        (3, {'company': 'Globex, Inc', 'position': 'Data\nScientist'}, None)
+    ]
+
+
+def test_read_csv_reports_undecodable_and_malformed_records():
+    data = (
+        b'company,position\n'
+        b'Acme,Engineer\n'
+        b'Bad\xff,Byte\n'
+        b'Huge,' + b'x' * (csv.field_size_limit() + 1) + b'\n'
+        b'Initech,Tester\n'
+    )
+    result = rows(data, 'csv')
+    assert result[0] == (2, {'company': 'Acme', 'position': 'Engineer'}, None)
+    assert result[1] == (3, None, 'Invalid UTF-8')
+    assert result[2][0] == 4 and result[2][2].startswith('Invalid CSV')
+    assert result[3] == (5, {'company': 'Initech', 'position': 'Tester'}, None)
+
+
+def test_read_empty_csv():
+    assert rows(b'', 'csv') == []
+
+
+def test_read_ndjson_rows():
+    data = (
+        b'{"company": "Acme", "position": "Engineer", "notes": "", "extra": 1}\n'
+        b'\n'
+        b'{"company": \n'
+        b'[1, 2]\n'
+        b'{"company": "Bad\xff"}\n'
+        b'{"company": "Initech", "salary": null}\n'
+    )
+    result = rows(data, 'ndjson')
+    assert result[0] == (1, {'company': 'Acme', 'position': 'Engineer'}, None)
+    assert result[1][0] == 3 and result[1][2].startswith('Invalid JSON')
+    assert result[2] == (4, None, 'Expected a JSON object')
+    assert result[3] == (5, None, 'Invalid UTF-8')
+    assert result[4] == (6, {'company': 'Initech'}, None)
+
+
+def test_validate_row_accepts_and_converts_dates():
+    row = {'company': 'Acme', 'position': 'Engineer', 'status': 'offer', 'applied_date': ' 2024-03-01 '}
+    assert validate_row(row) is None
+    assert row['applied_date'] == datetime(2024, 3, 1)
+
+
+def test_validate_row_errors():
+    assert validate_row({'company': 'Acme'}) == 'Missing required fields: position'
+    assert validate_row({'company': ' ', 'position': ''}) == 'Missing required fields: company, position'
+    assert validate_row({'company': 'Acme', 'position': 'Dev', 'status': 'hired'}) == 'Invalid status: hired'
+    assert validate_row({'company': 'Acme', 'position': 'Dev', 'applied_date': 'yesterday'}) == \
+        'Invalid applied_date: yesterday'
+    assert validate_row({'company': 'Acme', 'position': 5, 'salary': {'min': 1}}) == \
+        'Expected text for fields: position, salary'
+
+
+def test_write_rows_round_trips():
+    documents = [
+        {'company': 'Acme', 'position': 'Engineer', 'status': 'applied', 'applied_date': datetime(2024, 3, 1)},
+        {'company': 'Globex', 'position': 'Analyst', 'status': 'offer', 'notes': 'a, "quoted" note'}
+    ]
+    exported = ''.join(write_rows(documents, 'csv', json.dumps, chunk_rows=1)).encode()
+    imported = [row for _, row, _ in rows(exported, 'csv')]
+    assert imported[0]['applied_date'] == '2024-03-01T00:00:00'
+    assert imported[1]['notes'] == 'a, "quoted" note'
+    assert [validate_row(row) for row in imported] == [None, None]
+
+
+def test_detect_format():
+    assert detect_format('CSV') == 'csv'
+    assert detect_format('xml') is None
+    assert detect_format(filename='jobs.jsonl') == 'ndjson'
+    assert detect_format(content_type='text/csv; charset=utf-8') == 'csv'
+    assert detect_format(filename='jobs.txt') is None
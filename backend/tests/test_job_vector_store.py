@@ -0,0 +1,98 @@
+from config import Config
+from utils.job_vector_store import JobVectorStore
+import threading
+import pytest
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JobVectorStore(str(tmp_path / 'vectors'), Config.MATCHER_HASH_FEATURES)
+
+
+def ids(results):
+    return [job_id for job_id, _ in results]
+
+
+def test_search_ranks_by_similarity(store):
+    store.upsert_many([
+        ('1', 'alice', 'python flask backend engineer'),
+        ('2', 'alice', 'react frontend javascript developer'),
+        ('3', 'alice', 'accountant excel spreadsheets')
+    ])
+    results = store.search('python backend developer', k=10)
+    assert ids(results)[0] == '1'
+    assert '3' not in ids(results)
+    assert all(a[1] >= b[1] for a, b in zip(results, results[1:]))
+
+
+def test_search_is_limited_to_owner(store):
+    store.upsert('1', 'alice', 'python backend engineer')
+    store.upsert('2', 'bob', 'python backend engineer')
+    assert ids(store.search('python backend', owner_id='alice')) == ['1']
+    assert ids(store.search('python backend', owner_id='bob')) == ['2']
+    assert ids(store.search('python backend', owner_id='carol')) == []
+    assert store.count('alice') == 1
+    assert store.count() == 2
+
+
+def test_upsert_replaces_previous_vector(store):
+    store.upsert('1', 'alice', 'python backend engineer')
+    store.upsert('1', 'alice', 'react frontend developer')
+    assert store.count() == 1
+    assert ids(store.search('python backend')) == []
+    assert ids(store.search('react frontend')) == ['1']
+
+
+def test_remove(store):
+    store.upsert_many([('1', 'alice', 'python backend'), ('2', 'alice', 'python data')])
+    store.remove('1')
+    assert ids(store.search('python')) == ['2']
+    assert store.count('alice') == 1
+    store.remove_many(['2'])
+    assert store.count() == 0
+
+
+def test_compact_keeps_live_rows_only(store):
+    store.upsert_many([('1', 'alice', 'python backend'), ('2', 'bob', 'python data')])
+    store.upsert('1', 'alice', 'go backend')
+    store.remove('2')
+    store.upsert('3', 'bob', 'python data engineer')
+    before = store.search('python go backend data')
+    
+    assert store.compact()
+    manifest = store._current_manifest()
+    assert len(manifest['segments']) == 1
+    assert manifest['superseded'] == {}
+    assert store.search('python go backend data') == before
+    assert store.count('alice') == 1 and store.count('bob') == 1
+
+
+def test_writes_after_compaction_supersede_merged_rows(store):
+    store.upsert('1', 'alice', 'python backend')
+    store.compact()
+    store.upsert('1', 'alice', 'react frontend')
+    store.remove('1')
+    assert store.count() == 0
+    assert store.compact()
+    assert store.count() == 0
+
+
+def test_changes_are_visible_to_other_instances(store):
+    store.upsert('1', 'alice', 'python backend')
+    other = JobVectorStore(store.path, Config.MATCHER_HASH_FEATURES)
+    assert ids(other.search('python')) == ['1']
+    other.compact()
+    store.upsert('2', 'alice', 'python data')
+    assert sorted(ids(store.search('python'))) == ['1', '2']
+    assert sorted(ids(other.search('python'))) == ['1', '2']
+
+
+def test_many_segments_are_compacted_in_background(tmp_path):
+    store = JobVectorStore(str(tmp_path / 'vectors'), Config.MATCHER_HASH_FEATURES, max_segments=2)
+    for i in range(4):
+        store.upsert(str(i), 'alice', f'python job {i}')
+    for thread in threading.enumerate():
+        if thread.name == 'job-vector-compaction':
+            thread.join()
+    assert len(store._current_manifest()['segments']) <= 2
+    assert store.count('alice') == 4
@@ -0,0 +1,62 @@
+from bson import ObjectId
+from flask import Flask, jsonify
+from repositories import cache_generation_repo
+from utils import response_cache
+from utils.response_cache import MemoryBackend, cached_response, invalidate_user
+import mongomock
+import pytest
+
+USER = ObjectId()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    cache_generation_repo.bind(mongomock.MongoClient().db)
+    monkeypatch.setattr(response_cache, 'get_current_user_id', lambda: USER)
+    monkeypatch.setattr(response_cache, 'response_cache', MemoryBackend())
+    
+    app = Flask(__name__)
+    app.calls = 0
+    
+    @app.route('/items')
+    @cached_response('items')
+    def items():
+        app.calls += 1
+        return jsonify({'calls': app.calls})
+    
+    yield app.test_client()
+    cache_generation_repo.bind(None)
+
+
+def test_responses_are_cached_with_etags(client):
+    first = client.get('/items')
+    assert client.get('/items').get_json() == first.get_json() == {'calls': 1}
+    assert client.get('/items', headers={'If-None-Match': first.headers['ETag']}).status_code == 304
+    assert client.get('/items?page=2').get_json() == {'calls': 2}
+
+
+def test_invalidation_reaches_other_workers(client, monkeypatch):
+    # Each worker has its own memory cache; only the generation is shared
+    worker_a, worker_b = response_cache.response_cache, MemoryBackend()
+    assert client.get('/items').get_json() == {'calls': 1}
+    monkeypatch.setattr(response_cache, 'response_cache', worker_b)
+    assert client.get('/items').get_json() == {'calls': 2}
+    assert client.get('/items').get_json() == {'calls': 2}
+    
+    monkeypatch.setattr(response_cache, 'response_cache', worker_a)
+    invalidate_user(USER)
+    assert client.get('/items').get_json() == {'calls': 3}
+    monkeypatch.setattr(response_cache, 'response_cache', worker_b)
+    assert client.get('/items').get_json() == {'calls': 4}
+
+
+def test_generation_counter():
+    cache_generation_repo.bind(mongomock.MongoClient().db)
+    try:
+        assert cache_generation_repo.generation('alice') == 0
+        assert cache_generation_repo.bump('alice') == 1
+        assert cache_generation_repo.bump('alice') == 2
+        assert cache_generation_repo.generation('alice') == 2
+        assert cache_generation_repo.generation('bob') == 0
+    finally:
+        cache_generation_repo.bind(None)
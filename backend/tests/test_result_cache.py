@@ -0,0 +1,42 @@
+from utils.result_cache import LRUCache, fingerprint, skill_set_fingerprint
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LRUCache(max_size=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    assert cache.get('b') is None
+    assert (cache.get('a'), cache.get('c'), len(cache)) == (1, 3, 2)
+
+
+def test_invalidate_owner():
+    cache = LRUCache()
+    cache.set('a', 1, owner='alice')
+    cache.set('b', 2, owner='alice')
+    cache.set('c', 3, owner='bob')
+    cache.set('d', 4)
+    cache.invalidate_owner('alice')
+    assert [cache.get(key) for key in 'abcd'] == [None, None, 3, 4]
+
+
+def test_owner_bookkeeping_follows_entries():
+    cache = LRUCache(max_size=2)
+    cache.set('a', 1, owner='alice')
+    cache.set('b', 2, owner='bob')
+    # Re-owned, deleted and evicted keys leave no owner entries behind
+    cache.set('a', 1, owner='bob')
+    cache.delete('b')
+    cache.set('c', 3)
+    cache.set('d', 4)
+    assert cache._owners == {} and cache._key_owners == {}
+    
+    cache.set('e', 5, owner='alice')
+    cache.invalidate_owner('bob')
+    assert cache.get('e') == 5
+
+
+def test_fingerprints():
+    assert fingerprint('a', 1) == fingerprint('a', 1) != fingerprint('a', 2)
+    assert skill_set_fingerprint(['Python', 'go']) == skill_set_fingerprint(['GO', 'python'])
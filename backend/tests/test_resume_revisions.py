@@ -0,0 +1,46 @@
+from utils.resume_revisions import find_previous, text_similarity
+
+BASE = '\n'.join(f'line {i}' for i in range(10))
+
+
+def resume(name, filename, text):
+    return {'name': name, 'filename': filename, 'extracted_text': text}
+
+
+def edited(count):
+    """BASE with its first `count` lines replaced."""
+    lines = BASE.splitlines()
+    return '\n'.join([f'new {i}' for i in range(count)] + lines[count:])
+
+
+def find(candidates, filename, text):
+    result, matched_by, similarity = find_previous(candidates, filename, text, 0.5, 0.2)
+    return (result['name'] if result else None), matched_by, similarity
+
+
+def test_text_similarity():
+    assert text_similarity(BASE, '  line 0 \n\n' + BASE) == 1.0
+    assert text_similarity(BASE, edited(5)) == 5 / 15
+    assert text_similarity('', BASE) == 0.0
+
+
+def test_same_filename_wins_over_more_similar_text():
+    candidates = [resume('older', 'cv.pdf', edited(6)), resume('other', 'x.pdf', BASE)]
+    assert find(candidates, 'cv.pdf', BASE) == ('older', 'filename', round(4 / 16, 4))
+
+
+def test_latest_resume_with_the_filename_is_used():
+    candidates = [resume('newest', 'cv.pdf', edited(2)), resume('oldest', 'cv.pdf', BASE)]
+    assert find(candidates, 'cv.pdf', BASE)[0] == 'newest'
+
+
+def test_reused_filename_with_unrelated_text_is_not_a_revision():
+    candidates = [resume('unrelated', 'resume.pdf', 'someone else\nentirely')]
+    assert find(candidates, 'resume.pdf', BASE) == (None, None, 0)
+
+
+def test_most_similar_text_above_threshold():
+    candidates = [resume('far', 'a.pdf', edited(8)), resume('close', 'b.pdf', edited(1)), resume('empty', 'c.pdf', '')]
+    assert find(candidates, 'new.pdf', BASE) == ('close', 'similarity', round(9 / 11, 4))
+    assert find([resume('far', 'a.pdf', edited(8))], 'new.pdf', BASE) == (None, None, 0)
+    assert find([], 'new.pdf', BASE) == (None, None, 0)
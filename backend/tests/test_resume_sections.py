@@ -0,0 +1,61 @@
+from utils.resume_sections import segment, section_kind, section_text
+
+RESUME = """JANE DOE
+jane@example.com
+Professional Experience:
+Backend Engineer, Acme
+Built APIs
+  SKILLS
+Python, AWS
+GCP
+OPEN SOURCE
+Maintainer of a parser
+education
+BSc Computer Science
+Experience
+Intern, Globex"""
+
+
+def names(text):
+    return [section['name'] for section in segment(text)]
+
+
+def texts(text):
+    return {section['name']: text[section['start']:section['end']] for section in segment(text)}
+
+
+def test_sections_cover_text_exactly():
+    sections = segment(RESUME)
+    assert sections[0]['start'] == 0 and sections[-1]['end'] == len(RESUME)
+    assert all(a['end'] == b['start'] for a, b in zip(sections, sections[1:]))
+
+
+def test_known_and_generic_headings():
+    assert names(RESUME) == ['header', 'experience', 'skills', 'open source', 'education', 'experience#2']
+    sections = texts(RESUME)
+    assert sections['header'] == 'JANE DOE\njane@example.com\n'
+    assert sections['experience'] == 'Professional Experience:\nBackend Engineer, Acme\nBuilt APIs\n'
+    # Short all-caps words inside a section are not headings
+    assert sections['skills'] == '  SKILLS\nPython, AWS\nGCP\n'
+    assert sections['experience#2'] == 'Experience\nIntern, Globex'
+
+
+def test_generic_headings_before_a_known_one_stay_in_the_header():
+    assert names('JOHN SMITH\nSENIOR ENGINEER\nSkills\nGo') == ['header', 'skills']
+
+
+def test_heading_must_be_on_its_own_line():
+    assert names('Summary of my experience in skills\nExperience with Python') == ['header']
+
+
+def test_text_without_headings():
+    assert names('just some text') == ['header']
+    assert segment('') == []
+
+
+def test_section_text_and_kind():
+    sections = segment(RESUME)
+    assert section_kind('experience#2') == 'experience'
+    assert section_text(RESUME, sections, {'experience'}) == (
+        'Professional Experience:\nBackend Engineer, Acme\nBuilt APIs\nExperience\nIntern, Globex'
+    )
@@ -0,0 +1,108 @@
+"""
+Activity Feed
+Events appended by job, resume and skill writes, and feed page cursors
+"""
+
+from datetime import datetime
+from bson import ObjectId
+from flask import current_app
+from repositories import activity_repo
+
+PAGE_SIZE = 10
+MAX_PAGE_SIZE = 50
+
+# Bookkeeping fields that do not make an edit worth a feed entry
+EDIT_IGNORED = {'updated_at', 'description_vector'}
+
+
+def _event(document, kind, action, time):
+    return {
+        'user_id': document['user_id'],
+        'type': kind,
+        'action': action,
+        # Documents without a timestamp fall back to their _id's creation time
+        'time': time or document['_id'].generation_time.replace(tzinfo=None),
+        'ref': document['_id']
+    }
+
+
+def job_event(job):
+    return _event(job, 'job_application', f"Applied to {job['company']} - {job['position']}", job.get('created_at'))
+
+
+def resume_event(resume):
+    return _event(resume, 'resume_upload', f"Uploaded resume: {resume['filename']}", resume.get('uploaded_at'))
+
+
+def skill_event(skill):
+    return _event(skill, 'skill_added', f"Added skill: {skill['name']}", skill.get('created_at'))
+
+
+def job_update_event(user_id, job, fields, time):
+    """
+    Event for an edit of a job application, given the stored document and the
+    fields set on it; None if nothing shown in the feed changed.
+    """
+    if not set(fields) - EDIT_IGNORED:
+        return None
+    job = dict(job, **fields)
+    name = f"{job.get('company', '')} - {job.get('position', '')}"
+    action = f"Moved {name} to {fields['status']}" if 'status' in fields else f"Updated {name}"
+    return _edit_event(user_id, job, 'job_update', action, time)
+
+
+def skill_update_event(user_id, skill, fields, time):
+    """Event for an edit of a skill; None if nothing shown in the feed changed."""
+    if not set(fields) - EDIT_IGNORED:
+        return None
+    skill = dict(skill, **fields)
+    level = f" ({fields['level']}%)" if 'level' in fields else ''
+    return _edit_event(user_id, skill, 'skill_update', f"Updated skill: {skill.get('name', '')}{level}", time)
+
+
+def _edit_event(user_id, document, kind, action, time):
+    # Several edits per document, so they point at it with 'source' (not the unique 'ref')
+    return {'user_id': user_id, 'type': kind, 'action': action, 'time': time, 'source': document['_id']}
+
+
+def import_event(user_id, count, time):
+    return {
+        'user_id': user_id,
+        'type': 'job_import',
+        'action': f"Imported {count} job application{'s' if count != 1 else ''}",
+        'time': time
+    }
+
+
+def record_activity(events):
+    """Append events to their users' feeds; a failed write is logged, not raised."""
+    # The write that caused the events has already succeeded
+    try:
+        activity_repo.append([event for event in events if event])
+    except Exception as e:
+        current_app.logger.warning('Failed to record activity: %s', e)
+
+
+def forget_activity(user_id, document_ids):
+    """
+    Remove the feed entries of deleted documents (their creation and edit
+    events), as the feed only lists what still exists. A failed delete, e.g.
+    on a capped feed the server will not delete from, is logged, not raised.
+    """
+    try:
+        activity_repo.remove_for(user_id, list(document_ids))
+    except Exception as e:
+        current_app.logger.warning('Failed to remove activity: %s', e)
+
+
+def encode_cursor(entry):
+    """Opaque cursor for the page after `entry`."""
+    return f"{entry['time'].isoformat()}_{entry['_id']}"
+
+
+def decode_cursor(cursor):
+    """(time, _id) from encode_cursor(); ValueError if malformed."""
+    time, _, entry_id = cursor.rpartition('_')
+    if not ObjectId.is_valid(entry_id):
+        raise ValueError('Invalid cursor')
+    return datetime.fromisoformat(time), ObjectId(entry_id)
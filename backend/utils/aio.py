@@ -0,0 +1,94 @@
+"""
+Async Support
+Motor database handle, read runner and CPU executor for the ASGI entry point
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from config import Config
+from repositories.base import with_analytics_reads
+
+
+class MotorDB:
+    """
+    Motor client tied to an async app's serving lifetime, the counterpart of
+    the PyMongo extension: `motor_db.db` is the default database once serving.
+    """
+    
+    def __init__(self):
+        self.client = None
+        self.db = None
+    
+    def init_app(self, app):
+        @app.before_serving
+        async def connect():
+            # Imported here so the WSGI app never needs motor installed
+            from motor.motor_asyncio import AsyncIOMotorClient
+            self.client = AsyncIOMotorClient(app.config['MONGO_URI'], **Config.mongo_client_options())
+            self.db = self.client.get_default_database()
+        
+        @app.after_serving
+        async def close():
+            self.client.close()
+            self.client = self.db = None
+
+
+async def run_reads(db, reads):
+    """
+    {key: result} for (key, collection, operation, arguments) reads as built in
+    utils.overview, run concurrently on the Motor database `db`; the Motor
+    counterpart of repositories.run_reads, with the same read preferences.
+    """
+    results = await asyncio.gather(*(
+        _read(db[collection], operation, arguments) for _, collection, operation, arguments in reads
+    ))
+    return dict(zip((key for key, _, _, _ in reads), results))
+
+
+def _read(collection, operation, arguments):
+    """Awaitable for one read, mirroring the Repository method of that name."""
+    if operation == 'count':
+        return with_analytics_reads(collection).count_documents(*arguments)
+    if operation == 'aggregate':
+        return with_analytics_reads(collection).aggregate(*arguments).to_list(None)
+    if operation == 'find_one':
+        return collection.find_one(*arguments)
+    if operation == 'recent':
+        query, sort_field, limit = arguments[:3]
+        projection = arguments[3] if len(arguments) > 3 else None
+        return collection.find(query, projection).sort(sort_field, -1).limit(limit).to_list(limit)
+    raise ValueError(f"Unsupported read operation: {operation}")
+
+
+class CPUExecutor:
+    """
+    Process pool for CPU-bound work (PDF parsing, NLP scoring) so it never
+    blocks the event loop. Workers are spawned rather than forked, as the
+    parent already holds Motor connections and threads.
+    """
+    
+    def __init__(self):
+        self._pool = None
+    
+    def init_app(self, app):
+        @app.after_serving
+        async def shutdown():
+            if self._pool is not None:
+                self._pool.shutdown(cancel_futures=True)
+                self._pool = None
+    
+    async def run(self, fn, *args, **kwargs):
+        """Run fn(*args, **kwargs) in a worker process; fn must be importable."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=Config.ASGI_CPU_WORKERS,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, partial(fn, *args, **kwargs))
+
+
+motor_db = MotorDB()
+cpu_executor = CPUExecutor()
@@ -0,0 +1,127 @@
+"""
+Batch Update and Delete
+Request parsing and per-item results for the /batch endpoints
+"""
+
+from collections import Counter
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+
+class BatchItem:
+    """One requested operation and its outcome."""
+    
+    __slots__ = ('op', 'raw_id', 'id', 'fields', 'status', 'error', 'document')
+    
+    def __init__(self, op, raw_id, fields=None):
+        self.op = op
+        self.raw_id = raw_id
+        self.id = ObjectId(raw_id) if isinstance(raw_id, str) and ObjectId.is_valid(raw_id) else None
+        self.fields = fields
+        self.status = None
+        self.error = None
+        # Stored document before the write (fetched with apply_batch's projection)
+        self.document = None
+    
+    def fail(self, status, error):
+        self.status = status
+        self.error = error
+    
+    def to_json(self):
+        result = {'id': self.raw_id, 'op': self.op, 'status': self.status}
+        if self.error:
+            result['error'] = self.error
+        return result
+
+
+def parse_batch(data, clean_patch, max_items):
+    """
+    Items from {"update": [{"id": ..., <fields>}], "delete": [ids]}.
+    clean_patch(entry) returns (fields to $set, error). An id listed more than
+    once (e.g. both updated and deleted) has no defined outcome in an unordered
+    bulk write, so every occurrence is rejected. Returns (items, error) where
+    error is a message for a malformed request.
+    """
+    if not isinstance(data, dict):
+        return None, 'Expected a JSON object with "update" and/or "delete" lists'
+    updates = data.get('update') or []
+    deletes = data.get('delete') or []
+    if not isinstance(updates, list) or not isinstance(deletes, list):
+        return None, '"update" and "delete" must be lists'
+    if not updates and not deletes:
+        return None, 'Nothing to do: "update" and "delete" are empty'
+    if len(updates) + len(deletes) > max_items:
+        return None, f'At most {max_items} operations per batch'
+    
+    items = []
+    for entry in updates:
+        if not isinstance(entry, dict):
+            item = BatchItem('update', None)
+            item.fail('invalid', 'Expected an object with an "id"')
+        else:
+            fields, error = clean_patch(entry)
+            item = BatchItem('update', entry.get('id'), fields)
+            if error:
+                item.fail('invalid', error)
+        items.append(item)
+    items.extend(BatchItem('delete', raw_id) for raw_id in deletes)
+    
+    for item in items:
+        if item.status is None and item.id is None:
+            item.fail('invalid', 'Invalid id')
+    
+    counts = Counter(item.id for item in items if item.id is not None)
+    for item in items:
+        if item.status is None and counts[item.id] > 1:
+            item.fail('invalid', 'Id appears more than once in the batch')
+    return items, None
+
+
+def apply_batch(repo, user_id, items, projection=None, before_write=None):
+    """
+    Run the valid items as a single bulk_write on `repo`, marking each item
+    updated, deleted or not_found. `before_write(updates, existing)` may add
+    fields to the (id, fields) updates using the existing documents (fetched
+    with `projection`). Operations rejected by the server are marked failed
+    with its error message. Returns (updated items, deleted items) that were
+    applied.
+    """
+    pending = [item for item in items if item.status is None]
+    existing = repo.owned({item.id for item in pending}, user_id, projection) if pending else {}
+    
+    for item in pending:
+        if item.id not in existing:
+            item.fail('not_found', 'Not found')
+        else:
+            item.document = existing[item.id]
+    
+    updated = [item for item in pending if item.status is None and item.op == 'update']
+    deleted = [item for item in pending if item.status is None and item.op == 'delete']
+    if before_write is not None and updated:
+        before_write(updated, existing)
+    
+    try:
+        repo.bulk_apply(user_id, [(item.id, item.fields) for item in updated], [item.id for item in deleted])
+    except BulkWriteError as e:
+        # Operation indexes follow bulk_apply's order: updates, then deletes
+        written = updated + deleted
+        for error in e.details.get('writeErrors', []):
+            written[error['index']].fail('error', error.get('errmsg', 'Write failed'))
+    
+    updated = [item for item in updated if item.status is None]
+    deleted = [item for item in deleted if item.status is None]
+    for item in updated:
+        item.status = 'updated'
+    for item in deleted:
+        item.status = 'deleted'
+    return updated, deleted
+
+
+def batch_response(items):
+    """Response body with per-item results (in request order) and totals."""
+    return {
+        'results': [item.to_json() for item in items],
+        'updated': sum(item.status == 'updated' for item in items),
+        'deleted': sum(item.status == 'deleted' for item in items),
+        'failed': sum(item.status not in ('updated', 'deleted') for item in items)
+    }
@@ -0,0 +1,47 @@
+"""
+Concurrent Query Fan-Out
+Run independent reads in parallel on a shared thread pool
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+from threading import Lock
+from config import Config
+
+# Set inside pool threads so nested fan-outs run inline instead of waiting
+# on a pool their own caller occupies
+_in_pool = ContextVar('in_query_pool', default=False)
+
+_executor = None
+_executor_lock = Lock()
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=Config.QUERY_FANOUT_WORKERS, thread_name_prefix='query-fanout'
+                )
+    return _executor
+
+
+def _run_in_pool(fn):
+    _in_pool.set(True)
+    return fn()
+
+
+def fan_out(*calls):
+    """
+    Run zero-argument callables concurrently and return their results in order.
+    Calls share the PyMongo client (and its connection pool); each runs in a
+    copy of the caller's context, so request timings, the query inspector and
+    the Flask app context still see them. The first exception is re-raised.
+    """
+    if len(calls) < 2 or Config.QUERY_FANOUT_WORKERS < 2 or _in_pool.get():
+        return [call() for call in calls]
+    
+    executor = _get_executor()
+    futures = [executor.submit(copy_context().run, _run_in_pool, call) for call in calls]
+    return [future.result() for future in futures]
@@ -3,54 +3,377 @@ Job Matching using Classical NLP (TF-IDF + Cosine Similarity)
 NO API CALLS - Pure sklearn implementation
 """
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.feature_extraction import FeatureHasher
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+from scipy import sparse
+from collections import Counter
+from bson import Binary
+from config import Config
+from utils.request_metrics import timed_phase
+from utils.resume_sections import segment, section_kind
+import numpy as np
 import re
 
 class JobMatcher:
-    """Match resumes with job descriptions using TF-IDF."""
+    """
+    Match resumes with job descriptions.
+    Modes: 'tfidf' fits a vocabulary per comparison; 'hashing' uses fixed-width
+    hashed vectors that need no vocabulary and are comparable across workers;
+    'sections' hashes each resume section separately and weights the section
+    similarities by section kind (Config.MATCHER_SECTION_WEIGHTS).
+    """
+    
+    MODES = ('tfidf', 'hashing', 'sections')
+    
+    # Vocabulary size of the per-pair TF-IDF in 'tfidf' mode
+    TFIDF_MAX_FEATURES = 100
+    
+    _analyzer = None
+    _section_weights = None
     
     @staticmethod
-    def calculate_match_score(resume_text, job_description):
+    @timed_phase('nlp')
+    def calculate_match_score(resume_text, job_description, mode=None, job_vector=None, resume_sections=None):
         """
         Calculate similarity between resume and job description.
-        Returns match score (0-100) and matching keywords.
+        Returns match score (0-100) and matching keywords, ranked by how much
+        each term contributes to the similarity ('sections' mode adds the
+        similarity of each resume section as section_scores).
+        job_vector: precomputed value from vectorize_job, if stored.
+        resume_sections: stored section offsets of the resume, if any.
+        """
+        mode = JobMatcher._resolve_mode(mode)
+        resume = {'text': resume_text, 'sections': resume_sections}
+        job = {'text': job_description, 'vector': job_vector}
+        return JobMatcher._score(resume, job, mode)
+    
+    @staticmethod
+    def _score(resume, job, mode):
         """
-        if not resume_text or not job_description:
+        Score one resume/job pair.
+        resume, job: dicts with 'text' and optionally a precomputed 'vector';
+        vectors computed here are cached back into the dicts.
+        """
+        if not resume['text'] or not job['text']:
             return {'score': 0, 'matching_keywords': [], 'missing_keywords': []}
         
-        # Preprocess texts
-        resume_clean = JobMatcher._preprocess_text(resume_text)
-        job_clean = JobMatcher._preprocess_text(job_description)
-        
-        # TF-IDF Vectorization
-        vectorizer = TfidfVectorizer(
-            lowercase=True,
-            stop_words='english',
-            ngram_range=(1, 2),  # Unigrams and bigrams
-            max_features=100
-        )
-        
         try:
-            tfidf_matrix = vectorizer.fit_transform([resume_clean, job_clean])
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-            match_score = int(similarity * 100)
+            section_scores = None
+            if mode in ('hashing', 'sections'):
+                job_vector, terms = JobMatcher._hashed_job_vector(job)
+                job_weights = job_vector.data
+                if mode == 'sections':
+                    resume_vector = JobMatcher._section_vectors(resume)['combined']
+                    section_similarities = JobMatcher._section_similarities(resume, job, job_vector)
+                else:
+                    resume_vector = JobMatcher._hashed_resume_vector(resume)
+                resume_weights = JobMatcher._weights_at(resume_vector, job_vector.indices)
+            else:
+                terms, resume_weights, job_weights = JobMatcher._pair_tfidf(
+                    JobMatcher._token_counts(resume), JobMatcher._token_counts(job)
+                )
             
-            # Extract matching and missing keywords
-            job_keywords = set(JobMatcher._extract_keywords(job_description))
-            resume_keywords = set(JobMatcher._extract_keywords(resume_text))
+            # Rows are L2-normalized, so the dot product is the cosine similarity
+            contributions = resume_weights * job_weights
+            if mode == 'sections':
+                # Same value, from the (possibly batched) section similarities
+                section_vectors = JobMatcher._section_vectors(resume)
+                norm = section_vectors['norm']
+                match_score = int(section_vectors['weights'] @ section_similarities / norm * 100) if norm else 0
+                section_scores = {
+                    name: int(similarity * 100)
+                    for name, similarity in zip(section_vectors['names'], section_similarities)
+                }
+            else:
+                match_score = int(contributions.sum() * 100)
             
-            matching = list(job_keywords & resume_keywords)[:10]
-            missing = list(job_keywords - resume_keywords)[:8]
+            # Explain the score from the same vectors: shared job terms ranked by
+            # contribution, missing job terms ranked by their weight in the job
+            shared = np.flatnonzero(contributions > 0)
+            missing = np.flatnonzero(resume_weights == 0)
+            matching = sorted(shared, key=lambda i: (-contributions[i], terms[i]))[:10]
+            missing = sorted(missing, key=lambda i: (-job_weights[i], terms[i]))[:8]
             
-            return {
+            result = {
                 'score': match_score,
-                'matching_keywords': matching,
-                'missing_keywords': missing
+                'matching_keywords': [str(terms[i]) for i in matching],
+                'missing_keywords': [str(terms[i]) for i in missing]
             }
+            if section_scores is not None:
+                result['section_scores'] = section_scores
+            return result
         except Exception:
             return {'score': 0, 'matching_keywords': [], 'missing_keywords': []}
     
+    @staticmethod
+    def _token_counts(document):
+        """Token counts of a resume or job dict's text, computed on first use."""
+        if document.get('counts') is None:
+            document['counts'] = Counter(JobMatcher._tokens(document['text']))
+        return document['counts']
+    
+    @staticmethod
+    def _pair_tfidf(resume_counts, job_counts):
+        """
+        TF-IDF of a resume/job pair over their own two-document vocabulary,
+        as TfidfVectorizer(stop_words='english', ngram_range=(1, 2),
+        max_features=100) fitted on the pair, from token counts computed once
+        per text. Follows its steps (alphabetical vocabulary, the 100 most
+        frequent terms picked with the same argsort, smoothed idf, L2 norms);
+        weights agree up to float rounding, which at most reorders keywords of
+        equal weight. Returns (terms, resume weights, job weights) for the
+        job's terms.
+        """
+        vocabulary = sorted(resume_counts.keys() | job_counts.keys())
+        if not vocabulary:
+            raise ValueError('empty vocabulary')
+        counts = np.array([
+            [resume_counts.get(term, 0) for term in vocabulary],
+            [job_counts.get(term, 0) for term in vocabulary]
+        ], dtype=np.float64)
+        if len(vocabulary) > JobMatcher.TFIDF_MAX_FEATURES:
+            kept = np.sort((-counts.sum(axis=0)).argsort()[:JobMatcher.TFIDF_MAX_FEATURES])
+            counts = counts[:, kept]
+            vocabulary = [vocabulary[i] for i in kept]
+        
+        document_frequency = (counts > 0).sum(axis=0).astype(np.float64)
+        weights = counts * (np.log(3 / (document_frequency + 1)) + 1)
+        norms = np.sqrt((weights * weights).sum(axis=1, keepdims=True))
+        weights = np.divide(weights, norms, out=np.zeros_like(weights), where=norms > 0)
+        
+        columns = np.flatnonzero(weights[1])
+        return np.array(vocabulary, dtype=object)[columns], weights[0, columns], weights[1, columns]
+    
+    @staticmethod
+    def _hashed_resume_vector(resume):
+        """Hashed vector of the resume, computed on first use."""
+        if resume.get('vector') is None:
+            resume['vector'] = JobMatcher.hash_vectorize([resume['text']])
+        return resume['vector']
+    
+    @staticmethod
+    def _hashed_job_vector(job):
+        """Hashed vector of the job and the term behind each of its columns, computed on first use."""
+        if job.get('hashed') is None:
+            stored = job.get('vector')
+            vector = JobMatcher.decode_vector(stored)
+            if vector is None:
+                job['hashed'] = JobMatcher.hash_vectorize_with_terms(job['text'])
+            else:
+                job['hashed'] = vector, stored['terms']
+        return job['hashed']
+    
+    @staticmethod
+    def _batch_section_similarities(resume, jobs):
+        """
+        Similarity of every resume section to every job as one sparse product
+        (sections x jobs), kept on the job dicts so _score derives the scores
+        from it instead of one product per job.
+        """
+        jobs = [job for job in jobs if job['text']]
+        if not jobs:
+            return
+        job_matrix = sparse.vstack([JobMatcher._hashed_job_vector(job)[0] for job in jobs], format='csr')
+        similarities = (JobMatcher._section_vectors(resume)['matrix'] @ job_matrix.T).toarray()
+        for column, job in enumerate(jobs):
+            job['section_similarities'] = similarities[:, column]
+    
+    @staticmethod
+    def section_weights():
+        """{section kind: weight} parsed from Config.MATCHER_SECTION_WEIGHTS ('kind:weight,...')."""
+        if JobMatcher._section_weights is None:
+            weights = {}
+            for item in Config.MATCHER_SECTION_WEIGHTS.split(','):
+                if item.strip():
+                    kind, _, weight = item.partition(':')
+                    weights[kind.strip()] = float(weight)
+            JobMatcher._section_weights = weights
+        return JobMatcher._section_weights
+    
+    @staticmethod
+    def _section_vectors(resume):
+        """
+        Hashed vectors of the resume's sections, computed once per resume:
+        'names', 'matrix' (one L2-normalized row per section, hashed in a
+        single batch), 'weights', 'norm' = |weights @ matrix| and 'combined',
+        the normalized weighted sum of the rows. combined . job =
+        weights . (matrix @ job) / norm, so the score is the weighted
+        combination of the section similarities.
+        """
+        if resume.get('section_vectors') is None:
+            text = resume['text']
+            sections = resume.get('sections') or segment(text)
+            weights_by_kind = JobMatcher.section_weights()
+            weights = np.array([weights_by_kind.get(section_kind(section['name']), 0.0) for section in sections], dtype=np.float32)
+            matrix = JobMatcher.hash_vectorize([text[section['start']:section['end']] for section in sections])
+            weighted = sparse.csr_matrix(weights) @ matrix
+            resume['section_vectors'] = {
+                'names': [section['name'] for section in sections],
+                'matrix': matrix,
+                'weights': weights,
+                'norm': float(np.sqrt(weighted.multiply(weighted).sum())),
+                'combined': normalize(weighted)
+            }
+        return resume['section_vectors']
+    
+    @staticmethod
+    def _section_similarities(resume, job, job_vector):
+        """Similarity (0-1) of each resume section to the job, batched if available."""
+        similarities = job.get('section_similarities')
+        if similarities is None:
+            similarities = (JobMatcher._section_vectors(resume)['matrix'] @ job_vector.T).toarray().ravel()
+        return similarities
+    
+    @staticmethod
+    def _weights_at(vector, columns):
+        """Values of a 1 x n sparse row at the given columns (0 where absent)."""
+        if not len(vector.indices):
+            return np.zeros(len(columns), dtype=np.float32)
+        vector.sort_indices()
+        positions = np.minimum(np.searchsorted(vector.indices, columns), len(vector.indices) - 1)
+        return np.where(vector.indices[positions] == columns, vector.data[positions], 0).astype(np.float32)
+    
+    @staticmethod
+    def _resolve_mode(mode):
+        """Return the requested matcher mode, defaulting to Config.MATCHER_MODE."""
+        mode = mode or Config.MATCHER_MODE
+        if mode not in JobMatcher.MODES:
+            raise ValueError(f"Unknown matcher mode '{mode}'. Expected one of: {', '.join(JobMatcher.MODES)}")
+        return mode
+    
+    @staticmethod
+    def _tokens(text):
+        """Unigram and bigram tokens of text, stop words removed."""
+        if JobMatcher._analyzer is None:
+            JobMatcher._analyzer = HashingVectorizer(
+                lowercase=True,
+                stop_words='english',
+                ngram_range=(1, 2)
+            ).build_analyzer()
+        return JobMatcher._analyzer(JobMatcher._preprocess_text(text or ''))
+    
+    @staticmethod
+    def _hasher():
+        return FeatureHasher(
+            n_features=Config.MATCHER_HASH_FEATURES,
+            input_type='string',
+            alternate_sign=False,
+            dtype=np.float32
+        )
+    
+    @staticmethod
+    @timed_phase('nlp')
+    def hash_vectorize(texts):
+        """
+        Vectorize texts with feature hashing (no fitted vocabulary).
+        Rows are L2-normalized float32 sparse vectors, comparable across processes.
+        """
+        return normalize(JobMatcher._hasher().transform(JobMatcher._tokens(text) for text in texts))
+    
+    @staticmethod
+    @timed_phase('nlp')
+    def hash_vectorize_with_terms(text):
+        """
+        Hashed vector of one text plus the term behind each stored column,
+        from a single tokenization pass. On hash collisions the first term wins.
+        """
+        counts = Counter(JobMatcher._tokens(text))
+        unique = list(counts)
+        # One term per row, so the column indices line up with unique
+        columns = JobMatcher._hasher().transform([term] for term in unique).indices if unique else []
+        
+        vector = sparse.csr_matrix(
+            (np.fromiter(counts.values(), dtype=np.float32, count=len(unique)), np.array(columns), [0, len(unique)]),
+            shape=(1, Config.MATCHER_HASH_FEATURES)
+        )
+        vector.sum_duplicates()
+        vector = normalize(vector)
+        
+        column_terms = {}
+        for column, term in zip(columns, unique):
+            column_terms.setdefault(column, term)
+        return vector, [column_terms[column] for column in vector.indices]
+    
+    @staticmethod
+    def vectorize_job(text):
+        """
+        Precompute matching features for a job's indexed text.
+        Returns fields to store on the job document: a compact hashed vector
+        (int32 indices + float32 values) with the term for each index.
+        """
+        vector, terms = JobMatcher.hash_vectorize_with_terms(text)
+        return {'description_vector': JobMatcher.encode_vector(vector, terms)}
+    
+    @staticmethod
+    @timed_phase('nlp')
+    def vectorize_jobs(texts):
+        """
+        vectorize_job() for many texts at once: each distinct term is hashed
+        once for the whole batch and all rows are normalized together.
+        """
+        token_counts = [Counter(JobMatcher._tokens(text)) for text in texts]
+        vocabulary = list(dict.fromkeys(term for counts in token_counts for term in counts))
+        if not vocabulary:
+            return [JobMatcher.vectorize_job(text) for text in texts]
+        column_of = dict(zip(vocabulary, JobMatcher._hasher().transform([term] for term in vocabulary).indices))
+        
+        indptr, indices, data = [0], [], []
+        for counts in token_counts:
+            indices.extend(column_of[term] for term in counts)
+            data.extend(counts.values())
+            indptr.append(len(indices))
+        matrix = sparse.csr_matrix(
+            (np.array(data, dtype=np.float32), np.array(indices), np.array(indptr)),
+            shape=(len(texts), Config.MATCHER_HASH_FEATURES)
+        )
+        matrix.sum_duplicates()
+        matrix = normalize(matrix)
+        
+        features = []
+        for row, counts in enumerate(token_counts):
+            # First term wins on hash collisions, as in hash_vectorize_with_terms
+            column_terms = {}
+            for term in counts:
+                column_terms.setdefault(column_of[term], term)
+            start, end = matrix.indptr[row], matrix.indptr[row + 1]
+            row_indices = matrix.indices[start:end]
+            features.append({'description_vector': JobMatcher._encode(
+                matrix.shape[1], row_indices, matrix.data[start:end],
+                [column_terms[column] for column in row_indices]
+            )})
+        return features
+    
+    @staticmethod
+    def encode_vector(row, terms):
+        """Encode a 1 x n_features sparse row and its column terms for BSON."""
+        row = sparse.csr_matrix(row)
+        return JobMatcher._encode(row.shape[1], row.indices, row.data, terms)
+    
+    @staticmethod
+    def _encode(n_features, indices, values, terms):
+        return {
+            'n_features': n_features,
+            'indices': Binary(indices.astype('<i4').tobytes()),
+            'values': Binary(values.astype('<f4').tobytes()),
+            'terms': list(terms)
+        }
+    
+    @staticmethod
+    def decode_vector(stored):
+        """
+        Decode a stored vector back to a 1 x n_features sparse row.
+        Returns None if it was hashed with a different width than configured.
+        """
+        if not stored or stored.get('n_features') != Config.MATCHER_HASH_FEATURES or 'terms' not in stored:
+            return None
+        indices = np.frombuffer(stored['indices'], dtype='<i4')
+        values = np.frombuffer(stored['values'], dtype='<f4')
+        return sparse.csr_matrix(
+            (values, indices, np.array([0, len(indices)])),
+            shape=(1, stored['n_features'])
+        )
+    
     @staticmethod
     def _preprocess_text(text):
         """Clean and normalize text."""
@@ -60,49 +383,36 @@ class JobMatcher:
         return text.strip()
     
     @staticmethod
-    def _extract_keywords(text):
-        """Extract important keywords (skills, tools, technologies)."""
-        keywords = []
-        tech_terms = {
-            'python', 'java', 'javascript', 'typescript', 'react', 'angular', 'vue',
-            'node.js', 'express', 'flask', 'django', 'fastapi', 'spring', 'sql',
-            'mongodb', 'postgresql', 'mysql', 'redis', 'aws', 'azure', 'gcp',
-            'docker', 'kubernetes', 'ci/cd', 'jenkins', 'git', 'github', 'api',
-            'rest', 'graphql', 'microservices', 'agile', 'scrum', 'testing',
-            'html', 'css', 'tailwind', 'bootstrap', 'machine learning', 'ai',
-            'data analysis', 'pandas', 'numpy', 'tensorflow', 'pytorch'
-        }
-        
-        text_lower = text.lower()
-        for term in tech_terms:
-            if term in text_lower:
-                keywords.append(term)
-        
-        return keywords
-    
-    @staticmethod
-    def recommend_jobs(resume_text, job_listings):
+    @timed_phase('nlp')
+    def recommend_jobs(resume_text, job_listings, mode=None, resume_sections=None):
         """
         Recommend jobs based on resume match scores.
-        job_listings: List of dicts with 'id', 'title', 'description'
+        job_listings: List of dicts with 'id', 'title', 'description' and
+        optionally a precomputed 'vector'
+        resume_sections: stored section offsets of the resume, if any.
         Returns sorted list by match score.
         """
+        mode = JobMatcher._resolve_mode(mode)
+        resume = {'text': resume_text, 'sections': resume_sections}
+        jobs = [{'text': job.get('description', ''), 'vector': job.get('vector')} for job in job_listings]
+        if mode == 'sections' and resume_text:
+            JobMatcher._batch_section_similarities(resume, jobs)
         recommendations = []
         
-        for job in job_listings:
-            result = JobMatcher.calculate_match_score(
-                resume_text,
-                job.get('description', '')
-            )
+        for listing, job in zip(job_listings, jobs):
+            result = JobMatcher._score(resume, job, mode)
             
-            recommendations.append({
-                'job_id': job.get('id'),
-                'job_title': job.get('title'),
-                'company': job.get('company', 'N/A'),
+            recommendation = {
+                'job_id': listing.get('id'),
+                'job_title': listing.get('title'),
+                'company': listing.get('company', 'N/A'),
                 'match_score': result['score'],
                 'matching_keywords': result['matching_keywords'][:5],
                 'missing_keywords': result['missing_keywords'][:3]
-            })
+            }
+            if 'section_scores' in result:
+                recommendation['section_scores'] = result['section_scores']
+            recommendations.append(recommendation)
         
         # Sort by match score descending
         recommendations.sort(key=lambda x: x['match_score'], reverse=True)
@@ -0,0 +1,101 @@
+"""
+Job Application Queries
+Filters, sort order and text search for the job list, parsed from query parameters
+"""
+
+from datetime import datetime, time
+from pymongo import ASCENDING, DESCENDING
+
+# Exact-match filters; a comma-separated value matches any of the listed values
+FILTER_FIELDS = ('status', 'company', 'location', 'job_type')
+
+# ?sort= keys ("-" prefix for descending)
+SORT_FIELDS = ('applied_date', 'created_at', 'updated_at', 'company', 'position', 'status')
+DEFAULT_SORT = [('applied_date', DESCENDING)]
+
+# Date range parameters: name -> (document field, operator)
+DATE_RANGES = {
+    'applied_from': ('applied_date', '$gte'),
+    'applied_to': ('applied_date', '$lte'),
+    'created_from': ('created_at', '$gte'),
+    'created_to': ('created_at', '$lte')
+}
+
+TEXT_SCORE = {'$meta': 'textScore'}
+
+
+class JobQuery:
+    """MongoDB filter, sort and paging for one job list request."""
+    
+    __slots__ = ('filter', 'sort', 'search', 'limit', 'offset')
+    
+    def __init__(self, filter, sort, search=None, limit=0, offset=0):
+        self.filter = filter
+        self.sort = sort
+        self.search = search
+        self.limit = limit
+        self.offset = offset
+    
+    def projection(self, fields):
+        """`fields` plus the relevance score when the query is a text search."""
+        if not self.search:
+            return fields
+        return dict(fields, score=TEXT_SCORE)
+
+
+def parse_job_query(args, user_id, max_limit):
+    """
+    JobQuery from request args (status, company, location, job_type, date
+    ranges, q, sort, limit, offset). Returns (query, error message or None).
+    """
+    query = {'user_id': user_id}
+    
+    for name in FILTER_FIELDS:
+        value = (args.get(name) or '').strip()
+        if not value or value == 'all':
+            continue
+        values = [part.strip() for part in value.split(',') if part.strip()]
+        query[name] = values[0] if len(values) == 1 else {'$in': values}
+    
+    for name, (field, operator) in DATE_RANGES.items():
+        value = args.get(name)
+        if not value:
+            continue
+        try:
+            bound = datetime.fromisoformat(value)
+        except ValueError:
+            return None, f'Invalid {name}: expected an ISO 8601 date'
+        # A bare end date includes the whole day
+        if operator == '$lte' and len(value) == 10:
+            bound = datetime.combine(bound.date(), time.max)
+        query.setdefault(field, {})[operator] = bound
+    
+    search = (args.get('q') or '').strip() or None
+    if search:
+        query['$text'] = {'$search': search}
+    
+    sort_key = (args.get('sort') or '').strip()
+    if not sort_key:
+        # Text searches are ranked by relevance unless a sort is requested
+        sort = [('score', TEXT_SCORE)] if search else list(DEFAULT_SORT)
+    elif sort_key == 'relevance':
+        if not search:
+            return None, 'sort=relevance requires q'
+        sort = [('score', TEXT_SCORE)]
+    else:
+        field = sort_key.lstrip('-')
+        if field not in SORT_FIELDS:
+            return None, f"Invalid sort. Use one of: {', '.join(SORT_FIELDS)} (prefix - for descending)"
+        sort = [(field, DESCENDING if sort_key.startswith('-') else ASCENDING)]
+    # Stable order across pages for equal sort values
+    sort.append(('_id', sort[0][1] if sort[0][1] in (ASCENDING, DESCENDING) else DESCENDING))
+    
+    try:
+        limit = int(args.get('limit', 0))
+        offset = int(args.get('offset', 0))
+    except ValueError:
+        return None, 'limit and offset must be integers'
+    if limit < 0 or offset < 0:
+        return None, 'limit and offset must not be negative'
+    
+    return JobQuery(query, sort, search, min(limit, max_limit) if limit else 0, offset), None
@@ -0,0 +1,171 @@
+"""
+Job Application Import and Export
+Row readers and writers for CSV and NDJSON, streamed in both directions
+"""
+
+import codecs
+import csv
+import io
+import json
+from datetime import date, datetime
+
+STATUSES = ('applied', 'in-review', 'interview', 'offer', 'rejected')
+
+# Columns written on export and read on import, in order
+FIELDS = ('company', 'position', 'status', 'applied_date', 'salary', 'location', 'job_type', 'description', 'notes')
+
+# Columns stored as ISO dates; all other columns are text
+DATE_FIELDS = ('applied_date',)
+
+MIMETYPES = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson'
+}
+
+
+def detect_format(explicit=None, filename=None, content_type=None):
+    """'csv' or 'ndjson' from a format name, file extension or content type; None if unknown."""
+    if explicit:
+        return explicit.lower() if explicit.lower() in MIMETYPES else None
+    extension = filename.rsplit('.', 1)[-1].lower() if filename and '.' in filename else ''
+    if extension in ('csv', 'ndjson', 'jsonl'):
+        return 'csv' if extension == 'csv' else 'ndjson'
+    content_type = (content_type or '').split(';')[0].strip().lower()
+    if content_type in ('text/csv', 'application/csv'):
+        return 'csv'
+    if content_type in ('application/x-ndjson', 'application/ndjson', 'application/jsonl'):
+        return 'ndjson'
+    return None
+
+
+def read_rows(stream, fmt):
+    """
+    Yield (row number, row dict or None, error or None) from a binary stream,
+    one line at a time. Empty CSV cells and columns outside FIELDS are dropped.
+    Lines that are not valid UTF-8 and malformed CSV records become row errors
+    rather than ending the import, since earlier batches are already stored.
+    """
+    bad_lines = set()
+    lines = _decoded_lines(stream, bad_lines)
+    if fmt == 'csv':
+        yield from _read_csv_rows(lines, bad_lines)
+        return
+    
+    for number, line in enumerate(lines, start=1):
+        if number in bad_lines:
+            yield number, None, 'Invalid UTF-8'
+            continue
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield number, None, f'Invalid JSON: {e}'
+            continue
+        if not isinstance(row, dict):
+            yield number, None, 'Expected a JSON object'
+            continue
+        yield number, {key: value for key, value in row.items() if key in FIELDS and value not in (None, '')}, None
+
+
+def _decoded_lines(stream, bad_lines):
+    """
+    Decode a binary stream line by line (BOM dropped), adding the numbers of
+    lines that are not valid UTF-8 to `bad_lines`; those are yielded with
+    replacement characters so CSV records spanning them stay aligned.
+    """
+    for number, line in enumerate(stream, start=1):
+        if number == 1 and line.startswith(codecs.BOM_UTF8):
+            line = line[len(codecs.BOM_UTF8):]
+        try:
+            yield line.decode('utf-8')
+        except UnicodeDecodeError:
+            bad_lines.add(number)
+            yield line.decode('utf-8', errors='replace')
+
+
+def _read_csv_rows(lines, bad_lines):
+    """read_rows() for CSV; a record is rejected if any of its lines was undecodable."""
+    reader = csv.reader(lines)
+    try:
+        header = [name.strip() for name in next(reader)]
+    except (StopIteration, csv.Error):
+        return
+    
+    # Row numbers count the header as row 1, like a spreadsheet
+    number, last_line = 1, reader.line_num
+    while True:
+        number += 1
+        try:
+            values = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            last_line = reader.line_num
+            yield number, None, f'Invalid CSV: {e}'
+            continue
+        first_line, last_line = last_line + 1, reader.line_num
+        if not values:
+            number -= 1
+            continue
+        if any(line in bad_lines for line in range(first_line, last_line + 1)):
+            yield number, None, 'Invalid UTF-8'
+            continue
+        yield number, {key: value.strip() for key, value in zip(header, values)
+                       if key in FIELDS and value and value.strip()}, None
+
+
+def validate_row(row):
+    """
+    Error message for an invalid import row, or None. Text columns must be
+    strings (NDJSON rows can carry any JSON type) and dates ISO date strings;
+    valid dates are converted to datetimes in place.
+    """
+    wrong_type = [name for name in FIELDS if name in row and not isinstance(row[name], str)]
+    if wrong_type:
+        return f"Expected text for fields: {', '.join(wrong_type)}"
+    missing = [name for name in ('company', 'position') if not row.get(name, '').strip()]
+    if missing:
+        return f"Missing required fields: {', '.join(missing)}"
+    if row.get('status', 'applied') not in STATUSES:
+        return f"Invalid status: {row['status']}"
+    for name in DATE_FIELDS:
+        if name in row:
+            try:
+                row[name] = datetime.fromisoformat(row[name].strip())
+            except ValueError:
+                return f"Invalid {name}: {row[name]}"
+    return None
+
+
+def write_rows(documents, fmt, dumps, chunk_rows=500):
+    """Yield the export as text chunks of up to `chunk_rows` rows each."""
+    buffer = io.StringIO()
+    writer = None
+    if fmt == 'csv':
+        writer = csv.writer(buffer)
+        writer.writerow(FIELDS)
+    
+    count = 0
+    for document in documents:
+        if writer is not None:
+            writer.writerow([_csv_value(document.get(name)) for name in FIELDS])
+        else:
+            buffer.write(dumps({name: document.get(name) for name in FIELDS}))
+            buffer.write('\n')
+        count += 1
+        if count % chunk_rows == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
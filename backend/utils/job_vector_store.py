@@ -0,0 +1,429 @@
+"""
+Persistent Job-Description Vector Store
+Hashed TF vectors in memory-mapped CSR segments with exact top-k search
+"""
+
+from threading import RLock, Thread
+from scipy import sparse
+from config import Config
+from utils.job_matcher import JobMatcher
+from utils.request_metrics import timed_phase
+import numpy as np
+import json
+import logging
+import os
+import uuid
+
+logger = logging.getLogger(__name__)
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process use only
+    fcntl = None
+
+
+class _Segment:
+    """One immutable block of rows loaded from disk as memory maps."""
+
+    def __init__(self, directory, name, seq, n_features):
+        self.name = name
+        self.seq = seq
+        prefix = os.path.join(directory, name)
+        indptr = _load_array(prefix + '.indptr.npy')
+        indices = _load_array(prefix + '.indices.npy')
+        data = _load_array(prefix + '.data.npy')
+        self.ids = _load_array(prefix + '.ids.npy')
+        self.owners = _load_array(prefix + '.owners.npy')
+        self.matrix = sparse.csr_matrix((data, indices, indptr), shape=(len(self.ids), n_features))
+        self._rows = None
+        self._owner_rows = None
+
+    def rows_of(self, job_id):
+        """Row positions holding job_id in this segment."""
+        if self._rows is None:
+            self._rows = {}
+            for row, value in enumerate(self.ids.tolist()):
+                self._rows.setdefault(value, []).append(row)
+        return self._rows.get(job_id, [])
+
+    def owner_rows(self, owner_id):
+        """Row positions owned by owner_id in this segment, as an array."""
+        if self._owner_rows is None:
+            rows = {}
+            for row, value in enumerate(self.owners.tolist()):
+                rows.setdefault(value, []).append(row)
+            self._owner_rows = {owner: np.array(positions, dtype=np.int64) for owner, positions in rows.items()}
+        return self._owner_rows.get(owner_id, np.empty(0, dtype=np.int64))
+
+
+class JobVectorStore:
+    """
+    Append-only store of job-description vectors.
+    Each write adds a small segment; a manifest records live segments and
+    superseded ids. Once too many segments or superseded ids accumulate, a
+    background thread compacts them, so writes never wait for a rewrite.
+    Other processes pick up changes by re-reading the manifest.
+    """
+
+    MANIFEST = 'manifest.json'
+    MAX_SUPERSEDED = 1024
+
+    def __init__(self, path, n_features, max_segments=16):
+        self.path = path
+        self.n_features = n_features
+        self.max_segments = max_segments
+        self._lock = RLock()
+        self._manifest = None
+        self._manifest_mtime = None
+        self._segments = {}
+        self._compacting = False
+
+    def upsert(self, job_id, owner_id, text):
+        """Index (or re-index) a job description."""
+        self.upsert_many([(job_id, owner_id, text)])
+
+    def upsert_many(self, items):
+        """Index many (job_id, owner_id, text) tuples as one segment."""
+        items = list(items)
+        if not items:
+            return
+        self.upsert_vectors(
+            [job_id for job_id, _, _ in items],
+            [owner_id for _, owner_id, _ in items],
+            JobMatcher.hash_vectorize([text for _, _, text in items])
+        )
+
+    def upsert_vectors(self, job_ids, owner_ids, vectors):
+        """Index precomputed hashed vectors (one row per job) as one segment."""
+        if not job_ids:
+            return
+        ids = [str(job_id) for job_id in job_ids]
+        owners = [str(owner_id) for owner_id in owner_ids]
+
+        with self._locked_manifest() as manifest:
+            seq = manifest['next_seq']
+            name = self._write_segment(vectors, ids, owners)
+            manifest['segments'].append({'name': name, 'seq': seq})
+            for job_id in ids:
+                manifest['superseded'][job_id] = seq
+            manifest['next_seq'] = seq + 1
+            compact = self._needs_compaction(manifest)
+        if compact:
+            self._compact_in_background()
+
+    def remove(self, job_id):
+        """Drop a job from the index."""
+        self.remove_many([job_id])
+
+    def remove_many(self, job_ids):
+        """Drop several jobs from the index in one manifest update."""
+        if not job_ids:
+            return
+        with self._locked_manifest() as manifest:
+            for job_id in job_ids:
+                manifest['superseded'][str(job_id)] = manifest['next_seq']
+            manifest['next_seq'] += 1
+            compact = self._needs_compaction(manifest)
+        if compact:
+            self._compact_in_background()
+
+    @timed_phase('nlp')
+    def search(self, text, k=10, owner_id=None):
+        """
+        Exact top-k cosine search. With owner_id, only that owner's rows
+        are scored.
+        Returns list of (job_id, similarity) sorted by similarity descending.
+        """
+        query = JobMatcher.hash_vectorize([text]).toarray().ravel()
+        segments, superseded = self._snapshot()
+
+        candidate_ids = []
+        candidate_scores = []
+        for segment in segments:
+            rows = self._live_rows(segment, superseded, owner_id)
+            if not len(rows):
+                continue
+            scores = segment.matrix[rows] @ query
+            positive = np.flatnonzero(scores > 0)
+            if len(positive) > k:
+                positive = positive[np.argpartition(-scores[positive], k - 1)[:k]]
+            candidate_ids.extend(segment.ids[rows[positive]].tolist())
+            candidate_scores.extend(scores[positive].tolist())
+
+        ranked = sorted(zip(candidate_ids, candidate_scores), key=lambda x: (-x[1], x[0]))
+        return ranked[:k]
+
+    def count(self, owner_id=None):
+        """Number of live rows, optionally for one owner."""
+        segments, superseded = self._snapshot()
+        return sum(len(self._live_rows(segment, superseded, owner_id)) for segment in segments)
+
+    def clear(self):
+        """Remove every row from the index."""
+        with self._locked_manifest() as manifest:
+            manifest['stale'] = [entry['name'] for entry in manifest['segments']]
+            manifest['segments'] = []
+            manifest['superseded'] = {}
+
+    def rebuild(self, items, batch_size=5000):
+        """Replace the whole index with (job_id, owner_id, text) tuples."""
+        self.clear()
+        batch = []
+        for item in items:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                self.upsert_many(batch)
+                batch = []
+        self.upsert_many(batch)
+
+    def compact(self):
+        """
+        Merge all live rows into one segment and drop the superseded ids it
+        no longer needs. The merged segment is written outside the manifest
+        lock, so concurrent writes only wait for the swap; writes made in the
+        meantime stay in their own segments. Returns False if another process
+        changed the merged segments first.
+        """
+        with self._lock:
+            manifest = json.loads(json.dumps(self._current_manifest()))
+            segments = [self._segment(entry) for entry in manifest['segments']]
+        if not segments:
+            return True
+        superseded = manifest['superseded']
+
+        blocks, ids, owners = [], [], []
+        for segment in segments:
+            rows = self._live_rows(segment, superseded)
+            if len(rows):
+                blocks.append(segment.matrix[rows])
+                ids.extend(segment.ids[rows].tolist())
+                owners.extend(segment.owners[rows].tolist())
+        name = self._write_segment(sparse.vstack(blocks, format='csr'), ids, owners) if blocks else None
+        merged = {segment.name for segment in segments}
+
+        with self._locked_manifest() as current:
+            if not merged <= {entry['name'] for entry in current['segments']}:
+                current['stale'] = [name] if name else []
+                return False
+            # The merged segment takes the newest merged seq: rows written
+            # later still supersede it, and its own rows are all live
+            current['segments'] = [entry for entry in current['segments'] if entry['name'] not in merged]
+            if name:
+                current['segments'].insert(0, {'name': name, 'seq': max(segment.seq for segment in segments)})
+            # Ids superseded before the snapshot only hid rows that were merged away
+            current['superseded'] = {
+                job_id: seq for job_id, seq in current['superseded'].items() if superseded.get(job_id) != seq
+            }
+            current['stale'] = sorted(merged)
+        return True
+
+    def _needs_compaction(self, manifest):
+        return len(manifest['segments']) > self.max_segments or len(manifest['superseded']) > self.MAX_SUPERSEDED
+
+    def _compact_in_background(self):
+        """Start compact() on a thread unless this process is already compacting."""
+        with self._lock:
+            if self._compacting:
+                return
+            self._compacting = True
+        # Not a daemon, so short-lived scripts finish the merge before exiting
+        Thread(target=self._run_compaction, name='job-vector-compaction').start()
+
+    def _run_compaction(self):
+        try:
+            self.compact()
+        except Exception as e:
+            logger.warning('Job vector store compaction failed: %s', e)
+        finally:
+            self._compacting = False
+
+    def _write_segment(self, matrix, ids, owners):
+        """Write a CSR matrix with its ids and owners as .npy files."""
+        os.makedirs(self.path, exist_ok=True)
+        matrix = sparse.csr_matrix(matrix, dtype=np.float32)
+        name = f"seg-{uuid.uuid4().hex}"
+        prefix = os.path.join(self.path, name)
+        np.save(prefix + '.indptr.npy', matrix.indptr.astype(np.int64))
+        np.save(prefix + '.indices.npy', matrix.indices.astype(np.int32))
+        np.save(prefix + '.data.npy', matrix.data.astype(np.float32))
+        np.save(prefix + '.ids.npy', np.array(ids, dtype='<U32'))
+        np.save(prefix + '.owners.npy', np.array(owners, dtype='<U32'))
+        return name
+
+    def _snapshot(self):
+        """Loaded segments and superseded ids of the current manifest."""
+        with self._lock:
+            try:
+                manifest = self._current_manifest()
+                segments = [self._segment(entry) for entry in manifest['segments']]
+            except FileNotFoundError:
+                # Another process compacted between reading the manifest and the segments
+                self._manifest_mtime = None
+                manifest = self._current_manifest()
+                segments = [self._segment(entry) for entry in manifest['segments']]
+            return segments, dict(manifest['superseded'])
+
+    @staticmethod
+    def _live_rows(segment, superseded, owner_id=None):
+        """
+        Positions of rows not superseded by a later write. With owner_id only
+        that owner's rows are looked at, so the cost follows their number
+        rather than the size of the segment or of the superseded map.
+        """
+        if owner_id is not None:
+            rows = segment.owner_rows(str(owner_id))
+            if not len(rows) or not superseded:
+                return rows
+            seq = segment.seq
+            keep = [superseded.get(job_id, 0) <= seq for job_id in segment.ids[rows].tolist()]
+            return rows[np.array(keep, dtype=bool)]
+
+        live = np.ones(len(segment.ids), dtype=bool)
+        for job_id, seq in superseded.items():
+            if seq > segment.seq:
+                live[segment.rows_of(job_id)] = False
+        return np.flatnonzero(live)
+
+    def _segment(self, entry):
+        """Load (or reuse) the memory-mapped segment for a manifest entry."""
+        segment = self._segments.get(entry['name'])
+        if segment is None:
+            segment = _Segment(self.path, entry['name'], entry['seq'], self.n_features)
+            self._segments[entry['name']] = segment
+        return segment
+
+    def _current_manifest(self):
+        """Manifest as last written by any process."""
+        manifest_path = os.path.join(self.path, self.MANIFEST)
+        try:
+            mtime = os.stat(manifest_path).st_mtime_ns
+        except FileNotFoundError:
+            return self._empty_manifest()
+
+        if mtime != self._manifest_mtime:
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+            if manifest.get('n_features') != self.n_features:
+                # Vector width changed; the index must be rebuilt
+                manifest = self._empty_manifest()
+            self._manifest = manifest
+            self._manifest_mtime = mtime
+            live = {entry['name'] for entry in manifest['segments']}
+            self._segments = {name: seg for name, seg in self._segments.items() if name in live}
+        return self._manifest
+
+    def _empty_manifest(self):
+        return {'n_features': self.n_features, 'next_seq': 1, 'segments': [], 'superseded': {}}
+
+    def _locked_manifest(self):
+        return _ManifestTransaction(self)
+
+
+class _ManifestTransaction:
+    """Read-modify-write of the manifest under a process and thread lock."""
+
+    def __init__(self, store):
+        self.store = store
+        self.lock_file = None
+
+    def __enter__(self):
+        store = self.store
+        store._lock.acquire()
+        try:
+            os.makedirs(store.path, exist_ok=True)
+            if fcntl is not None:
+                self.lock_file = open(os.path.join(store.path, '.lock'), 'w')
+                fcntl.flock(self.lock_file, fcntl.LOCK_EX)
+            self.manifest = json.loads(json.dumps(store._current_manifest()))
+        except Exception:
+            self._release()
+            raise
+        return self.manifest
+
+    def __exit__(self, exc_type, exc, tb):
+        store = self.store
+        try:
+            if exc_type is None:
+                stale = self.manifest.pop('stale', [])
+                manifest_path = os.path.join(store.path, store.MANIFEST)
+                tmp_path = manifest_path + '.tmp'
+                with open(tmp_path, 'w') as f:
+                    json.dump(self.manifest, f)
+                os.replace(tmp_path, manifest_path)
+                _remove_segment_files(store.path, stale)
+        finally:
+            self._release()
+        return False
+
+    def _release(self):
+        if self.lock_file is not None:
+            fcntl.flock(self.lock_file, fcntl.LOCK_UN)
+            self.lock_file.close()
+            self.lock_file = None
+        self.store._lock.release()
+
+
+def _load_array(path):
+    """Memory-map a .npy file; empty arrays cannot be mapped and are read directly."""
+    try:
+        return np.load(path, mmap_mode='r')
+    except ValueError:
+        return np.load(path)
+
+
+def _remove_segment_files(directory, names):
+    """Delete files of compacted segments; open memory maps stay valid on POSIX."""
+    for name in names:
+        for suffix in ('indptr', 'indices', 'data', 'ids', 'owners'):
+            try:
+                os.remove(os.path.join(directory, f"{name}.{suffix}.npy"))
+            except OSError:
+                pass
+
+
+def job_document_text(job):
+    """Text indexed for a job application document."""
+    return job.get('description') or job.get('position', '')
+
+
+def index_jobs(jobs, store=None, batch_size=5000):
+    """
+    Index job documents, reusing their stored description vectors.
+    Returns {job _id: features} for documents without a usable stored vector,
+    so callers can persist the freshly computed features.
+    """
+    store = store or job_vectors
+    computed = {}
+    batch = []
+
+    def flush():
+        rows = []
+        missing = [job for job in batch if JobMatcher.decode_vector(job.get('description_vector')) is None]
+        if missing:
+            for job, features in zip(missing, JobMatcher.vectorize_jobs([job_document_text(job) for job in missing])):
+                job.update(features)
+                computed[job['_id']] = features
+        for job in batch:
+            rows.append(JobMatcher.decode_vector(job['description_vector']))
+        store.upsert_vectors(
+            [job['_id'] for job in batch],
+            [job['user_id'] for job in batch],
+            sparse.vstack(rows, format='csr')
+        )
+        batch.clear()
+
+    for job in jobs:
+        batch.append(job)
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+    return computed
+
+
+# Shared store, loaded lazily on first use
+job_vectors = JobVectorStore(
+    Config.JOB_VECTOR_STORE_PATH,
+    Config.MATCHER_HASH_FEATURES,
+    max_segments=Config.JOB_VECTOR_MAX_SEGMENTS
+)
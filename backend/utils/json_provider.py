@@ -0,0 +1,63 @@
+"""
+JSON Provider for API Responses
+orjson when installed (stdlib json otherwise), with datetime and ObjectId support
+"""
+
+from datetime import date
+from flask.json.provider import DefaultJSONProvider
+from bson import ObjectId
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used instead
+    orjson = None
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    Serialize responses with orjson when available.
+    Datetimes are written as ISO 8601 (same as .isoformat()) and ObjectIds as
+    strings by either encoder, so handlers can return stored values directly.
+    Keys stay sorted so identical payloads produce identical bytes (and ETags).
+    """
+    
+    @staticmethod
+    def default(o):
+        if isinstance(o, ObjectId):
+            return str(o)
+        if isinstance(o, date):
+            return o.isoformat()
+        return DefaultJSONProvider.default(o)
+    
+    def dumps(self, obj, **kwargs):
+        # orjson only covers the layout options Flask itself passes
+        if orjson is None or set(kwargs) - {'indent', 'separators'}:
+            return super().dumps(obj, **kwargs)
+        return self._orjson_dumps(obj, kwargs.get('indent')).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = 2 if (self.compact is None and self._app.debug) or self.compact is False else None
+        if orjson is None:
+            return super().response(obj)
+        body = self._orjson_dumps(obj, indent, orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+    
+    def _orjson_dumps(self, obj, indent=None, option=0):
+        option |= orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent is not None:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=self.default, option=option)
+        except TypeError:
+            # Values orjson rejects (e.g. integers over 64 bits) go through stdlib json
+            layout = {'indent': indent} if indent else {'separators': (',', ':')}
+            text = DefaultJSONProvider.dumps(self, obj, **layout)
+            return (text + ('\n' if option & orjson.OPT_APPEND_NEWLINE else '')).encode('utf-8')
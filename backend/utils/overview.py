@@ -0,0 +1,143 @@
+"""
+Dashboard and Profile Overviews
+Query plans and response builders shared by the WSGI and ASGI handlers
+"""
+
+from datetime import timedelta
+from utils.serializers import user_serializer, profile_serializer
+
+STATUSES = ['applied', 'in-review', 'interview', 'offer', 'rejected']
+TREND_MONTHS = 6
+PROFILE_FIELDS = ['name', 'email', 'phone', 'location', 'title', 'bio']
+
+# Handlers describe their reads as (key, collection, operation, arguments)
+# tuples so the WSGI and ASGI apps issue the same queries; operations are
+# Repository method names: 'count' (filter) and 'aggregate' (pipeline), both
+# read with the analytics read preference, 'find_one' (filter, projection)
+# and 'recent' (filter, sort field, limit). repositories.run_reads runs them
+# through the repositories, utils.aio.run_reads on Motor; both return
+# {key: result}.
+
+
+def dashboard_reads(user_id, now):
+    """Reads behind the dashboard, for build_dashboard."""
+    return [
+        ('status_rows', 'job_applications', 'aggregate', (dashboard_pipeline(user_id, now),)),
+        ('skills', 'skills', 'count', ({'user_id': user_id},)),
+        ('recent_jobs', 'job_applications', 'recent', ({'user_id': user_id}, 'created_at', 5))
+    ]
+
+
+def dashboard_pipeline(user_id, now):
+    """
+    Aggregation over the user's applications returning one row per status,
+    with its count and, for each trend month i, how many were applied since
+    then (since_<i>); dashboard_status_counts turns the rows into counts.
+    """
+    group = {'_id': '$status', 'count': {'$sum': 1}}
+    for i in range(TREND_MONTHS):
+        since = now - timedelta(days=30 * i)
+        group[f'since_{i}'] = {'$sum': {'$cond': [{'$gte': ['$applied_date', since]}, 1, 0]}}
+    return [{'$match': {'user_id': user_id}}, {'$group': group}]
+
+
+def dashboard_status_counts(rows):
+    """{key: count} of the application counts from the dashboard_pipeline rows."""
+    def total(field, statuses=None):
+        return sum(row[field] for row in rows if statuses is None or row['_id'] in statuses)
+    
+    counts = {
+        'total': total('count'),
+        'active': total('count', ('applied', 'in-review'))
+    }
+    for status in STATUSES:
+        counts[('status', status)] = total('count', (status,))
+    
+    # Application trend (last 6 months)
+    for i in range(TREND_MONTHS):
+        counts[('applications', i)] = total(f'since_{i}')
+        counts[('interviews', i)] = total(f'since_{i}', ('interview',))
+        counts[('offers', i)] = total(f'since_{i}', ('offer',))
+    return counts
+
+
+def build_dashboard(results, now):
+    """Dashboard payload from the results of dashboard_reads."""
+    counts = dashboard_status_counts(results['status_rows'])
+    trend_data = []
+    for i in range(TREND_MONTHS - 1, -1, -1):
+        trend_data.append({
+            'month': (now - timedelta(days=30 * i)).strftime('%b'),
+            'applications': counts[('applications', i)],
+            'interviews': counts[('interviews', i)],
+            'offers': counts[('offers', i)]
+        })
+    
+    return {
+        'stats': {
+            'totalApplications': counts['total'],
+            'activeApplications': counts['active'],
+            'interviewsScheduled': counts[('status', 'interview')],
+            'skillsIdentified': results['skills']
+        },
+        'trendData': trend_data,
+        'statusBreakdown': [
+            {'name': status.replace('-', ' ').title(), 'value': counts[('status', status)]}
+            for status in STATUSES
+        ],
+        'recentActivity': [
+            {
+                'action': f"Applied to {job['company']} - {job['position']}",
+                'time': job.get('applied_date') or now,
+                'status': job['status']
+            }
+            for job in results['recent_jobs']
+        ]
+    }
+
+
+def profile_reads(user_id):
+    """Reads behind the profile, for build_profile."""
+    return [
+        ('user', 'users', 'find_one', ({'_id': user_id}, dict(user_serializer.projection, created_at=1))),
+        ('profile', 'profiles', 'find_one', ({'user_id': user_id}, profile_serializer.projection))
+    ]
+
+
+def build_profile(results):
+    """Profile payload from the results of profile_reads; None without a user."""
+    user = results['user']
+    if not user:
+        return None
+    profile = user_serializer.one(user)
+    profile.update(profile_serializer.one(results['profile'] or {}))
+    profile['created_at'] = user.get('created_at')
+    return {'profile': profile}
+
+
+def profile_stats_reads(user_id):
+    """Reads behind the profile statistics, for build_profile_stats."""
+    return [
+        ('profile', 'profiles', 'find_one', ({'user_id': user_id}, None)),
+        ('applications', 'job_applications', 'count', ({'user_id': user_id},)),
+        ('resumes', 'resumes', 'count', ({'user_id': user_id},)),
+        ('skills', 'skills', 'count', ({'user_id': user_id},)),
+        ('responses', 'job_applications', 'count', ({'user_id': user_id, 'status': {'$in': ['interview', 'offer']}},))
+    ]
+
+
+def build_profile_stats(results):
+    """Profile statistics from the results of profile_stats_reads."""
+    profile = results['profile']
+    # name and email are always filled
+    completed_fields = 2 + sum(1 for field in PROFILE_FIELDS[2:] if profile and profile.get(field))
+    total_applications = results['applications']
+    
+    return {
+        'profileCompleteness': int((completed_fields / len(PROFILE_FIELDS)) * 100),
+        'totalApplications': total_applications,
+        'totalResumes': results['resumes'],
+        'totalSkills': results['skills'],
+        # Mock calculation: share of applications that got a response
+        'responseRate': int((results['responses'] / total_applications) * 100) if total_applications else 0
+    }
@@ -0,0 +1,187 @@
+"""
+Per-Request Timing and Metrics Aggregation
+Phase timers bound to the current request and Prometheus-style histograms
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from threading import Lock
+import bisect
+import time
+
+# Timings of the request being handled in the current thread/context
+_current = ContextVar('request_timings', default=None)
+
+
+class RequestTimings:
+    """Wall, CPU, database and phase timings collected for one request."""
+    
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.cpu_started = time.thread_time()
+        self.db_commands = 0
+        self.db_seconds = 0.0
+        self.phases = {}
+        self._active = set()
+        # Queries fanned out to worker threads report here concurrently
+        self._lock = Lock()
+    
+    def record_db(self, seconds):
+        with self._lock:
+            self.db_commands += 1
+            self.db_seconds += seconds
+    
+    def add_phase(self, phase, seconds):
+        with self._lock:
+            self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+    
+    def wall_seconds(self):
+        return time.perf_counter() - self.started
+    
+    def cpu_seconds(self):
+        return time.thread_time() - self.cpu_started
+
+
+def start_request():
+    """Begin collecting timings for the current request; returns a reset token."""
+    return _current.set(RequestTimings())
+
+
+def end_request(token):
+    """Stop collecting timings for the current request."""
+    _current.reset(token)
+
+
+def current_timings():
+    """Timings of the current request, or None outside a request."""
+    return _current.get()
+
+
+@contextmanager
+def timed(phase):
+    """
+    Add the time spent in the block to a named phase of the current request.
+    Nested blocks for the same phase are only counted once.
+    """
+    timings = _current.get()
+    if timings is None or phase in timings._active:
+        yield
+        return
+    
+    timings._active.add(phase)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings._active.discard(phase)
+        timings.add_phase(phase, time.perf_counter() - started)
+
+
+def timed_phase(phase):
+    """Decorator form of timed()."""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with timed(phase):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by label values."""
+    
+    def __init__(self, name, help_text, label_names, buckets):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}
+        self._lock = Lock()
+    
+    def observe(self, value, *label_values):
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = {
+                    'counts': [0] * (len(self.buckets) + 1),
+                    'sum': 0.0
+                }
+            series['counts'][bisect.bisect_left(self.buckets, value)] += 1
+            series['sum'] += value
+    
+    def render(self):
+        """Exposition lines in the Prometheus text format."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted((labels, {'counts': list(s['counts']), 'sum': s['sum']})
+                            for labels, s in self._series.items())
+        
+        for label_values, data in series:
+            labels = [f'{name}="{_escape(value)}"' for name, value in zip(self.label_names, label_values)]
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), data['counts']):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(float(bound))
+                bucket_labels = ','.join(labels + [f'le="{le}"'])
+                lines.append(f"{self.name}_bucket{{{bucket_labels}}} {cumulative}")
+            suffix = f"{{{','.join(labels)}}}" if labels else ''
+            lines.append(f"{self.name}_sum{suffix} {data['sum']!r}")
+            lines.append(f"{self.name}_count{suffix} {cumulative}")
+        return lines
+    
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+class MetricsRegistry:
+    """Named collection of histograms rendered together."""
+    
+    def __init__(self):
+        self._metrics = []
+    
+    def histogram(self, name, help_text, label_names=(), buckets=()):
+        metric = Histogram(name, help_text, label_names, buckets)
+        self._metrics.append(metric)
+        return metric
+    
+    def render(self):
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+    
+    def clear(self):
+        for metric in self._metrics:
+            metric.clear()
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+
+registry = MetricsRegistry()
+
+request_seconds = registry.histogram(
+    'http_request_duration_seconds', 'Wall-clock time spent handling a request.',
+    ('endpoint', 'method', 'status'), LATENCY_BUCKETS)
+request_cpu_seconds = registry.histogram(
+    'http_request_cpu_seconds', 'CPU time of the handling thread per request.',
+    ('endpoint', 'method'), LATENCY_BUCKETS)
+db_commands = registry.histogram(
+    'http_request_db_commands', 'MongoDB commands issued per request.',
+    ('endpoint', 'method'), COUNT_BUCKETS)
+db_seconds = registry.histogram(
+    'http_request_db_seconds', 'Cumulative MongoDB command time per request.',
+    ('endpoint', 'method'), LATENCY_BUCKETS)
+phase_seconds = registry.histogram(
+    'http_request_phase_seconds', 'Time per request spent in PDF parsing and NLP.',
+    ('endpoint', 'method', 'phase'), LATENCY_BUCKETS)
+repository_seconds = registry.histogram(
+    'repository_call_seconds', 'Time spent in each data-access repository method.',
+    ('repository', 'method'), LATENCY_BUCKETS)
@@ -0,0 +1,216 @@
+"""
+Response Cache for Read Endpoints
+Serialized responses keyed per user, with pluggable backends and ETag revalidation
+"""
+
+from functools import wraps
+from flask import request, make_response, Response
+from middleware.auth_middleware import get_current_user_id
+from repositories.cache_repo import cache_generation_repo
+from utils.result_cache import LRUCache, career_results, fingerprint
+from config import Config
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+
+SHARED_OWNER = '_shared'
+
+
+class MemoryBackend:
+    """In-process LRU; entries are lost on restart and not shared between workers."""
+    
+    def __init__(self, max_size=1024):
+        self._entries = LRUCache(max_size)
+    
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry['expires'] < time.time():
+            self._entries.delete(key)
+            return None
+        return entry
+    
+    def set(self, key, entry, owner, ttl):
+        self._entries.set(key, entry, owner=owner)
+    
+    def invalidate_owner(self, owner):
+        self._entries.invalidate_owner(owner)
+    
+    def clear(self):
+        self._entries.clear()
+
+
+class DiskBackend:
+    """One file per entry under a directory per owner; shared by workers on one host."""
+    
+    def __init__(self, path):
+        self.path = path
+    
+    def get(self, key):
+        try:
+            with open(self._file(key), 'rb') as f:
+                entry = json.loads(f.readline())
+                entry['body'] = f.read()
+        except (OSError, ValueError):
+            return None
+        if entry['expires'] < time.time():
+            return None
+        return entry
+    
+    def set(self, key, entry, owner, ttl):
+        path = self._file(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        meta = {name: value for name, value in entry.items() if name != 'body'}
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(json.dumps(meta).encode('utf-8') + b'\n')
+            f.write(entry['body'])
+        os.replace(tmp_path, path)
+    
+    def invalidate_owner(self, owner):
+        shutil.rmtree(os.path.join(self.path, str(owner)), ignore_errors=True)
+    
+    def clear(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+    
+    def _file(self, key):
+        owner, digest = key.split('/', 1)
+        return os.path.join(self.path, owner, digest)
+
+
+class RedisBackend:
+    """
+    Any Redis-protocol server (Redis, Valkey, KeyDB, or a local stand-in).
+    Requires the optional `redis` package.
+    """
+    
+    PREFIX = 'response-cache:'
+    
+    def __init__(self, url):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("RESPONSE_CACHE_BACKEND=redis requires the 'redis' package")
+        self.client = redis.Redis.from_url(url)
+    
+    def get(self, key):
+        values = self.client.hgetall(self.PREFIX + key)
+        if not values:
+            return None
+        entry = json.loads(values[b'meta'])
+        entry['body'] = values[b'body']
+        return entry
+    
+    def set(self, key, entry, owner, ttl):
+        meta = {name: value for name, value in entry.items() if name != 'body'}
+        pipe = self.client.pipeline()
+        pipe.hset(self.PREFIX + key, mapping={'meta': json.dumps(meta), 'body': entry['body']})
+        pipe.expire(self.PREFIX + key, int(ttl))
+        pipe.sadd(self._owner_key(owner), key)
+        pipe.expire(self._owner_key(owner), int(ttl))
+        pipe.execute()
+    
+    def invalidate_owner(self, owner):
+        keys = [self.PREFIX + key.decode() for key in self.client.smembers(self._owner_key(owner))]
+        self.client.delete(self._owner_key(owner), *keys)
+    
+    def clear(self):
+        for key in self.client.scan_iter(self.PREFIX + '*'):
+            self.client.delete(key)
+    
+    def _owner_key(self, owner):
+        return f"{self.PREFIX}owner:{owner}"
+
+
+def create_backend(name):
+    """Build the backend selected by RESPONSE_CACHE_BACKEND ('none' disables caching)."""
+    if name == 'memory':
+        return MemoryBackend(Config.RESPONSE_CACHE_SIZE)
+    if name == 'disk':
+        return DiskBackend(Config.RESPONSE_CACHE_DIR)
+    if name == 'redis':
+        return RedisBackend(Config.RESPONSE_CACHE_URL)
+    if name == 'none':
+        return None
+    raise ValueError(f"Unknown response cache backend '{name}'. Expected one of: memory, disk, redis, none")
+
+
+def cached_response(scope, per_user=True, ttl=None, version=None):
+    """
+    Cache successful JSON responses of a read endpoint.
+    Keyed by scope, URL arguments, query string and (if per_user) the current
+    user and their cache generation, which invalidate_user() bumps. The
+    generation is read before the handler runs, so a response computed from
+    data older than a concurrent write is stored under the old generation and
+    never served. Per-user endpoints cost one extra query for the generation.
+    Apply below @token_required. Hits are served from the stored bytes, or as
+    an empty 304 when the client's If-None-Match already holds the ETag.
+    version: bump to orphan entries when the payload format changes.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if response_cache is None:
+                return fn(*args, **kwargs)
+            
+            owner = str(get_current_user_id()) if per_user else SHARED_OWNER
+            generation = cache_generation_repo.generation(owner) if per_user else 0
+            key = f"{owner}/" + fingerprint(
+                scope, version, generation, request.view_args, sorted(request.args.items(multi=True))
+            )
+            
+            entry = response_cache.get(key)
+            if entry is not None:
+                return _cached(entry)
+            
+            response = make_response(fn(*args, **kwargs))
+            if response.status_code != 200 or not response.is_json:
+                return response
+            
+            body = response.get_data()
+            lifetime = ttl or Config.RESPONSE_CACHE_TTL
+            entry = {
+                'body': body,
+                'status': response.status_code,
+                'mimetype': response.mimetype,
+                'etag': hashlib.sha1(body).hexdigest(),
+                'expires': time.time() + lifetime
+            }
+            response_cache.set(key, entry, owner, lifetime)
+            return _cached(entry)
+        return wrapper
+    return decorator
+
+
+def _cached(entry):
+    """Response for a cache entry, or a 304 if the client has this version."""
+    if request.if_none_match.contains(entry['etag']):
+        response = Response(status=304)
+    else:
+        response = Response(entry['body'], status=entry['status'], mimetype=entry['mimetype'])
+    response.set_etag(entry['etag'])
+    # Clients may keep the body but must revalidate with the ETag
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+def invalidate_user(user_id):
+    """
+    Invalidate a user's cached responses after a write. Bumping the generation
+    reaches every worker (and scripts such as reanalyze_resumes.py); the local
+    entries are dropped as well to free their memory. career_results entries
+    are keyed by the skill set they were computed from, so they never go stale
+    and are only dropped here to free memory.
+    """
+    if response_cache is not None:
+        cache_generation_repo.bump(str(user_id))
+        response_cache.invalidate_owner(str(user_id))
+    career_results.invalidate_owner(user_id)
+
+
+# Shared response cache for the configured backend
+response_cache = create_backend(Config.RESPONSE_CACHE_BACKEND)
@@ -0,0 +1,106 @@
+"""
+In-process memoization for deterministic career analysis results
+LRU eviction, skill-set fingerprints and ETag helpers
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from flask import request, jsonify, Response
+from config import Config
+import hashlib
+import json
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache with per-user invalidation."""
+    
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._owners = {}
+        self._key_owners = {}
+        self._lock = Lock()
+    
+    def get(self, key):
+        """Return cached value for key, or None on a miss."""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+    
+    def set(self, key, value, owner=None):
+        """Store value under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if self._key_owners.get(key) != owner:
+                self._unlink_owner(key)
+                if owner is not None:
+                    self._owners.setdefault(owner, set()).add(key)
+                    self._key_owners[key] = owner
+            while len(self._entries) > self.max_size:
+                evicted, _ = self._entries.popitem(last=False)
+                self._unlink_owner(evicted)
+    
+    def delete(self, key):
+        """Remove the entry for key, if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._unlink_owner(key)
+    
+    def invalidate_owner(self, owner):
+        """Drop every entry that was stored on behalf of owner."""
+        with self._lock:
+            for key in self._owners.pop(owner, ()):
+                self._entries.pop(key, None)
+                self._key_owners.pop(key, None)
+    
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._owners.clear()
+            self._key_owners.clear()
+    
+    def _unlink_owner(self, key):
+        """Remove key from its owner's key set (caller holds the lock)."""
+        owner = self._key_owners.pop(key, None)
+        if owner is None:
+            return
+        keys = self._owners.get(owner)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._owners[owner]
+    
+    def __len__(self):
+        return len(self._entries)
+
+
+def fingerprint(*parts):
+    """Stable short hash of JSON-serializable parts."""
+    payload = json.dumps(parts, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def skill_set_fingerprint(skill_names):
+    """Fingerprint a list of skill names independent of order and case."""
+    return fingerprint(sorted(name.lower() for name in skill_names))
+
+
+def conditional_response(payload, etag, status=200):
+    """Return payload with an ETag, or an empty 304 if the client already has it."""
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = jsonify(payload)
+        response.status_code = status
+    response.set_etag(etag)
+    return response
+
+
+# Shared memo for roadmap and skill-gap results, keyed by catalog version,
+# role and skill-set fingerprint so entries are reusable across users and
+# cannot go stale in other workers (a changed skill set is a different key)
+career_results = LRUCache(Config.RESULT_CACHE_SIZE)
@@ -1,6 +1,8 @@
 import PyPDF2
-import re
+import hashlib
 from collections import Counter
+from utils.request_metrics import timed_phase
+from utils.resume_sections import SECTION_HEADINGS, SectionFeatures, section_hash, section_kind, segment
 
 class ResumeAnalyzer:
     """Analyze resume and provide feedback."""
@@ -20,7 +22,27 @@ class ResumeAnalyzer:
         'delivered', 'solved', 'analyzed', 'collaborated', 'coordinated'
     }
     
+    # Skills suggested when missing
+    COMMON_REQUIRED_SKILLS = ('typescript', 'docker', 'kubernetes', 'ci/cd', 'aws')
+    
+    # Bump when scoring, feedback or section splitting rules change; lexicon
+    # and heading edits change the fingerprint part of version() on their own
+    RULES_VERSION = 3
+    _version = None
+    
+    @classmethod
+    def version(cls):
+        """Analyzer version stored with each analysis, e.g. '1-3f2a9c1e'."""
+        if cls._version is None:
+            lexicons = '|'.join(','.join(sorted(words)) for words in (
+                cls.TECHNICAL_SKILLS, cls.ACTION_VERBS, cls.COMMON_REQUIRED_SKILLS,
+                (f'{heading}={name}' for heading, name in SECTION_HEADINGS.items())
+            ))
+            cls._version = f"{cls.RULES_VERSION}-{hashlib.sha1(lexicons.encode('utf-8')).hexdigest()[:8]}"
+        return cls._version
+    
     @staticmethod
+    @timed_phase('pdf')
     def extract_text_from_pdf(file_path):
         """Extract text from PDF file."""
         try:
@@ -36,8 +58,23 @@ class ResumeAnalyzer:
     @staticmethod
     def analyze_resume(file_path):
         """Analyze resume and return detailed feedback."""
-        text = ResumeAnalyzer.extract_text_from_pdf(file_path)
-        
+        return ResumeAnalyzer.analyze_text(ResumeAnalyzer.extract_text_from_pdf(file_path))
+    
+    @staticmethod
+    def analyze_text(text):
+        """Analyze already extracted resume text."""
+        return ResumeAnalyzer.analyze_sections(text)[0]
+    
+    @staticmethod
+    @timed_phase('nlp')
+    def analyze_sections(text, cached=None):
+        """
+        (analysis, sections) for resume text, where sections lists
+        {'name', 'start', 'end', 'hash', 'features'} per section, in document
+        order with character offsets into `text`. Features found in `cached`
+        ({hash: features}, e.g. from a previous revision analyzed by the same
+        version) are reused, so only new or changed sections are scanned.
+        """
         if not text:
             return {
                 'score': 0,
@@ -46,30 +83,41 @@ class ResumeAnalyzer:
                 'improvements': ['Please ensure your resume is a valid PDF with extractable text'],
                 'skills': {'detected': [], 'missing': []},
                 'error': True
-            }
-        
-        text_lower = text.lower()
-        words = re.findall(r'\b\w+\b', text_lower)
-        
+            }, []
+        
+        cached = cached or {}
+        sections = segment(text)
+        for section in sections:
+            section_text = text[section['start']:section['end']]
+            section['hash'] = section_hash(section_text)
+            features = cached.get(section['hash'])
+            if features is None:
+                features = SectionFeatures.compute(section_text, ResumeAnalyzer.TECHNICAL_SKILLS, ResumeAnalyzer.ACTION_VERBS)
+            section['features'] = features
+        
+        return ResumeAnalyzer.analyze_features(
+            SectionFeatures.merge(section['features'] for section in sections),
+            {section_kind(section['name']) for section in sections}
+        ), sections
+    
+    @staticmethod
+    def analyze_features(features, section_kinds):
+        """Analysis from the merged features of a whole resume and the kinds of its sections."""
         # Detect skills
-        detected_skills = []
-        for skill in ResumeAnalyzer.TECHNICAL_SKILLS:
-            if skill in text_lower:
-                detected_skills.append(skill.title())
+        detected_skills = [skill.title() for skill in ResumeAnalyzer.TECHNICAL_SKILLS if skill in features['skills']]
         
         # Calculate scores
-        score = ResumeAnalyzer._calculate_score(text, text_lower, words, detected_skills)
-        ats_score = ResumeAnalyzer._calculate_ats_score(text, detected_skills)
+        score = ResumeAnalyzer._calculate_score(features, section_kinds, detected_skills)
+        ats_score = ResumeAnalyzer._calculate_ats_score(section_kinds, detected_skills)
         
         # Generate strengths and improvements
-        strengths = ResumeAnalyzer._identify_strengths(text, text_lower, detected_skills)
-        improvements = ResumeAnalyzer._suggest_improvements(text, text_lower, detected_skills)
+        strengths = ResumeAnalyzer._identify_strengths(features, detected_skills)
+        improvements = ResumeAnalyzer._suggest_improvements(features, detected_skills)
         
         # Suggest missing skills
         missing_skills = []
-        common_required = ['typescript', 'docker', 'kubernetes', 'ci/cd', 'aws']
-        for skill in common_required:
-            if skill not in text_lower:
+        for skill in ResumeAnalyzer.COMMON_REQUIRED_SKILLS:
+            if skill not in features['skills']:
                 missing_skills.append(skill.title())
         
         return {
@@ -85,7 +133,7 @@ class ResumeAnalyzer:
         }
     
     @staticmethod
-    def _calculate_score(text, text_lower, words, detected_skills):
+    def _calculate_score(features, section_kinds, detected_skills):
         """Calculate overall resume score."""
         score = 50  # Base score
         
@@ -93,25 +141,24 @@ class ResumeAnalyzer:
         score += min(len(detected_skills) * 2, 20)
         
         # Has quantifiable achievements (+10 points)
-        if re.search(r'\d+%|\$\d+|increased|reduced|improved', text_lower):
+        if 'quantified' in features['patterns']:
             score += 10
         
         # Has action verbs (+10 points)
-        action_verb_count = sum(1 for verb in ResumeAnalyzer.ACTION_VERBS if verb in text_lower)
-        score += min(action_verb_count * 2, 10)
+        score += min(len(features['verbs']) * 2, 10)
         
         # Length appropriate (+5 points)
-        if 300 < len(words) < 800:
+        if 300 < features['words'] < 800:
             score += 5
         
-        # Has clear sections (+5 points)
-        if all(section in text_lower for section in ['experience', 'education']):
+        # Has clear sections: experience and education headings (+5 points)
+        if {'experience', 'education'} <= section_kinds:
             score += 5
         
         return min(score, 100)
     
     @staticmethod
-    def _calculate_ats_score(text, detected_skills):
+    def _calculate_ats_score(section_kinds, detected_skills):
         """Calculate ATS compatibility score."""
         score = 70  # Base score
         
@@ -122,27 +169,26 @@ class ResumeAnalyzer:
         score += 10
         
         # Standard section names (+5 points)
-        if 'experience' in text.lower() and 'education' in text.lower():
+        if {'experience', 'education'} <= section_kinds:
             score += 5
         
         return min(score, 100)
     
     @staticmethod
-    def _identify_strengths(text, text_lower, detected_skills):
+    def _identify_strengths(features, detected_skills):
         """Identify resume strengths."""
         strengths = []
         
         if len(detected_skills) >= 5:
             strengths.append('Strong technical skills section with relevant technologies')
         
-        if re.search(r'\d+%|\d+\+', text):
+        if 'measurable' in features['patterns']:
             strengths.append('Well-structured work experience with measurable achievements')
         
-        action_verbs_found = [v for v in ResumeAnalyzer.ACTION_VERBS if v in text_lower]
-        if len(action_verbs_found) >= 5:
+        if len(features['verbs']) >= 5:
             strengths.append('Good use of action verbs and quantified results')
         
-        if 'project' in text_lower or 'github' in text_lower:
+        if 'project' in features['terms'] or 'github' in features['terms']:
             strengths.append('Includes relevant projects demonstrating practical experience')
         
         if not strengths:
@@ -151,23 +197,51 @@ class ResumeAnalyzer:
         return strengths
     
     @staticmethod
-    def _suggest_improvements(text, text_lower, detected_skills):
+    def _suggest_improvements(features, detected_skills):
         """Suggest improvements for resume."""
         improvements = []
         
         if len(detected_skills) < 5:
             improvements.append('Add more specific technical skills and tools you\'re proficient in')
         
-        if not re.search(r'\d+%|\d+ |increased|reduced', text_lower):
+        if 'impact' not in features['patterns']:
             improvements.append('Include quantifiable achievements and metrics to demonstrate impact')
         
-        if 'certification' not in text_lower and 'certified' not in text_lower:
+        if 'certification' not in features['terms'] and 'certified' not in features['terms']:
             improvements.append('Consider adding relevant certifications or courses')
         
-        if not re.search(r'github|portfolio|project', text_lower):
+        if 'links' not in features['patterns']:
             improvements.append('Include links to your portfolio, GitHub, or key projects')
         
         if not improvements:
             improvements.append('Continue keeping your resume updated with recent experiences')
         
         return improvements[:4]  # Return top 4 improvements
+
+
+def reanalyze_resume(resume):
+    """
+    (resume _id, text, analysis, sections) for a stored resume document,
+    reusing its extracted_text when present; analysis is None if no text can
+    be read, so an earlier analysis is not replaced by an error. Runs in
+    worker processes.
+    """
+    text = resume.get('extracted_text') or ResumeAnalyzer.extract_text_from_pdf(resume['file_path'])
+    if not text:
+        return resume['_id'], None, None, None
+    return (resume['_id'], text) + ResumeAnalyzer.analyze_sections(text)
+
+
+def load_resume_text(resume):
+    """
+    (text, sections) for a stored resume document with file_path,
+    extracted_text, sections and analyzer_version: the stored text and section
+    offsets when available, so the PDF is neither read nor re-segmented;
+    otherwise extracted and segmented again. text is None if unreadable.
+    """
+    text = resume.get('extracted_text') or ResumeAnalyzer.extract_text_from_pdf(resume['file_path'])
+    if not text:
+        return None, []
+    if resume.get('extracted_text') and resume.get('sections') and resume.get('analyzer_version') == ResumeAnalyzer.version():
+        return text, resume['sections']
+    return text, segment(text)
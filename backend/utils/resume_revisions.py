@@ -0,0 +1,130 @@
+"""
+Resume Revisions
+Detect a new upload as a revision of an earlier resume and report what changed
+"""
+
+from difflib import SequenceMatcher
+from utils.resume_analyzer import ResumeAnalyzer
+from utils.resume_sections import SectionFeatures
+
+# Fields of earlier resumes read to detect and diff a revision
+REVISION_PROJECTION = {
+    'filename': 1, 'extracted_text': 1, 'sections': 1, 'analyzer_version': 1,
+    'analysis': 1, 'score': 1, 'ats_score': 1
+}
+
+
+def _lines(text):
+    """Non-empty, whitespace-normalized lines of a text."""
+    return [' '.join(line.split()) for line in text.splitlines() if line.strip()]
+
+
+def text_similarity(a, b):
+    """Jaccard similarity of the two texts' line sets (0..1)."""
+    lines_a, lines_b = set(_lines(a)), set(_lines(b))
+    if not lines_a or not lines_b:
+        return 0.0
+    return len(lines_a & lines_b) / len(lines_a | lines_b)
+
+
+def find_previous(candidates, filename, text, min_similarity, min_filename_similarity):
+    """
+    (previous resume, how it matched, similarity) among the user's recent
+    resumes (newest first): the latest with the same filename whose text is
+    at least `min_filename_similarity` alike (a reused name like 'resume.pdf'
+    alone does not make a revision), otherwise the most similar text at or
+    above `min_similarity`; (None, None, 0) if none.
+    """
+    candidates = [resume for resume in candidates if resume.get('extracted_text')]
+    similarities = [text_similarity(resume['extracted_text'], text) for resume in candidates]
+    for resume, similarity in zip(candidates, similarities):
+        if resume.get('filename') == filename and similarity >= min_filename_similarity:
+            return resume, 'filename', round(similarity, 4)
+    
+    best, best_similarity = None, 0.0
+    for resume, similarity in zip(candidates, similarities):
+        if similarity > best_similarity:
+            best, best_similarity = resume, similarity
+    if best is None or best_similarity < min_similarity:
+        return None, None, 0
+    return best, 'similarity', round(best_similarity, 4)
+
+
+def previous_sections(previous):
+    """
+    (analysis, sections) of an earlier resume: stored ones if it was analyzed
+    by the current analyzer version, otherwise recomputed from its text so the
+    comparison is like for like.
+    """
+    if previous.get('analyzer_version') == ResumeAnalyzer.version() and previous.get('sections'):
+        return previous['analysis'], previous['sections']
+    return ResumeAnalyzer.analyze_sections(previous['extracted_text'])
+
+
+def section_diff(old_text, new_text, old_sections, new_sections, max_lines):
+    """
+    Per-section changes between two texts, in the new resume's section order
+    followed by removed sections: {'section', 'status', 'added', 'removed'}
+    with at most `max_lines` changed lines listed each way.
+    """
+    old_hashes = {section['name']: section['hash'] for section in old_sections}
+    old_texts = {section['name']: old_text[section['start']:section['end']] for section in old_sections}
+    new_texts = {section['name']: new_text[section['start']:section['end']] for section in new_sections}
+    
+    changes = []
+    for section in new_sections:
+        name = section['name']
+        if name not in old_hashes:
+            status = 'added'
+        elif old_hashes[name] == section['hash']:
+            changes.append({'section': name, 'status': 'unchanged', 'added': [], 'removed': []})
+            continue
+        else:
+            status = 'changed'
+        added, removed = _line_changes(_lines(old_texts.get(name, '')), _lines(new_texts[name]))
+        changes.append({'section': name, 'status': status, 'added': added[:max_lines], 'removed': removed[:max_lines]})
+    
+    new_names = {section['name'] for section in new_sections}
+    for section in old_sections:
+        if section['name'] not in new_names:
+            changes.append({
+                'section': section['name'], 'status': 'removed',
+                'added': [], 'removed': _lines(old_texts.get(section['name'], ''))[:max_lines]
+            })
+    return changes
+
+
+def _line_changes(old_lines, new_lines):
+    """(added lines, removed lines) between two line lists."""
+    added, removed = [], []
+    for tag, i1, i2, j1, j2 in SequenceMatcher(None, old_lines, new_lines, autojunk=False).get_opcodes():
+        if tag in ('replace', 'delete'):
+            removed.extend(old_lines[i1:i2])
+        if tag in ('replace', 'insert'):
+            added.extend(new_lines[j1:j2])
+    return added, removed
+
+
+def delta_report(previous, matched_by, similarity, old_analysis, old_sections, analysis, sections, text, max_lines):
+    """
+    Changes from an earlier resume (with its analysis and sections from
+    previous_sections) to the new analysis: score deltas, skills added and
+    removed (over all detected skills, not only the eight listed in the
+    analysis) and the section diff.
+    """
+    old_skills = SectionFeatures.merge(section['features'] for section in old_sections)['skills']
+    new_skills = SectionFeatures.merge(section['features'] for section in sections)['skills']
+    reused = {section['hash'] for section in old_sections}
+    
+    return {
+        'previousResumeId': previous['_id'],
+        'matchedBy': matched_by,
+        'similarity': similarity,
+        'scoreChange': analysis.get('score', 0) - old_analysis.get('score', 0),
+        'atsScoreChange': analysis.get('atsScore', 0) - old_analysis.get('atsScore', 0),
+        'skillsAdded': [skill.title() for skill in sorted(new_skills - old_skills)],
+        'skillsRemoved': [skill.title() for skill in sorted(old_skills - new_skills)],
+        'sectionsRescored': sum(1 for section in sections if section['hash'] not in reused),
+        'sectionsReused': sum(1 for section in sections if section['hash'] in reused),
+        'sections': section_diff(previous['extracted_text'], text, old_sections, sections, max_lines)
+    }
@@ -0,0 +1,145 @@
+"""
+Resume Sections
+Split resume text into headed sections and compute mergeable per-section features
+"""
+
+import hashlib
+import re
+
+# Heading (any case, on a line of its own) -> section name
+SECTION_HEADINGS = {
+    'summary': 'summary', 'profile': 'summary', 'objective': 'summary', 'about me': 'summary',
+    'experience': 'experience', 'work experience': 'experience',
+    'professional experience': 'experience', 'employment': 'experience', 'work history': 'experience',
+    'education': 'education', 'academic background': 'education',
+    'skills': 'skills', 'technical skills': 'skills', 'core competencies': 'skills',
+    'projects': 'projects', 'personal projects': 'projects',
+    'certifications': 'certifications', 'certificates': 'certifications', 'courses': 'certifications',
+    'awards': 'awards', 'achievements': 'awards', 'publications': 'publications',
+    'interests': 'interests', 'hobbies': 'interests', 'hobbies and interests': 'interests',
+    'volunteering': 'volunteering', 'volunteer experience': 'volunteering',
+    'activities': 'activities', 'extracurricular activities': 'activities', 'references': 'references'
+}
+
+# Text before the first heading (name and contact details)
+HEADER = 'header'
+
+# Other headings: an all-caps line of one to four words, the first of at least
+# four letters ('LANGUAGES', 'OPEN SOURCE'; not 'AWS' in a skills list).
+# Title-case lines are not taken, as job titles and company names inside a
+# section look the same.
+GENERIC_HEADING = r'[A-Z][A-Z&/]{3,}(?:[ \t]+[A-Z&/]+){0,3}'
+
+
+def _heading_pattern(headings):
+    """
+    Regex matching a newline followed by a whole heading line: a known heading
+    in any case (group 1) or a generic one (group 2), with an optional trailing
+    colon. The literal newline prefix lets the regex engine skip straight to
+    line starts. Longer headings come first so 'work experience' wins over
+    'experience'.
+    """
+    alternatives = '|'.join(
+        r'[ \t]+'.join(re.escape(word) for word in heading.split())
+        for heading in sorted(headings, key=len, reverse=True)
+    )
+    return re.compile(
+        r'\n[^\S\n]*(?:(?i:(' + alternatives + r'))|(' + GENERIC_HEADING + r'))[^\S\n]*:?[^\S\n]*(?=\n|\Z)'
+    )
+
+
+HEADING_LINE = _heading_pattern(SECTION_HEADINGS)
+
+
+def segment(text):
+    """
+    [{'name', 'start', 'end'}] sections covering `text` exactly, found in one
+    pass over it. Each section starts at its heading line; text before the
+    first heading is the 'header' section. Generic headings are named by
+    their lowercased words ('OPEN SOURCE' -> 'open source') and only count
+    after the first known heading, since all-caps lines before it are usually
+    the candidate's name. Sections only break at line starts, so any match
+    that does not span a line lies within one section.
+    """
+    sections = []
+    name, start = HEADER, 0
+    # With a newline prepended, each match starts at its heading's offset in `text`
+    for match in HEADING_LINE.finditer('\n' + text):
+        known, generic = match.groups()
+        if known is None and name == HEADER:
+            continue
+        if match.start() > start:
+            sections.append({'name': name, 'start': start, 'end': match.start()})
+        name = SECTION_HEADINGS[' '.join(known.lower().split())] if known else ' '.join(generic.lower().split())
+        start = match.start()
+    if len(text) > start:
+        sections.append({'name': name, 'start': start, 'end': len(text)})
+    
+    # Number repeated section names ('experience', 'experience#2')
+    seen = {}
+    for section in sections:
+        seen[section['name']] = count = seen.get(section['name'], 0) + 1
+        if count > 1:
+            section['name'] = f"{section['name']}#{count}"
+    return sections
+
+
+def section_kind(name):
+    """Section name without the repeat number ('experience#2' -> 'experience')."""
+    return name.split('#', 1)[0]
+
+
+def section_text(text, sections, kinds):
+    """
+    Text of the sections whose kind is in `kinds`, sliced from `text` by the
+    stored offsets (no re-scan), joined in document order.
+    """
+    return ''.join(text[section['start']:section['end']] for section in sections if section_kind(section['name']) in kinds)
+
+
+def section_hash(text):
+    """Content hash identifying unchanged sections across revisions."""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+class SectionFeatures:
+    """
+    Lexicon and pattern hits of one section. Every feature is a set union or
+    a sum, so merging the features of all sections gives exactly the features
+    of the whole text and changed sections can be re-scored on their own.
+    """
+    
+    # Substrings checked by the scoring and feedback rules
+    TERMS = ('project', 'github', 'certification', 'certified')
+    
+    # Patterns checked by the scoring and feedback rules (on lowercased text)
+    PATTERNS = {
+        'quantified': re.compile(r'\d+%|\$\d+|increased|reduced|improved'),
+        'measurable': re.compile(r'\d+%|\d+\+'),
+        'impact': re.compile(r'\d+%|\d+ |increased|reduced'),
+        'links': re.compile(r'github|portfolio|project')
+    }
+    
+    WORD = re.compile(r'\b\w+\b')
+    
+    @classmethod
+    def compute(cls, text, skills, verbs):
+        """Features of one section given the skill and verb lexicons."""
+        text_lower = text.lower()
+        return {
+            'skills': sorted(skill for skill in skills if skill in text_lower),
+            'verbs': sorted(verb for verb in verbs if verb in text_lower),
+            'terms': [term for term in cls.TERMS if term in text_lower],
+            'patterns': [name for name, pattern in cls.PATTERNS.items() if pattern.search(text_lower)],
+            'words': len(cls.WORD.findall(text_lower))
+        }
+    
+    @staticmethod
+    def merge(features_list):
+        """Features of the concatenated sections."""
+        merged = {'skills': set(), 'verbs': set(), 'terms': set(), 'patterns': set(), 'words': 0}
+        for features in features_list:
+            for key in ('skills', 'verbs', 'terms', 'patterns'):
+                merged[key].update(features[key])
+            merged['words'] += features['words']
+        return merged
@@ -0,0 +1,60 @@
+"""
+Sampling Profiler
+Periodic stack samples of one thread, aggregated as flamegraph-ready collapsed stacks
+"""
+
+from collections import Counter
+from threading import Event, Thread
+import os
+import sys
+
+
+class SamplingProfiler:
+    """
+    Sample the stack of a target thread from a background thread.
+    Cost is paid only while running; the target thread is never interrupted.
+    """
+    
+    def __init__(self, thread_id, interval=0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = Event()
+        self._thread = None
+    
+    def start(self):
+        self._thread = Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        """Stop sampling and return the collapsed stack counts."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self.stacks
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                return
+            self.stacks[_collapse(frame)] += 1
+
+
+def _collapse(frame):
+    """Stack of frame as 'root;...;leaf' with one label per function."""
+    labels = []
+    while frame is not None:
+        code = frame.f_code
+        labels.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ';'.join(reversed(labels))
+
+
+def write_collapsed(stacks, path):
+    """Write stack counts in the collapsed format read by flamegraph.pl and speedscope."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        for stack, count in stacks.most_common():
+            f.write(f"{stack} {count}\n")
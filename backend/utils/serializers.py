@@ -0,0 +1,131 @@
+"""
+Document Serializers
+Precompiled conversions from raw MongoDB documents to API response dicts
+"""
+
+# Marks a field that must be present in the document (KeyError otherwise)
+REQUIRED = object()
+
+
+def field(name, default=REQUIRED, source=None):
+    """Output field `name` read from document key `source` (defaults to name)."""
+    return (name, source or name, default)
+
+
+class DocumentSerializer:
+    """
+    Convert raw documents to response dicts without building model objects.
+    The field list is compiled once into a single dict-building function, and
+    `projection` lists exactly the document keys it reads so queries can skip
+    everything else.
+    """
+    
+    def __init__(self, fields):
+        self.fields = tuple(fields)
+        self.projection = {source: 1 for _, source, _ in self.fields}
+        self._convert, self._convert_many = self._compile(self.fields)
+        self._subsets = {}
+    
+    def one(self, document):
+        """Serialize one document."""
+        return self._convert(document)
+    
+    def many(self, documents):
+        """Serialize an iterable of documents (e.g. a cursor)."""
+        return self._convert_many(documents)
+    
+    def subset(self, names):
+        """Serializer (cached) emitting only the named output fields."""
+        names = tuple(names)
+        serializer = self._subsets.get(names)
+        if serializer is None:
+            by_name = {spec[0]: spec for spec in self.fields}
+            unknown = [name for name in names if name not in by_name]
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+            serializer = self._subsets[names] = DocumentSerializer(by_name[name] for name in names)
+        return serializer
+    
+    @staticmethod
+    def _compile(fields):
+        """
+        Build `convert(doc)` returning one dict literal for all fields, and
+        `convert_many(docs)` inlining the same literal in a list comprehension.
+        """
+        namespace = {}
+        items = []
+        for position, (name, source, default) in enumerate(fields):
+            if default is REQUIRED:
+                items.append(f"{name!r}: doc[{source!r}]")
+            else:
+                namespace[f"_default{position}"] = default
+                items.append(f"{name!r}: doc.get({source!r}, _default{position})")
+        literal = "{" + ", ".join(items) + "}"
+        code = (
+            f"def convert(doc):\n    return {literal}\n"
+            f"def convert_many(docs):\n    return [{literal} for doc in docs]\n"
+        )
+        exec(compile(code, '<document serializer>', 'exec'), namespace)
+        return namespace['convert'], namespace['convert_many']
+
+
+job_serializer = DocumentSerializer([
+    field('id', source='_id'),
+    field('company'),
+    field('position'),
+    field('status'),
+    field('applied_date', None),
+    field('salary', ''),
+    field('location', ''),
+    field('job_type', 'Full-time'),
+    field('description', ''),
+    field('notes', '')
+])
+
+# Text search results carry their relevance score
+job_search_serializer = DocumentSerializer(job_serializer.fields + (field('score', None),))
+
+skill_serializer = DocumentSerializer([
+    field('id', source='_id'),
+    field('name'),
+    field('level'),
+    field('category', 'Technical'),
+    field('demand', 'Medium'),
+    field('trend', '+0%')
+])
+
+resume_summary_serializer = DocumentSerializer([
+    field('id', source='_id'),
+    field('filename'),
+    field('file_size', 0),
+    field('score', 0),
+    field('ats_score', 0),
+    field('uploaded_at', None)
+])
+
+resume_serializer = DocumentSerializer(resume_summary_serializer.fields + (
+    field('analysis', {}),
+    field('analyzer_version', None),
+    field('analysis_error', None),
+    field('revision_of', None),
+    field('delta', None)
+))
+
+user_serializer = DocumentSerializer([
+    field('id', source='_id'),
+    field('name'),
+    field('email')
+])
+
+activity_serializer = DocumentSerializer([
+    field('action'),
+    field('time'),
+    field('type')
+])
+
+profile_serializer = DocumentSerializer([
+    field(name, '') for name in (
+        'phone', 'location', 'title', 'bio', 'linkedin',
+        'github', 'website', 'experience', 'availability', 'expected_salary'
+    )
+])
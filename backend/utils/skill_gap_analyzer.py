@@ -3,6 +3,9 @@ Skill Gap Analysis - Rule-Based System
 NO ML/API - Pure heuristics and curated dictionaries
 """
 
+import hashlib
+import json
+
 class SkillGapAnalyzer:
     """Analyze skill gaps for career development."""
     
@@ -152,3 +155,9 @@ class SkillGapAnalyzer:
             {'key': key, 'title': key.replace('_', ' ').title()}
             for key in SkillGapAnalyzer.ROLE_REQUIREMENTS.keys()
         ]
+
+
+# Changes whenever the curated catalog is edited, so memoized analyses expire with it
+SkillGapAnalyzer.CATALOG_VERSION = hashlib.sha1(
+    json.dumps(SkillGapAnalyzer.ROLE_REQUIREMENTS, sort_keys=True).encode('utf-8')
+).hexdigest()[:12]